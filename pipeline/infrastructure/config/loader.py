@@ -21,6 +21,9 @@ from typing import Any, Dict, Optional
 import yaml
 from dotenv import load_dotenv
 
+# Environment variable reference inside config strings: ${VAR_NAME}
+_ENV_VAR_RE = re.compile(r'\$\{([A-Z_][A-Z0-9_]*)\}')
+
 
 class ConfigError(Exception):
     """Raised when configuration loading or validation fails."""
@@ -209,9 +212,6 @@ class ConfigLoader:
         Raises:
             ConfigError: If required environment variable is not set
         """
-        # Pattern: ${VAR_NAME}
-        pattern = re.compile(r'\$\{([A-Z_][A-Z0-9_]*)\}')
-
         def replacer(match):
             var_name = match.group(1)
             var_value = os.environ.get(var_name)
@@ -222,7 +222,7 @@ class ConfigLoader:
                 )
             return var_value
 
-        return pattern.sub(replacer, value)
+        return _ENV_VAR_RE.sub(replacer, value)
 
     def _validate(self, config: Dict[str, Any]) -> None:
         """
@@ -38,6 +38,7 @@ class StructuredLogger:
 
     Wraps Python's standard logging.Logger with structured logging capabilities.
     Supports binding context (restaurant, date) that persists across log calls.
+    Each record also carries the bare event name as ``record.event``.
     """
 
     def __init__(self, name: str, base_logger: Optional[logging.Logger] = None):
@@ -105,23 +106,23 @@ class StructuredLogger:
 
     def debug(self, event: str, **kwargs):
         """Log debug message."""
-        self._logger.debug(self._format_message(event, **kwargs))
+        self._logger.debug(self._format_message(event, **kwargs), extra={"event": event})
 
     def info(self, event: str, **kwargs):
         """Log info message."""
-        self._logger.info(self._format_message(event, **kwargs))
+        self._logger.info(self._format_message(event, **kwargs), extra={"event": event})
 
     def warning(self, event: str, **kwargs):
         """Log warning message."""
-        self._logger.warning(self._format_message(event, **kwargs))
+        self._logger.warning(self._format_message(event, **kwargs), extra={"event": event})
 
     def error(self, event: str, **kwargs):
         """Log error message."""
-        self._logger.error(self._format_message(event, **kwargs))
+        self._logger.error(self._format_message(event, **kwargs), extra={"event": event})
 
     def exception(self, event: str, **kwargs):
         """Log exception with traceback."""
-        self._logger.exception(self._format_message(event, **kwargs))
+        self._logger.exception(self._format_message(event, **kwargs), extra={"event": event})
 
 
 def setup_logging(level: str = "INFO", format_type: str = "simple") -> None:
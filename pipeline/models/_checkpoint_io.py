@@ -0,0 +1,51 @@
+"""
+Checkpoint file helpers shared by the stage result DTOs.
+
+Usage:
+    from pipeline.models._checkpoint_io import write_atomic
+
+    write_atomic(Path("state/checkpoint.json"), data)
+"""
+
+from pathlib import Path
+import os
+import tempfile
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Durably replace ``path`` with ``data``.
+
+    The bytes go to a uniquely named temp file in the same directory (safe
+    across threads and processes), are fsynced, then renamed over ``path``
+    with os.replace. Readers see either the old file or the complete new
+    one, never a partial write. The temp file is removed if any step fails.
+
+    Args:
+        path: Destination file (its parent directory must exist)
+        data: Complete file contents
+
+    Raises:
+        OSError: If the write, fsync or rename fails
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    # Persist the rename itself; directories can't be opened for fsync on Windows
+    if os.name == "posix":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
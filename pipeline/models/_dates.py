@@ -0,0 +1,39 @@
+"""
+Date validation helpers shared by the stage result DTOs.
+
+Usage:
+    from pipeline.models._dates import is_valid_date
+
+    is_valid_date("2024-01-15")  # True
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+import re
+
+
+# Shape check compiled once; strptime still confirms the calendar date
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+@lru_cache(maxsize=128)
+def _check_date(date_str: str) -> bool:
+    """Memoized YYYY-MM-DD check (the same business dates recur constantly)."""
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def is_valid_date(date_str: Any) -> bool:
+    """
+    Check that date_str is a real calendar date in YYYY-MM-DD format.
+
+    Non-strings (including unhashable values) are rejected before the
+    memoized check, so they return False instead of raising.
+    """
+    if not isinstance(date_str, str) or not _DATE_RE.fullmatch(date_str):
+        return False
+    return _check_date(date_str)
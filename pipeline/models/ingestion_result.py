@@ -34,6 +34,12 @@ from datetime import datetime
 from pathlib import Path
 import json
 
+try:
+    import orjson  # Optional: faster checkpoint (de)serialization
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+from pipeline.models._checkpoint_io import write_atomic
 from pipeline.services import Result, ValidationError
 
 
@@ -88,6 +94,7 @@ class IngestionResult:
         efficiency_metrics_path: Optional[str] = None,
         record_counts: Optional[Dict[str, int]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        ingestion_timestamp: Optional[str] = None,
     ) -> Result["IngestionResult"]:
         """
         Create and validate IngestionResult.
@@ -102,10 +109,14 @@ class IngestionResult:
             efficiency_metrics_path: Path to efficiency metrics (required for L3)
             record_counts: Record counts per entity
             metadata: Additional metadata
+            ingestion_timestamp: Ingestion timestamp (optional, defaults to now)
 
         Returns:
             Result[IngestionResult]: Success with DTO or failure with ValidationError
         """
+        if ingestion_timestamp is None:
+            ingestion_timestamp = datetime.utcnow().isoformat()
+
         dto = IngestionResult(
             restaurant_code=restaurant_code,
             business_date=business_date,
@@ -114,6 +125,7 @@ class IngestionResult:
             employee_data_path=employee_data_path,
             timeslots_path=timeslots_path,
             efficiency_metrics_path=efficiency_metrics_path,
+            ingestion_timestamp=ingestion_timestamp,
             record_counts=record_counts or {},
             metadata=metadata or {},
         )
@@ -244,6 +256,7 @@ class IngestionResult:
                 efficiency_metrics_path=checkpoint.get("efficiency_metrics_path"),
                 record_counts=checkpoint.get("record_counts", {}),
                 metadata=checkpoint.get("metadata", {}),
+                ingestion_timestamp=checkpoint.get("ingestion_timestamp"),
             )
         except KeyError as e:
             return Result.fail(
@@ -277,8 +290,15 @@ class IngestionResult:
             path.parent.mkdir(parents=True, exist_ok=True)
 
             checkpoint = self.to_checkpoint()
-            with open(path, "w") as f:
-                json.dump(checkpoint, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(
+                    checkpoint,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                data = json.dumps(checkpoint, indent=2).encode("utf-8")
+
+            write_atomic(path, data)
 
             return Result.ok(str(path))
         except Exception as e:
@@ -306,8 +326,11 @@ class IngestionResult:
         from pipeline.services import CheckpointError
 
         try:
-            with open(checkpoint_path, "r") as f:
-                checkpoint = json.load(f)
+            if orjson is not None:
+                checkpoint = orjson.loads(Path(checkpoint_path).read_bytes())
+            else:
+                with open(checkpoint_path, "r") as f:
+                    checkpoint = json.load(f)
 
             return IngestionResult.from_checkpoint(checkpoint)
         except FileNotFoundError:
@@ -317,7 +340,7 @@ class IngestionResult:
                     context={"checkpoint_path": checkpoint_path}
                 )
             )
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             return Result.fail(
                 CheckpointError(
                     message=f"Invalid checkpoint JSON: {e}",
@@ -36,6 +36,21 @@ from enum import Enum
 from pipeline.services import Result, ValidationError
 
 
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string (single seam for timestamps)."""
+    return datetime.utcnow().isoformat()
+
+
+def _ema(old: float, new: float, learning_rate: float) -> float:
+    """
+    Exponential moving average step used by pattern updates.
+
+    Kept as a standalone numeric kernel (no Pattern access) so it can be
+    tested directly and JIT-compiled later if profiling ever calls for it.
+    """
+    return (1 - learning_rate) * old + learning_rate * new
+
+
 class ServiceType(Enum):
     """Service type enumeration."""
     LOBBY = "Lobby"
@@ -84,10 +99,10 @@ class Pattern:
 
     # Timestamps
     last_updated: str = field(
-        default_factory=lambda: datetime.utcnow().isoformat()
+        default_factory=lambda: _now_iso()
     )
     created_at: str = field(
-        default_factory=lambda: datetime.utcnow().isoformat()
+        default_factory=lambda: _now_iso()
     )
 
     # Extensible metadata
@@ -128,9 +143,9 @@ class Pattern:
         """
         # Use provided timestamps or generate defaults
         if last_updated is None:
-            last_updated = datetime.utcnow().isoformat()
+            last_updated = _now_iso()
         if created_at is None:
-            created_at = datetime.utcnow().isoformat()
+            created_at = _now_iso()
 
         pattern = Pattern(
             restaurant_code=restaurant_code,
@@ -337,14 +352,8 @@ class Pattern:
         Returns:
             Pattern: New pattern with updated predictions
         """
-        updated_volume = (
-            (1 - learning_rate) * self.expected_volume +
-            learning_rate * new_volume
-        )
-        updated_staffing = (
-            (1 - learning_rate) * self.expected_staffing +
-            learning_rate * new_staffing
-        )
+        updated_volume = _ema(self.expected_volume, new_volume, learning_rate)
+        updated_staffing = _ema(self.expected_staffing, new_staffing, learning_rate)
 
         # Calculate new confidence (increases with more observations)
         # Confidence grows asymptotically towards 1.0
@@ -361,7 +370,7 @@ class Pattern:
             expected_staffing=updated_staffing,
             confidence=new_confidence,
             observations=new_observations,
-            last_updated=datetime.utcnow().isoformat(),
+            last_updated=_now_iso(),
             created_at=self.created_at,  # Preserve original creation time
             metadata=self.metadata,
         )
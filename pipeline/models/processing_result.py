@@ -29,11 +29,19 @@ Usage:
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from pathlib import Path
 import json
 
+try:
+    import orjson  # Optional: faster checkpoint (de)serialization
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+from pipeline.models._checkpoint_io import write_atomic
+from pipeline.models._dates import is_valid_date
 from pipeline.services import Result, ValidationError
 
 
@@ -91,6 +99,7 @@ class ProcessingResult:
         shift_summary: Optional[Dict[str, Any]] = None,
         pattern_updates: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        processing_timestamp: Optional[str] = None,
     ) -> Result["ProcessingResult"]:
         """
         Create and validate ProcessingResult.
@@ -106,10 +115,14 @@ class ProcessingResult:
             shift_summary: Shift breakdown summary
             pattern_updates: Pattern learning update summary
             metadata: Additional metadata
+            processing_timestamp: Processing timestamp (optional, defaults to now)
 
         Returns:
             Result[ProcessingResult]: Success with DTO or failure with ValidationError
         """
+        if processing_timestamp is None:
+            processing_timestamp = datetime.utcnow().isoformat()
+
         dto = ProcessingResult(
             restaurant_code=restaurant_code,
             business_date=business_date,
@@ -117,6 +130,7 @@ class ProcessingResult:
             shift_assignments_path=shift_assignments_path,
             pattern_updates_path=pattern_updates_path,
             aggregated_metrics_path=aggregated_metrics_path,
+            processing_timestamp=processing_timestamp,
             timeslot_count=timeslot_count,
             shift_summary=shift_summary or {},
             pattern_updates=pattern_updates or {},
@@ -179,13 +193,9 @@ class ProcessingResult:
 
         return Result.ok(self)
 
-    def to_checkpoint(self) -> Dict[str, Any]:
-        """
-        Serialize to checkpoint dictionary (JSON-serializable).
-
-        Returns:
-            Dict[str, Any]: Checkpoint data
-        """
+    @cached_property
+    def _checkpoint(self) -> Dict[str, Any]:
+        """Checkpoint dict, built once per (immutable) instance."""
         return {
             "restaurant_code": self.restaurant_code,
             "business_date": self.business_date,
@@ -200,6 +210,15 @@ class ProcessingResult:
             "metadata": self.metadata,
         }
 
+    def to_checkpoint(self) -> Dict[str, Any]:
+        """
+        Serialize to checkpoint dictionary (JSON-serializable).
+
+        Returns:
+            Dict[str, Any]: Checkpoint data (a fresh top-level copy per call)
+        """
+        return dict(self._checkpoint)
+
     @staticmethod
     def from_checkpoint(checkpoint: Dict[str, Any]) -> Result["ProcessingResult"]:
         """
@@ -223,6 +242,7 @@ class ProcessingResult:
                 shift_summary=checkpoint.get("shift_summary", {}),
                 pattern_updates=checkpoint.get("pattern_updates", {}),
                 metadata=checkpoint.get("metadata", {}),
+                processing_timestamp=checkpoint.get("processing_timestamp"),
             )
         except KeyError as e:
             return Result.fail(
@@ -256,8 +276,15 @@ class ProcessingResult:
             path.parent.mkdir(parents=True, exist_ok=True)
 
             checkpoint = self.to_checkpoint()
-            with open(path, "w") as f:
-                json.dump(checkpoint, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(
+                    checkpoint,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                data = json.dumps(checkpoint, indent=2).encode("utf-8")
+
+            write_atomic(path, data)
 
             return Result.ok(str(path))
         except Exception as e:
@@ -285,8 +312,11 @@ class ProcessingResult:
         from pipeline.services import CheckpointError
 
         try:
-            with open(checkpoint_path, "r") as f:
-                checkpoint = json.load(f)
+            if orjson is not None:
+                checkpoint = orjson.loads(Path(checkpoint_path).read_bytes())
+            else:
+                with open(checkpoint_path, "r") as f:
+                    checkpoint = json.load(f)
 
             return ProcessingResult.from_checkpoint(checkpoint)
         except FileNotFoundError:
@@ -296,7 +326,7 @@ class ProcessingResult:
                     context={"checkpoint_path": checkpoint_path}
                 )
             )
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             return Result.fail(
                 CheckpointError(
                     message=f"Invalid checkpoint JSON: {e}",
@@ -320,11 +350,7 @@ class ProcessingResult:
     @staticmethod
     def _is_valid_date(date_str: str) -> bool:
         """Validate date string is in YYYY-MM-DD format."""
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except (ValueError, TypeError):
-            return False
+        return is_valid_date(date_str)
 
     def __repr__(self) -> str:
         """Developer-friendly representation."""
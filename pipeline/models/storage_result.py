@@ -32,11 +32,66 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 from pathlib import Path
 import json
+import sys
 
+try:
+    import orjson  # Optional: faster checkpoint (de)serialization
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+from pipeline.models._checkpoint_io import write_atomic
+from pipeline.models._dates import is_valid_date
 from pipeline.services import Result, ValidationError
 
 
-@dataclass(frozen=True)
+# slots=True drops the per-instance __dict__ (dataclass support needs 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_REQUIRED = object()
+
+# (key, default) per checkpoint field, in create() keyword order; _REQUIRED
+# marks fields without a default. Walked once per load by from_checkpoint.
+_CHECKPOINT_SPEC = (
+    ("restaurant_code", _REQUIRED),
+    ("business_date", _REQUIRED),
+    ("tables_written", _REQUIRED),
+    ("row_counts", _REQUIRED),
+    ("transaction_id", None),
+    ("storage_timestamp", None),
+    ("success", True),
+    ("errors", None),
+    ("metadata", None),
+)
+
+
+def _intern_names(
+    restaurant_code: Any, tables_written: Any, row_counts: Any
+) -> tuple:
+    """
+    Intern restaurant code and table names so DTOs share one string object each.
+
+    Checkpoint loads produce fresh copies of the same few names; interning
+    dedupes them and turns key comparisons into pointer checks. sys.intern
+    rejects non-str values with TypeError, so a container holding anything
+    else is returned untouched for validate() to report - no separate type
+    scan first.
+    """
+    if isinstance(restaurant_code, str):
+        restaurant_code = sys.intern(restaurant_code)
+    if isinstance(tables_written, list):
+        try:
+            tables_written = [sys.intern(t) for t in tables_written]
+        except TypeError:
+            pass
+    if isinstance(row_counts, dict):
+        try:
+            row_counts = {sys.intern(k): v for k, v in row_counts.items()}
+        except TypeError:
+            pass
+    return restaurant_code, tables_written, row_counts
+
+
+@dataclass(frozen=True, **_SLOTS)
 class StorageResult:
     """
     Immutable DTO representing storage pipeline output.
@@ -84,6 +139,7 @@ class StorageResult:
         success: bool = True,
         errors: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        storage_timestamp: Optional[str] = None,
     ) -> Result["StorageResult"]:
         """
         Create and validate StorageResult.
@@ -97,23 +153,57 @@ class StorageResult:
             success: Whether all operations succeeded
             errors: List of error messages
             metadata: Additional metadata
+            storage_timestamp: Storage timestamp (optional, defaults to now)
 
         Returns:
             Result[StorageResult]: Success with DTO or failure with ValidationError
         """
-        dto = StorageResult(
+        dto = StorageResult._build(
             restaurant_code=restaurant_code,
             business_date=business_date,
             tables_written=tables_written,
             row_counts=row_counts,
             transaction_id=transaction_id,
             success=success,
-            errors=errors or [],
-            metadata=metadata or {},
+            errors=errors,
+            metadata=metadata,
+            storage_timestamp=storage_timestamp,
         )
 
         return dto.validate()
 
+    @staticmethod
+    def _build(
+        restaurant_code: str,
+        business_date: str,
+        tables_written: List[str],
+        row_counts: Dict[str, int],
+        transaction_id: Optional[str] = None,
+        success: bool = True,
+        errors: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        storage_timestamp: Optional[str] = None,
+    ) -> "StorageResult":
+        """Normalize defaults and construct the DTO without validating it."""
+        if storage_timestamp is None:
+            storage_timestamp = datetime.utcnow().isoformat()
+
+        restaurant_code, tables_written, row_counts = _intern_names(
+            restaurant_code, tables_written, row_counts
+        )
+
+        return StorageResult(
+            restaurant_code=restaurant_code,
+            business_date=business_date,
+            tables_written=tables_written,
+            row_counts=row_counts,
+            transaction_id=transaction_id,
+            storage_timestamp=storage_timestamp,
+            success=success,
+            errors=errors or [],
+            metadata=metadata or {},
+        )
+
     def validate(self) -> Result["StorageResult"]:
         """
         Validate DTO fields.
@@ -210,27 +300,31 @@ class StorageResult:
         }
 
     @staticmethod
-    def from_checkpoint(checkpoint: Dict[str, Any]) -> Result["StorageResult"]:
+    def from_checkpoint(
+        checkpoint: Dict[str, Any], *, validate: bool = True
+    ) -> Result["StorageResult"]:
         """
         Deserialize from checkpoint dictionary.
 
         Args:
             checkpoint: Checkpoint data
+            validate: Re-run field validation (default). Pass False only for
+                checkpoints this process wrote itself; required fields are
+                still enforced.
 
         Returns:
             Result[StorageResult]: Success with DTO or failure with ValidationError
         """
         try:
-            return StorageResult.create(
-                restaurant_code=checkpoint["restaurant_code"],
-                business_date=checkpoint["business_date"],
-                tables_written=checkpoint["tables_written"],
-                row_counts=checkpoint["row_counts"],
-                transaction_id=checkpoint.get("transaction_id"),
-                success=checkpoint.get("success", True),
-                errors=checkpoint.get("errors", []),
-                metadata=checkpoint.get("metadata", {}),
-            )
+            kwargs = {}
+            for key, default in _CHECKPOINT_SPEC:
+                value = checkpoint.get(key, default)
+                if value is _REQUIRED:
+                    raise KeyError(key)
+                kwargs[key] = value
+            if not validate:
+                return Result.ok(StorageResult._build(**kwargs))
+            return StorageResult.create(**kwargs)
         except KeyError as e:
             return Result.fail(
                 ValidationError(
@@ -263,8 +357,15 @@ class StorageResult:
             path.parent.mkdir(parents=True, exist_ok=True)
 
             checkpoint = self.to_checkpoint()
-            with open(path, "w") as f:
-                json.dump(checkpoint, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(
+                    checkpoint,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                data = json.dumps(checkpoint, indent=2).encode("utf-8")
+
+            write_atomic(path, data)
 
             return Result.ok(str(path))
         except Exception as e:
@@ -279,12 +380,15 @@ class StorageResult:
             )
 
     @staticmethod
-    def load_checkpoint(checkpoint_path: str) -> Result["StorageResult"]:
+    def load_checkpoint(
+        checkpoint_path: str, *, validate: bool = True
+    ) -> Result["StorageResult"]:
         """
         Load checkpoint from JSON file.
 
         Args:
             checkpoint_path: Path to checkpoint file
+            validate: Re-run field validation (see from_checkpoint)
 
         Returns:
             Result[StorageResult]: Success with DTO or failure with CheckpointError
@@ -292,10 +396,13 @@ class StorageResult:
         from pipeline.services import CheckpointError
 
         try:
-            with open(checkpoint_path, "r") as f:
-                checkpoint = json.load(f)
+            if orjson is not None:
+                checkpoint = orjson.loads(Path(checkpoint_path).read_bytes())
+            else:
+                with open(checkpoint_path, "r") as f:
+                    checkpoint = json.load(f)
 
-            return StorageResult.from_checkpoint(checkpoint)
+            return StorageResult.from_checkpoint(checkpoint, validate=validate)
         except FileNotFoundError:
             return Result.fail(
                 CheckpointError(
@@ -303,7 +410,7 @@ class StorageResult:
                     context={"checkpoint_path": checkpoint_path}
                 )
             )
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             return Result.fail(
                 CheckpointError(
                     message=f"Invalid checkpoint JSON: {e}",
@@ -327,25 +434,20 @@ class StorageResult:
     @staticmethod
     def _is_valid_date(date_str: str) -> bool:
         """Validate date string is in YYYY-MM-DD format."""
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except (ValueError, TypeError):
-            return False
+        return is_valid_date(date_str)
 
     def get_total_rows(self) -> int:
-        """Calculate total rows written across all tables."""
+        """Total rows written across all tables."""
         return sum(self.row_counts.values())
 
     def __repr__(self) -> str:
         """Developer-friendly representation."""
-        total_rows = self.get_total_rows()
         status = "SUCCESS" if self.success else "FAILED"
         return (
             f"StorageResult("
             f"restaurant={self.restaurant_code}, "
             f"date={self.business_date}, "
             f"tables={len(self.tables_written)}, "
-            f"rows={total_rows}, "
+            f"rows={self.get_total_rows()}, "
             f"status={status})"
         )
@@ -24,12 +24,21 @@ Usage:
         # Proceed to next stage
 """
 
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Mapping
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+import sys
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ (dataclass support needs 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Shared read-only stand-in for state/stage/metadata dicts not allocated yet
+_NO_ENTRIES: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(**_SLOTS)
 class PipelineContext:
     """
     Pipeline execution context.
@@ -39,6 +48,7 @@ class PipelineContext:
 
     Thread Safety: NOT thread-safe (use one context per pipeline execution)
     Immutability: Mutable (stages modify state as they execute)
+    Layout: Slotted on Python 3.10+ (no ad-hoc attributes; use set/get)
     """
 
     # ========================================================================
@@ -68,17 +78,14 @@ class PipelineContext:
     # ========================================================================
     # STATE STORAGE (Shared Between Stages)
     # ========================================================================
-    _state: Dict[str, Any] = field(default_factory=dict)
-    """Internal state storage (use get/set methods)"""
+    _state: Optional[Dict[str, Any]] = None
+    """Internal state storage (use get/set methods; allocated on first set)"""
 
-    _completed_stages: List[str] = field(default_factory=list)
-    """Stages that have completed successfully"""
+    _stages: Optional[Dict[str, float]] = None
+    """Completed stages in completion order -> duration in seconds (0.0 = untimed)"""
 
-    _stage_timings: Dict[str, float] = field(default_factory=dict)
-    """Execution time for each stage (seconds)"""
-
-    _metadata: Dict[str, Any] = field(default_factory=dict)
-    """Additional metadata (tags, notes, etc.)"""
+    _metadata: Optional[Dict[str, Any]] = None
+    """Additional metadata (tags, notes, etc.; allocated on first set)"""
 
     # ========================================================================
     # STATE MANAGEMENT METHODS
@@ -98,7 +105,7 @@ class PipelineContext:
         Example:
             ingestion_result = context.get("ingestion_result")
         """
-        return self._state.get(key, default)
+        return (self._state or _NO_ENTRIES).get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -111,6 +118,8 @@ class PipelineContext:
         Example:
             context.set("ingestion_result", result)
         """
+        if self._state is None:
+            self._state = {}
         self._state[key] = value
 
     def has(self, key: str) -> bool:
@@ -127,7 +136,7 @@ class PipelineContext:
             if context.has("ingestion_result"):
                 # Process ingestion result
         """
-        return key in self._state
+        return key in (self._state or _NO_ENTRIES)
 
     def get_all_state(self) -> Dict[str, Any]:
         """
@@ -136,7 +145,24 @@ class PipelineContext:
         Returns:
             Dictionary of all state keys and values
         """
-        return self._state.copy()
+        return self._state.copy() if self._state else {}
+
+    def state_view(self) -> Mapping[str, Any]:
+        """
+        Get a read-only, zero-copy view of pipeline state.
+
+        Prefer this over get_all_state() for read-only observers (logging,
+        key listings); the view reflects later set() calls.
+
+        Returns:
+            Read-only mapping of state keys and values
+
+        Example:
+            keys = list(context.state_view())
+        """
+        if self._state is None:
+            self._state = {}
+        return MappingProxyType(self._state)
 
     # ========================================================================
     # STAGE TRACKING METHODS
@@ -153,11 +179,11 @@ class PipelineContext:
         Example:
             context.mark_stage_complete("ingestion", duration_seconds=2.5)
         """
-        if stage_name not in self._completed_stages:
-            self._completed_stages.append(stage_name)
-
-        if duration_seconds > 0:
-            self._stage_timings[stage_name] = duration_seconds
+        # Re-marking keeps the stage's position; only a real duration overwrites
+        if self._stages is None:
+            self._stages = {}
+        if duration_seconds > 0 or stage_name not in self._stages:
+            self._stages[stage_name] = duration_seconds if duration_seconds > 0 else 0.0
 
     def is_stage_complete(self, stage_name: str) -> bool:
         """
@@ -173,7 +199,7 @@ class PipelineContext:
             if context.is_stage_complete("ingestion"):
                 # Proceed to processing
         """
-        return stage_name in self._completed_stages
+        return stage_name in (self._stages or _NO_ENTRIES)
 
     def get_completed_stages(self) -> List[str]:
         """
@@ -186,7 +212,7 @@ class PipelineContext:
             completed = context.get_completed_stages()
             # ["ingestion", "processing"]
         """
-        return self._completed_stages.copy()
+        return list(self._stages or _NO_ENTRIES)
 
     def get_stage_timing(self, stage_name: str) -> Optional[float]:
         """
@@ -202,7 +228,7 @@ class PipelineContext:
             duration = context.get_stage_timing("ingestion")
             print(f"Ingestion took {duration}s")
         """
-        return self._stage_timings.get(stage_name)
+        return (self._stages or _NO_ENTRIES).get(stage_name) or None
 
     def get_total_duration(self) -> float:
         """
@@ -215,7 +241,7 @@ class PipelineContext:
             total = context.get_total_duration()
             print(f"Pipeline took {total}s")
         """
-        return sum(self._stage_timings.values())
+        return sum((self._stages or _NO_ENTRIES).values())
 
     # ========================================================================
     # METADATA METHODS
@@ -235,6 +261,8 @@ class PipelineContext:
             context.set_metadata("source", "manual_trigger")
             context.set_metadata("user", "admin")
         """
+        if self._metadata is None:
+            self._metadata = {}
         self._metadata[key] = value
 
     def get_metadata(self, key: str, default: Any = None) -> Any:
@@ -248,11 +276,11 @@ class PipelineContext:
         Returns:
             Metadata value or default
         """
-        return self._metadata.get(key, default)
+        return (self._metadata or _NO_ENTRIES).get(key, default)
 
     def get_all_metadata(self) -> Dict[str, Any]:
         """Get all metadata (for logging/checkpointing)."""
-        return self._metadata.copy()
+        return self._metadata.copy() if self._metadata else {}
 
     # ========================================================================
     # CHECKPOINT SUPPORT
@@ -277,10 +305,12 @@ class PipelineContext:
             "pipeline_id": self.pipeline_id,
             "environment": self.environment,
             "dry_run": self.dry_run,
-            "state": self._state.copy(),
-            "completed_stages": self._completed_stages.copy(),
-            "stage_timings": self._stage_timings.copy(),
-            "metadata": self._metadata.copy(),
+            "state": self.get_all_state(),
+            "completed_stages": self.get_completed_stages(),
+            "stage_timings": {
+                name: t for name, t in (self._stages or _NO_ENTRIES).items() if t > 0
+            },
+            "metadata": self.get_all_metadata(),
             # Note: config not included (reload from YAML on resume)
         }
 
@@ -315,8 +345,8 @@ class PipelineContext:
 
         # Restore state
         context._state = checkpoint.get("state", {})
-        context._completed_stages = checkpoint.get("completed_stages", [])
-        context._stage_timings = checkpoint.get("stage_timings", {})
+        context._stages = dict.fromkeys(checkpoint.get("completed_stages", []), 0.0)
+        context._stages.update(checkpoint.get("stage_timings", {}))
         context._metadata = checkpoint.get("metadata", {})
 
         return context
@@ -325,9 +355,34 @@ class PipelineContext:
     # UTILITY METHODS
     # ========================================================================
 
+    def __copy__(self) -> "PipelineContext":
+        """
+        Copy with independent state/stage/metadata dicts.
+
+        Values are shared (shallow); config is shared. Lets callers branch a
+        prepared context without re-running set() for every key.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)  # keeps subclass type and any subclass fields
+        for f in fields(self):
+            setattr(clone, f.name, getattr(self, f.name))
+        clone._state = self._state.copy() if self._state else None
+        clone._stages = self._stages.copy() if self._stages else None
+        clone._metadata = self._metadata.copy() if self._metadata else None
+        return clone
+
+    def __getstate__(self) -> tuple:
+        """Pickle state as a flat tuple of field values in field order (subclass fields included)."""
+        return tuple(getattr(self, f.name) for f in fields(self))
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore from __getstate__ tuple."""
+        for f, value in zip(fields(self), state):
+            setattr(self, f.name, value)
+
     def __repr__(self) -> str:
         """String representation for debugging."""
-        stages = ", ".join(self._completed_stages) or "none"
+        stages = ", ".join(self._stages or _NO_ENTRIES) or "none"
         return (
             f"PipelineContext(restaurant={self.restaurant_code}, "
             f"date={self.date}, "
@@ -352,9 +407,9 @@ class PipelineContext:
             "date": self.date,
             "pipeline_id": self.pipeline_id,
             "environment": self.environment,
-            "completed_stages": self._completed_stages.copy(),
-            "stage_count": len(self._completed_stages),
+            "completed_stages": self.get_completed_stages(),
+            "stage_count": len(self._stages or _NO_ENTRIES),
             "total_duration": self.get_total_duration(),
-            "state_keys": list(self._state.keys()),
-            "metadata": self._metadata.copy(),
+            "state_keys": list(self._state or _NO_ENTRIES),
+            "metadata": self.get_all_metadata(),
         }
@@ -13,18 +13,28 @@ Key Features:
 - All operations return Result[T] for error handling
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional, Sequence
+
+import numpy as np
 
 from pipeline.services.result import Result
 from pipeline.models.labor_dto import LaborDTO
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ (dataclass support needs 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class LaborMetrics:
     """
     Calculated labor metrics with grading.
 
+    Immutable once calculated; slotted so batch scoring (many days x
+    restaurants) doesn't pay for a __dict__ per result.
+
     Attributes:
         total_hours: Total hours worked by all employees
         labor_cost: Total labor cost for the period
@@ -88,6 +98,56 @@ class LaborCalculator:
         (float('inf'), 'F')
     ]
 
+    # Status levels in threshold order; _status_codes indexes this
+    STATUS_LEVELS = ('EXCELLENT', 'GOOD', 'WARNING', 'CRITICAL', 'SEVERE')
+
+    # GRADE_BOUNDARIES as lookup tables for np.searchsorted (the open-ended
+    # F bucket is the index past the last cut)
+    _GRADE_CUTS = np.array([boundary for boundary, _ in GRADE_BOUNDARIES[:-1]])
+    _GRADE_LABELS = tuple(grade for _, grade in GRADE_BOUNDARIES)
+
+    # Warning per status (from V3 labor_processor.process): message template
+    # and the threshold it reports. EXCELLENT gets no warning.
+    _WARNING_TEMPLATES = {
+        'GOOD': ("NOTICE: Labor percentage ({percentage:.1f}%) exceeds target "
+                 "({threshold}%)", 'good'),
+        'WARNING': ("WARNING: Labor percentage ({percentage:.1f}%) exceeds warning threshold "
+                    "({threshold}%)", 'good'),
+        'CRITICAL': ("CRITICAL: Labor percentage ({percentage:.1f}%) exceeds critical threshold "
+                     "({threshold}%)", 'warning'),
+        'SEVERE': ("SEVERE: Labor percentage ({percentage:.1f}%) exceeds severe threshold "
+                   "({threshold}%)", 'critical'),
+    }
+
+    # Recommendations per status (from V3 labor_analyzer.analyze)
+    _RECOMMENDATIONS = {
+        'EXCELLENT': (
+            "Labor cost is excellent. Maintain current staffing levels.",
+            "Monitor for understaffing - ensure service quality remains high.",
+        ),
+        'GOOD': (
+            "Labor cost is within acceptable range.",
+            "Look for minor optimization opportunities in scheduling.",
+        ),
+        'WARNING': (
+            "Labor cost is elevated. Review staffing levels.",
+            "Analyze busy periods - ensure appropriate staffing distribution.",
+            "Consider cross-training to improve flexibility.",
+        ),
+        'CRITICAL': (
+            "URGENT: Labor cost is critically high.",
+            "Immediate action required: Review all shifts for overstaffing.",
+            "Verify no overtime or auto-clockout issues.",
+            "Compare to historical patterns to identify anomalies.",
+        ),
+        'SEVERE': (
+            "CRITICAL ALERT: Labor cost is severely elevated.",
+            "Emergency review required: Check for data errors or system issues.",
+            "Investigate potential causes: overtime, auto-clockout, payroll errors.",
+            "Management intervention required immediately.",
+        ),
+    }
+
     def __init__(self, config: Optional[dict] = None):
         """
         Initialize calculator with optional configuration.
@@ -106,6 +166,21 @@ class LaborCalculator:
             'severe': self.config.get('labor_severe_threshold', self.THRESHOLDS['severe']),
         }
 
+        # Upper bounds (inclusive) of every status level but SEVERE
+        self._status_cuts = np.array([
+            self.thresholds['excellent'],
+            self.thresholds['good'],
+            self.thresholds['warning'],
+            self.thresholds['critical'],
+        ], dtype=float)
+
+        # Both the status if-chain and the batch lookup assume ascending cuts
+        if not np.all(np.diff(self._status_cuts) >= 0):
+            raise ValueError(
+                "Labor thresholds must be ascending (excellent <= good <= warning <= critical), "
+                f"got {self.thresholds}"
+            )
+
     def calculate(self, labor_dto: LaborDTO, sales: float) -> Result[LaborMetrics]:
         """
         Calculate labor metrics with grading.
@@ -142,10 +217,10 @@ class LaborCalculator:
         grade = self._get_grade(labor_percentage)
 
         # Generate warnings (from V3 labor_processor.process)
-        warnings = self._generate_warnings(labor_percentage)
+        warnings = self._generate_warnings(labor_percentage, status)
 
         # Generate recommendations (from V3 labor_analyzer.analyze)
-        recommendations = self._generate_recommendations(labor_percentage, status)
+        recommendations = self._generate_recommendations(status)
 
         metrics = LaborMetrics(
             total_hours=labor_dto.total_hours_worked,
@@ -159,6 +234,70 @@ class LaborCalculator:
 
         return Result.ok(metrics)
 
+    def calculate_batch(
+        self,
+        labor_dtos: Sequence[LaborDTO],
+        sales: Sequence[float]
+    ) -> Result[List[LaborMetrics]]:
+        """
+        Calculate labor metrics for many periods at once (e.g. a date range).
+
+        Same rules as calculate(), but percentages, statuses and grades are
+        computed as array operations over all entries; LaborMetrics objects
+        are only built at the end.
+
+        Args:
+            labor_dtos: Labor data, one per period
+            sales: Total sales, aligned with labor_dtos
+
+        Returns:
+            Result[List[LaborMetrics]]: Metrics in input order, or the first
+            invalid entry's error
+
+        Errors:
+            ValueError: If lengths differ, or any entry fails calculate()'s checks
+        """
+        if len(labor_dtos) != len(sales):
+            return Result.fail(ValueError(
+                f"Got {len(labor_dtos)} labor records but {len(sales)} sales values"
+            ))
+
+        # Columns of the DTO fields the calculation needs
+        sales_array = np.asarray(sales, dtype=float)
+        costs = np.fromiter((dto.total_labor_cost for dto in labor_dtos), dtype=float, count=len(labor_dtos))
+        hours = np.fromiter((dto.total_hours_worked for dto in labor_dtos), dtype=float, count=len(labor_dtos))
+
+        # Validation (same checks and order as calculate)
+        for invalid, message in (
+            (sales_array <= 0, "Sales must be positive"),
+            (costs < 0, "Labor cost cannot be negative"),
+            (hours < 0, "Hours worked cannot be negative"),
+        ):
+            if invalid.any():
+                index = int(np.argmax(invalid))
+                return Result.fail(ValueError(f"{message} (entry {index})"))
+
+        percentages = costs / sales_array * 100
+        status_codes = self._status_codes(percentages)
+        grade_codes = self._grade_codes(percentages)
+
+        metrics = []
+        for dto, percentage, status_code, grade_code in zip(
+            labor_dtos, percentages.tolist(), status_codes.tolist(), grade_codes.tolist()
+        ):
+            status = self.STATUS_LEVELS[status_code]
+            metrics.append(LaborMetrics(
+                total_hours=dto.total_hours_worked,
+                labor_cost=dto.total_labor_cost,
+                labor_percentage=percentage,
+                status=status,
+                grade=self._GRADE_LABELS[grade_code],
+                warnings=self._generate_warnings(percentage, status),
+                recommendations=self._generate_recommendations(status)
+            ))
+
+        return Result.ok(metrics)
+
     def _get_status(self, percentage: float) -> str:
         """
         Map percentage to status level.
@@ -182,6 +321,16 @@ class LaborCalculator:
         else:
             return 'SEVERE'
 
+    def _status_codes(self, percentages: np.ndarray) -> np.ndarray:
+        """
+        Map an array of percentages to indexes into STATUS_LEVELS (batch path).
+
+        searchsorted(side='left') finds the first cut >= percentage, i.e. the
+        same "percentage <= threshold" buckets as _get_status; NaN sorts past
+        every cut and lands on SEVERE, as it falls through the if-chain.
+        """
+        return np.searchsorted(self._status_cuts, percentages, side='left')
+
     def _get_grade(self, percentage: float) -> str:
         """
         Convert percentage to letter grade.
@@ -197,93 +346,50 @@ class LaborCalculator:
         for boundary, grade in self.GRADE_BOUNDARIES:
             if percentage <= boundary:
                 return grade
-        return 'F'  # Fallback (should never reach here)
+        return 'F'  # NaN compares False against every boundary
+
+    def _grade_codes(self, percentages: np.ndarray) -> np.ndarray:
+        """Map an array of percentages to indexes into GRADE_BOUNDARIES (see _status_codes)."""
+        return np.searchsorted(self._GRADE_CUTS, percentages, side='left')
 
-    def _generate_warnings(self, percentage: float) -> list[str]:
+    def _generate_warnings(self, percentage: float, status: str) -> list[str]:
         """
         Generate warning messages based on percentage.
 
-        Ported from V3 labor_processor.process() warnings logic
+        Ported from V3 labor_processor.process() warnings logic. Warning
+        levels line up one-to-one with status levels, so the message is a
+        table lookup on the already-computed status.
 
         Args:
             percentage: Labor percentage
+            status: Current status level
 
         Returns:
             List of warning messages
         """
-        warnings = []
-
-        # Generate warnings based on thresholds
-        # Check from highest to lowest to ensure correct warning level
-        if percentage > self.thresholds['critical']:
-            # SEVERE: > 35%
-            warnings.append(
-                f"SEVERE: Labor percentage ({percentage:.1f}%) exceeds severe threshold "
-                f"({self.thresholds['critical']}%)"
-            )
-        elif percentage > self.thresholds['warning']:
-            # CRITICAL: 30.01-35%
-            warnings.append(
-                f"CRITICAL: Labor percentage ({percentage:.1f}%) exceeds critical threshold "
-                f"({self.thresholds['warning']}%)"
-            )
-        elif percentage > self.thresholds['good']:
-            # WARNING: 25.01-30%
-            warnings.append(
-                f"WARNING: Labor percentage ({percentage:.1f}%) exceeds warning threshold "
-                f"({self.thresholds['good']}%)"
-            )
-        elif percentage > self.thresholds['excellent']:
-            # GOOD: 20.01-25% gets NOTICE
-            warnings.append(
-                f"NOTICE: Labor percentage ({percentage:.1f}%) exceeds target "
-                f"({self.thresholds['good']}%)"
-            )
-        # EXCELLENT: ≤ 20% gets no warnings
+        template = self._WARNING_TEMPLATES.get(status)
+        if template is None or percentage != percentage:
+            # EXCELLENT: ≤ 20% gets no warnings. Neither does a NaN
+            # percentage, which exceeds no threshold even though it falls
+            # through to SEVERE.
+            return []
 
-        return warnings
+        message, threshold = template
+        return [message.format(percentage=percentage, threshold=self.thresholds[threshold])]
 
-    def _generate_recommendations(self, percentage: float, status: str) -> list[str]:
+    def _generate_recommendations(self, status: str) -> list[str]:
         """
         Generate actionable recommendations based on status.
 
         Ported from V3 labor_analyzer.analyze() recommendations logic
 
         Args:
-            percentage: Labor percentage
             status: Current status level
 
         Returns:
             List of recommendations
         """
-        recommendations = []
-
-        if status == 'EXCELLENT':
-            recommendations.append("Labor cost is excellent. Maintain current staffing levels.")
-            recommendations.append("Monitor for understaffing - ensure service quality remains high.")
-
-        elif status == 'GOOD':
-            recommendations.append("Labor cost is within acceptable range.")
-            recommendations.append("Look for minor optimization opportunities in scheduling.")
-
-        elif status == 'WARNING':
-            recommendations.append("Labor cost is elevated. Review staffing levels.")
-            recommendations.append("Analyze busy periods - ensure appropriate staffing distribution.")
-            recommendations.append("Consider cross-training to improve flexibility.")
-
-        elif status == 'CRITICAL':
-            recommendations.append("URGENT: Labor cost is critically high.")
-            recommendations.append("Immediate action required: Review all shifts for overstaffing.")
-            recommendations.append("Verify no overtime or auto-clockout issues.")
-            recommendations.append("Compare to historical patterns to identify anomalies.")
-
-        elif status == 'SEVERE':
-            recommendations.append("CRITICAL ALERT: Labor cost is severely elevated.")
-            recommendations.append("Emergency review required: Check for data errors or system issues.")
-            recommendations.append("Investigate potential causes: overtime, auto-clockout, payroll errors.")
-            recommendations.append("Management intervention required immediately.")
-
-        return recommendations
+        return list(self._RECOMMENDATIONS.get(status, ()))
 
     def calculate_target_hours(self, sales: float, target_percentage: float = 25.0) -> Result[float]:
         """
@@ -5,7 +5,9 @@ Implements V3's filter-based categorization logic using multiple data sources
 to determine the most likely service type for each order.
 """
 
-from typing import Dict, Optional, List
+import re
+from typing import Any, Callable, Dict, Optional, List, Tuple
+import numpy as np
 import pandas as pd
 
 from pipeline.services.result import Result
@@ -14,6 +16,63 @@ from pipeline.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Duration formats Toast emits besides plain minutes: "MM:SS" / "HH:MM:SS",
+# and "X minutes and Y seconds"
+_CLOCK_DURATION_RE = re.compile(
+    r'^(?:(?P<hours>\d+(?:\.\d+)?):)?(?P<minutes>\d+(?:\.\d+)?):(?P<seconds>\d+(?:\.\d+)?)$'
+)
+_MINUTES_RE = re.compile(r'(\d+)\s*minute', re.IGNORECASE)
+_SECONDS_RE = re.compile(r'(\d+)\s*second', re.IGNORECASE)
+
+# Category codes returned by _classify_orders index into this
+CATEGORY_LABELS = ('Lobby', 'Drive-Thru', 'ToGo')
+LOBBY, DRIVE_THRU, TOGO = 0, 1, 2
+
+
+def _classify_orders(
+    table_count: np.ndarray,
+    kitchen_duration: np.ndarray,
+    order_duration: np.ndarray,
+    drive_drawer: np.ndarray,
+    server_position: np.ndarray,
+    drive_position: np.ndarray,
+    lobby_table_threshold: float,
+    lobby_time_kitchen_min: float,
+    lobby_time_order_min: float,
+    drive_thru_time_kitchen_max: float,
+    drive_thru_time_order_max: float,
+) -> np.ndarray:
+    """
+    V3 filter cascade over per-order signal arrays -> uint8 category codes.
+
+    Kept as a standalone numeric kernel (plain arrays and thresholds, no
+    pandas or strings) so it can be JIT-compiled later without touching
+    the categorizer.
+    """
+    has_table = table_count >= 1
+    no_table = table_count == 0
+
+    # FILTER 1: LOBBY CHARACTERISTICS
+    lobby = (
+        (table_count >= lobby_table_threshold)
+        | (has_table & server_position)
+        | (has_table & (
+            (kitchen_duration > lobby_time_kitchen_min)
+            | (order_duration > lobby_time_order_min)
+        ))
+    )
+
+    # FILTER 2: DRIVE-THRU CHARACTERISTICS
+    drive_thru = (
+        drive_drawer
+        | drive_position
+        | (no_table & (kitchen_duration > 0) & (kitchen_duration < drive_thru_time_kitchen_max))
+        | (no_table & (order_duration > 0) & (order_duration < drive_thru_time_order_max))
+    )
+
+    # FILTER 3: TOGO (DEFAULT)
+    return np.select([lobby, drive_thru], [LOBBY, DRIVE_THRU], default=TOGO).astype(np.uint8)
+
 
 class OrderCategorizer:
     """
@@ -41,12 +100,13 @@ class OrderCategorizer:
         """
         config = config or {}
 
-        # Thresholds (matching V3)
-        self.lobby_table_threshold = config.get('lobby_table_threshold', 2)
-        self.lobby_time_kitchen_min = config.get('lobby_time_kitchen_min', 15)
-        self.lobby_time_order_min = config.get('lobby_time_order_min', 20)
-        self.drive_thru_time_kitchen_max = config.get('drive_thru_time_kitchen_max', 7)
-        self.drive_thru_time_order_max = config.get('drive_thru_time_order_max', 10)
+        # Thresholds (matching V3), coerced once so the array cascade compares
+        # against plain numbers even when config values arrive as strings
+        self.lobby_table_threshold = int(config.get('lobby_table_threshold', 2))
+        self.lobby_time_kitchen_min = float(config.get('lobby_time_kitchen_min', 15))
+        self.lobby_time_order_min = float(config.get('lobby_time_order_min', 20))
+        self.drive_thru_time_kitchen_max = float(config.get('drive_thru_time_kitchen_max', 7))
+        self.drive_thru_time_order_max = float(config.get('drive_thru_time_order_max', 10))
 
         logger.info("order_categorizer_initialized",
                     lobby_table_threshold=self.lobby_table_threshold,
@@ -80,9 +140,10 @@ class OrderCategorizer:
             Result[str]: 'Lobby', 'Drive-Thru', or 'ToGo' on success, error on failure
         """
         try:
-            # Collect signals from all data sources
-            signals = self._collect_signals(
-                check_number,
+            # Scalar path: one dict of signals and a plain if-chain, no frames
+            # or arrays built for a single check
+            signals = self._collect_order_signals(
+                str(check_number),
                 kitchen_df,
                 eod_df,
                 order_details_df,
@@ -90,7 +151,7 @@ class OrderCategorizer:
             )
 
             # Run filter cascade
-            category = self._apply_filter_cascade(signals)
+            category = self._classify_order(signals)
 
             logger.debug("order_categorized",
                         check_number=check_number,
@@ -139,33 +200,37 @@ class OrderCategorizer:
                 order_details_df['Order #'].isin(valid_checks)
             ]
 
-            categorizations = {}
             total_orders = len(fulfilled_orders)
 
             logger.info("categorization_started",
                        total_orders=total_orders,
                        valid_kitchen_checks=len(valid_checks))
 
-            # Categorize each order
-            for idx, order_row in fulfilled_orders.iterrows():
-                check_num = str(order_row['Order #'])
-
-                result = self.categorize_order(
-                    check_num,
-                    kitchen_df,
-                    eod_df,
-                    order_details_df,
-                    time_entries_df
-                )
-
-                if result.is_ok():
-                    categorizations[check_num] = result.unwrap()
-                else:
-                    # Log error but continue (graceful degradation)
+            # One signals row per distinct check, then the whole cascade as
+            # array expressions instead of a Python loop over orders
+            check_numbers = pd.Index(fulfilled_orders['Order #'].astype(str).unique())
+            signals = self._collect_signals(
+                check_numbers,
+                kitchen_df,
+                eod_df,
+                fulfilled_orders,
+                time_entries_df
+            )
+            # Iterating the Categorical yields the three shared label strings,
+            # not one new str per order
+            categories = self._apply_filter_cascade(signals)
+
+            # Rows whose source values could not be read: log and default to
+            # ToGo (graceful degradation) instead of failing the whole batch
+            failed = signals['parse_error'].notna().to_numpy()
+            if failed.any():
+                categories[failed] = CATEGORY_LABELS[TOGO]
+                for check_num, error in signals['parse_error'][failed].items():
                     logger.warning("order_categorization_failed",
                                  check_number=check_num,
-                                 error=str(result.unwrap_err()))
-                    categorizations[check_num] = "ToGo"  # Safe default
+                                 error=error)
+
+            categorizations = dict(zip(check_numbers, categories))
 
             # Log distribution
             distribution = self._calculate_distribution(categorizations)
@@ -186,27 +251,185 @@ class OrderCategorizer:
                 )
             )
 
+    @staticmethod
+    def _first_rows(
+        df: pd.DataFrame,
+        key_column: str,
+        check_numbers: pd.Index
+    ) -> pd.DataFrame:
+        """
+        Align df to check_numbers, taking the first row per check (as str).
+
+        Rows for other checks are dropped up front (a semijoin on the
+        check index), so only rows that can contribute are copied and
+        reindexed. Checks missing from df come back as all-NaN rows.
+        """
+        keys = df[key_column].astype(str)
+        keep = keys.isin(check_numbers) & ~keys.duplicated()
+        return df[keep].set_axis(keys[keep]).reindex(check_numbers)
+
+    @staticmethod
+    def _column(frame: pd.DataFrame, name: str) -> pd.Series:
+        """Return frame[name], or an all-None column if the source lacks it."""
+        if name in frame.columns:
+            return frame[name]
+        return pd.Series(None, index=frame.index, dtype=object)
+
+    @staticmethod
+    def _parse_per_value(
+        values: pd.Series,
+        parse: Callable[[Any], Any],
+        source: str
+    ) -> Tuple[pd.Series, pd.Series]:
+        """
+        Apply a scalar parser value by value, catching failures per row.
+
+        Returns (parsed, errors): parsed holds None where parse raised, and
+        errors holds "<source>: <message>" for those rows (None elsewhere).
+        """
+        parsed = pd.Series(None, index=values.index, dtype=object)
+        errors = pd.Series(None, index=values.index, dtype=object)
+        for label, value in values.items():
+            try:
+                parsed[label] = parse(value)
+            except Exception as e:
+                errors[label] = f"{source}: {e}"
+        return parsed, errors
+
+    def _has_table(self, frame: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        """
+        True where the source row has a table number > 0, plus per-row errors.
+
+        Values the column parse could not read are retried with _safe_float,
+        so a malformed cell fails only its own row.
+        """
+        values = self._column(frame, 'Table')
+        tables = self._safe_float_series(values)
+        errors = pd.Series(None, index=values.index, dtype=object)
+
+        unread = tables.isna().to_numpy() & values.notna().to_numpy()
+        if unread.any():
+            retried, retry_errors = self._parse_per_value(values[unread], self._safe_float, 'Table')
+            tables[unread] = retried.astype(float)
+            errors[unread] = retry_errors
+
+        return tables > 0, errors
+
+    def _durations(self, values: pd.Series, source: str) -> Tuple[pd.Series, pd.Series]:
+        """Parse a duration column, falling back to per-value parsing if the column parse fails."""
+        try:
+            return self._parse_duration_series(values), pd.Series(None, index=values.index, dtype=object)
+        except Exception:
+            parsed, errors = self._parse_per_value(values, self._parse_duration_string, source)
+            return parsed.astype(float).fillna(0.0), errors
+
+    def _text(self, values: pd.Series, source: str) -> Tuple[pd.Series, pd.Series]:
+        """Column as a str categorical ('' for missing), with per-row errors."""
+        values = values.fillna('')
+        try:
+            return values.astype(str).astype('category'), pd.Series(None, index=values.index, dtype=object)
+        except Exception:
+            parsed, errors = self._parse_per_value(values, str, source)
+            return parsed.fillna('').astype('category'), errors
+
     def _collect_signals(
         self,
-        check_number: str,
+        check_numbers: pd.Index,
         kitchen_df: pd.DataFrame,
         eod_df: pd.DataFrame,
         order_details_df: pd.DataFrame,
         time_entries_df: Optional[pd.DataFrame]
-    ) -> Dict:
+    ) -> pd.DataFrame:
         """
         Collect categorization signals from all data sources.
 
-        Returns dict with:
+        Returns a DataFrame indexed by check_numbers with columns:
         - has_table_kitchen: bool
         - has_table_eod: bool
         - has_table_order: bool
         - table_count: int
-        - cash_drawer: str
+        - cash_drawer: category
         - employee_position: str
         - kitchen_duration: float
         - order_duration: float
-        - server_name: str
+        - server_name: category
+        - parse_error: str for rows with a value that could not be read, else None
+        """
+        kitchen = self._first_rows(kitchen_df, 'Check #', check_numbers)
+        eod = self._first_rows(eod_df, 'Check #', check_numbers)
+        orders = self._first_rows(order_details_df, 'Order #', check_numbers)
+
+        signals = pd.DataFrame(index=check_numbers)
+        errors = []
+
+        # Table presence per source (missing rows have no table)
+        signals['has_table_kitchen'], kitchen_error = self._has_table(kitchen)
+        signals['has_table_eod'], eod_error = self._has_table(eod)
+        signals['has_table_order'], order_error = self._has_table(orders)
+        errors += [kitchen_error, eod_error, order_error]
+
+        # Durations - PARSE strings (e.g., "5 minutes and 39 seconds", "1:23")
+        signals['kitchen_duration'], error = self._durations(
+            self._column(kitchen, 'Fulfillment Time'), 'Fulfillment Time'
+        )
+        errors.append(error)
+        signals['order_duration'], error = self._durations(
+            self._column(orders, 'Duration (Opened to Paid)'), 'Duration (Opened to Paid)'
+        )
+        errors.append(error)
+
+        # Low-cardinality text as categoricals: per-row string work becomes
+        # per-category work plus an integer gather
+        signals['cash_drawer'], error = self._text(self._column(eod, 'Cash Drawer'), 'Cash Drawer')
+        errors.append(error)
+        signals['server_name'], error = self._text(self._column(kitchen, 'Server'), 'Server')
+        errors.append(error)
+
+        # Check employee position from TimeEntries, once per distinct server,
+        # against a name index built once for this batch
+        signals['employee_position'] = ''
+        if time_entries_df is not None and not time_entries_df.empty:
+            position_index = self._build_position_index(time_entries_df)
+            positions = {
+                name: self._lookup_employee_position(name, time_entries_df, position_index)
+                for name in signals['server_name'].cat.categories
+            }
+            signals['employee_position'] = signals['server_name'].map(positions).astype(str)
+
+        # Calculate table count
+        signals['table_count'] = (
+            signals['has_table_kitchen'].astype(int)
+            + signals['has_table_eod'].astype(int)
+            + signals['has_table_order'].astype(int)
+        )
+
+        # First error per row, None where every value was read
+        parse_error = errors[0]
+        for error in errors[1:]:
+            parse_error = parse_error.combine_first(error)
+        signals['parse_error'] = parse_error
+
+        return signals
+
+    @staticmethod
+    def _first_row(df: pd.DataFrame, key_column: str, check_number: str) -> Optional[pd.Series]:
+        """First row of df whose key_column (as str) equals check_number, or None."""
+        matches = np.flatnonzero(df[key_column].astype(str).to_numpy() == check_number)
+        return df.iloc[matches[0]] if len(matches) else None
+
+    def _collect_order_signals(
+        self,
+        check_number: str,
+        kitchen_df: pd.DataFrame,
+        eod_df: pd.DataFrame,
+        order_details_df: pd.DataFrame,
+        time_entries_df: Optional[pd.DataFrame]
+    ) -> Dict:
+        """
+        Scalar version of _collect_signals for one check.
+
+        Returns a dict with the same keys as the _collect_signals columns
+        (minus parse_error: a malformed value raises here instead).
         """
         signals = {
             'has_table_kitchen': False,
@@ -220,113 +443,127 @@ class OrderCategorizer:
             'server_name': ''
         }
 
-        # Normalize check_number to string for comparison
-        check_num_str = str(check_number)
-
-        # Check Kitchen for table and duration
-        kitchen_rows = kitchen_df[kitchen_df['Check #'].astype(str) == check_num_str]
-        if not kitchen_rows.empty:
-            table = self._safe_float(kitchen_rows.iloc[0].get('Table'))
-            if table and table > 0:
-                signals['has_table_kitchen'] = True
+        def text(value) -> str:
+            return '' if value is None or pd.isna(value) else str(value)
 
-            # Get fulfillment time - PARSE duration string (e.g., "5 minutes and 39 seconds")
-            duration = kitchen_rows.iloc[0].get('Fulfillment Time')
-            signals['kitchen_duration'] = self._parse_duration_string(duration)
-
-            # Get server name
-            signals['server_name'] = str(kitchen_rows.iloc[0].get('Server', ''))
+        # Check Kitchen for table, duration and server
+        kitchen_row = self._first_row(kitchen_df, 'Check #', check_number)
+        if kitchen_row is not None:
+            signals['has_table_kitchen'] = (self._safe_float(kitchen_row.get('Table')) or 0) > 0
+            signals['kitchen_duration'] = self._parse_duration_string(kitchen_row.get('Fulfillment Time'))
+            signals['server_name'] = text(kitchen_row.get('Server'))
 
         # Check EOD for table and cash drawer
-        eod_rows = eod_df[eod_df['Check #'].astype(str) == check_num_str]
-        if not eod_rows.empty:
-            table = self._safe_float(eod_rows.iloc[0].get('Table'))
-            if table and table > 0:
-                signals['has_table_eod'] = True
-
-            cash_drawer = eod_rows.iloc[0].get('Cash Drawer', '')
-            signals['cash_drawer'] = str(cash_drawer).lower().strip()
+        eod_row = self._first_row(eod_df, 'Check #', check_number)
+        if eod_row is not None:
+            signals['has_table_eod'] = (self._safe_float(eod_row.get('Table')) or 0) > 0
+            signals['cash_drawer'] = text(eod_row.get('Cash Drawer'))
 
         # Check OrderDetails for table and duration
-        order_rows = order_details_df[order_details_df['Order #'].astype(str) == check_num_str]
-        if not order_rows.empty:
-            table = self._safe_float(order_rows.iloc[0].get('Table'))
-            if table and table > 0:
-                signals['has_table_order'] = True
-
-            # Parse duration string (e.g., "2 minutes and 52 seconds" or "1:23")
-            duration_str = order_rows.iloc[0].get('Duration (Opened to Paid)')
-            signals['order_duration'] = self._parse_duration_string(duration_str)
+        order_row = self._first_row(order_details_df, 'Order #', check_number)
+        if order_row is not None:
+            signals['has_table_order'] = (self._safe_float(order_row.get('Table')) or 0) > 0
+            signals['order_duration'] = self._parse_duration_string(order_row.get('Duration (Opened to Paid)'))
 
         # Check employee position from TimeEntries
         if time_entries_df is not None and not time_entries_df.empty and signals['server_name']:
-            position = self._lookup_employee_position(
+            signals['employee_position'] = self._lookup_employee_position(
                 signals['server_name'],
                 time_entries_df
             )
-            signals['employee_position'] = position
 
-        # Calculate table count
-        signals['table_count'] = sum([
-            signals['has_table_kitchen'],
-            signals['has_table_eod'],
-            signals['has_table_order']
-        ])
+        signals['table_count'] = (
+            signals['has_table_kitchen'] + signals['has_table_eod'] + signals['has_table_order']
+        )
 
         return signals
 
-    def _apply_filter_cascade(self, signals: Dict) -> str:
+    def _classify_order(self, signals: Dict) -> str:
         """
-        Apply V3's filter cascade to categorize order.
+        Scalar twin of _classify_orders for one order's signals dict.
 
-        Filter 1: Lobby Detection
-        - Table in 2+ sources
-        - Table in 1+ source AND server position
-        - Table in 1+ source AND long duration
-
-        Filter 2: Drive-Thru Detection
-        - Cash drawer contains 'drive'
-        - Employee position contains 'drive'
-        - No table AND fast kitchen service (<7 min)
-        - No table AND fast order completion (<10 min)
-
-        Filter 3: ToGo (Default)
-        - Everything else
+        Same filter cascade as _apply_filter_cascade, as plain comparisons.
         """
         table_count = signals['table_count']
         kitchen_duration = signals['kitchen_duration']
         order_duration = signals['order_duration']
-        cash_drawer = signals['cash_drawer']
-        employee_position = signals['employee_position']
+        cash_drawer = signals['cash_drawer'].lower()
+        employee_position = signals['employee_position'].lower()
 
         # FILTER 1: LOBBY CHARACTERISTICS
         if table_count >= self.lobby_table_threshold:
-            return "Lobby"
+            return CATEGORY_LABELS[LOBBY]
 
-        if table_count >= 1 and employee_position and 'server' in employee_position:
-            return "Lobby"
+        if table_count >= 1 and 'server' in employee_position:
+            return CATEGORY_LABELS[LOBBY]
 
         if table_count >= 1 and (
             kitchen_duration > self.lobby_time_kitchen_min or
             order_duration > self.lobby_time_order_min
         ):
-            return "Lobby"
+            return CATEGORY_LABELS[LOBBY]
 
         # FILTER 2: DRIVE-THRU CHARACTERISTICS
-        if cash_drawer and ('drive box' in cash_drawer or 'drive' in cash_drawer):
-            return "Drive-Thru"
-
-        if employee_position and 'drive' in employee_position:
-            return "Drive-Thru"
+        if 'drive' in cash_drawer or 'drive' in employee_position:
+            return CATEGORY_LABELS[DRIVE_THRU]
 
-        if table_count == 0 and kitchen_duration > 0 and kitchen_duration < self.drive_thru_time_kitchen_max:
-            return "Drive-Thru"
+        if table_count == 0 and 0 < kitchen_duration < self.drive_thru_time_kitchen_max:
+            return CATEGORY_LABELS[DRIVE_THRU]
 
-        if table_count == 0 and order_duration > 0 and order_duration < self.drive_thru_time_order_max:
-            return "Drive-Thru"
+        if table_count == 0 and 0 < order_duration < self.drive_thru_time_order_max:
+            return CATEGORY_LABELS[DRIVE_THRU]
 
         # FILTER 3: TOGO (DEFAULT)
-        return "ToGo"
+        return CATEGORY_LABELS[TOGO]
+
+    def _apply_filter_cascade(self, signals: pd.DataFrame) -> pd.Categorical:
+        """
+        Apply V3's filter cascade to categorize every order in signals.
+
+        Filter 1: Lobby Detection
+        - Table in 2+ sources
+        - Table in 1+ source AND server position
+        - Table in 1+ source AND long duration
+
+        Filter 2: Drive-Thru Detection
+        - Cash drawer contains 'drive'
+        - Employee position contains 'drive'
+        - No table AND fast kitchen service (<7 min)
+        - No table AND fast order completion (<10 min)
+
+        Filter 3: ToGo (Default)
+        - Everything else
+
+        Returns:
+            Categorical of 'Lobby' / 'Drive-Thru' / 'ToGo' (uint8 codes),
+            aligned with signals rows
+        """
+        position = signals['employee_position'].astype('category')
+        codes = _classify_orders(
+            signals['table_count'].to_numpy(),
+            signals['kitchen_duration'].to_numpy(dtype=float),
+            signals['order_duration'].to_numpy(dtype=float),
+            self._contains(signals['cash_drawer'], 'drive'),
+            self._contains(position, 'server'),
+            self._contains(position, 'drive'),
+            self.lobby_table_threshold,
+            self.lobby_time_kitchen_min,
+            self.lobby_time_order_min,
+            self.drive_thru_time_kitchen_max,
+            self.drive_thru_time_order_max,
+        )
+        return pd.Categorical.from_codes(codes, categories=CATEGORY_LABELS)
+
+    @staticmethod
+    def _contains(values: pd.Series, needle: str) -> np.ndarray:
+        """
+        Case-insensitive ``values.str.contains(needle)`` for a categorical column.
+
+        The substring test runs once per category; rows pick up the result
+        through their integer codes. A trailing False absorbs code -1 (NaN).
+        """
+        matches = values.cat.categories.str.contains(needle, case=False, regex=False)
+        return np.append(np.asarray(matches, dtype=bool), False)[values.cat.codes.to_numpy()]
 
     def _safe_float(self, value) -> Optional[float]:
         """
@@ -349,6 +586,21 @@ class OrderCategorizer:
         except (ValueError, AttributeError):
             return None
 
+    def _safe_float_series(self, values: pd.Series) -> pd.Series:
+        """
+        Column version of _safe_float: float64, NaN wherever _safe_float gives None.
+
+        pd.to_numeric parses the whole column in C; invalid entries are
+        coerced to NaN instead of raising per value.
+        """
+        numbers = pd.to_numeric(values, errors='coerce')
+        if pd.api.types.is_complex_dtype(numbers):
+            # A complex cell turns the whole result complex (and misreads the
+            # other cells), so blank those cells and parse the rest again
+            values = values.map(lambda value: None if isinstance(value, complex) else value)
+            numbers = pd.to_numeric(values, errors='coerce')
+        return numbers.astype(float)
+
     def _parse_duration_string(self, duration_str) -> float:
         """
         Parse Toast duration strings to minutes.
@@ -360,17 +612,12 @@ class OrderCategorizer:
         - "15.5" (direct float) -> 15.5
         - None/NaN -> 0.0
         """
-        # Handle None first
-        if duration_str is None:
-            return 0.0
-
-        # Handle pandas NA/NaN (need to check before boolean operations)
-        try:
-            if pd.isna(duration_str):
-                return 0.0
-        except TypeError:
-            # pd.NA can cause TypeError in boolean context
+        # Missing values first, then plain numbers (the common case) - no
+        # string handling at all on these paths
+        if duration_str is None or duration_str is pd.NA:
             return 0.0
+        if isinstance(duration_str, (int, float)) and not isinstance(duration_str, bool):
+            return float(duration_str) if duration_str == duration_str else 0.0
 
         duration_str = str(duration_str).strip()
 
@@ -380,39 +627,87 @@ class OrderCategorizer:
 
         # Try direct float conversion first
         try:
-            return float(duration_str)
+            minutes = float(duration_str)
+            if minutes == minutes:
+                return minutes
         except ValueError:
             pass
 
         # Try HH:MM:SS or MM:SS format
-        if ':' in duration_str:
-            parts = duration_str.split(':')
-            try:
-                if len(parts) == 3:  # HH:MM:SS
-                    return float(parts[0]) * 60 + float(parts[1]) + float(parts[2]) / 60
-                elif len(parts) == 2:  # MM:SS
-                    return float(parts[0]) + float(parts[1]) / 60
-            except (ValueError, IndexError):
-                pass
+        clock = _CLOCK_DURATION_RE.match(duration_str)
+        if clock:
+            hours = float(clock['hours'] or 0)
+            return hours * 60 + float(clock['minutes']) + float(clock['seconds']) / 60
+
+        # Try "X minutes and Y seconds" format (0.0 when neither unit is present)
+        minutes_match = _MINUTES_RE.search(duration_str)
+        seconds_match = _SECONDS_RE.search(duration_str)
+        total_minutes = 0.0
+        if minutes_match:
+            total_minutes += float(minutes_match.group(1))
+        if seconds_match:
+            total_minutes += float(seconds_match.group(1)) / 60
+
+        return total_minutes
+
+    def _parse_duration_series(self, durations: pd.Series) -> pd.Series:
+        """
+        Parse a column of Toast durations to minutes (see _parse_duration_string).
 
-        # Try "X minutes and Y seconds" format
-        if 'minute' in duration_str.lower() or 'second' in duration_str.lower():
-            import re
-            minutes_match = re.search(r'(\d+)\s*minute', duration_str, re.IGNORECASE)
-            seconds_match = re.search(r'(\d+)\s*second', duration_str, re.IGNORECASE)
+        Each format is tried as one vectorized pass over the column, in the
+        same precedence as the scalar rules: direct float, then HH:MM:SS /
+        MM:SS, then "X minutes and Y seconds". Unparseable values are 0.0.
+        """
+        if pd.api.types.is_numeric_dtype(durations) and not pd.api.types.is_bool_dtype(durations):
+            return durations.astype(float).fillna(0.0)
 
-            total_minutes = 0.0
-            if minutes_match:
-                total_minutes += float(minutes_match.group(1))
-            if seconds_match:
-                total_minutes += float(seconds_match.group(1)) / 60
+        text = durations.astype(object).where(durations.notna(), '').astype(str).str.strip()
 
-            return total_minutes
+        # Try direct float conversion first
+        minutes = pd.to_numeric(text, errors='coerce').astype(float)
 
-        # Could not parse
-        return 0.0
+        # Try HH:MM:SS or MM:SS format
+        clock = text.str.extract(_CLOCK_DURATION_RE).astype(float)
+        clock_minutes = clock['hours'].fillna(0.0) * 60 + clock['minutes'] + clock['seconds'] / 60
 
-    def _lookup_employee_position(self, server_name: str, time_entries_df: pd.DataFrame) -> str:
+        # Try "X minutes and Y seconds" format (0.0 when neither unit is present)
+        spoken_minutes = (
+            text.str.extract(_MINUTES_RE)[0].astype(float).fillna(0.0)
+            + text.str.extract(_SECONDS_RE)[0].astype(float).fillna(0.0) / 60
+        )
+
+        return minutes.fillna(clock_minutes).fillna(spoken_minutes)
+
+    @staticmethod
+    def _build_position_index(time_entries_df: pd.DataFrame) -> Dict[str, str]:
+        """
+        Map lowercased employee names and name tokens -> lowercased job title.
+
+        "John Smith" is indexed under "john smith", "john" and "smith".
+        The first TimeEntries row wins when employees share a key.
+        """
+        employees = time_entries_df['Employee'].to_numpy()
+        job_titles = time_entries_df['Job Title'].to_numpy()
+
+        index: Dict[str, str] = {}
+        for employee, job_title in zip(employees, job_titles):
+            if not isinstance(employee, str):
+                continue
+
+            position = str(job_title).lower()
+            tokens = employee.replace(',', ' ').lower().split()
+            index.setdefault(' '.join(tokens), position)
+            for token in tokens:
+                index.setdefault(token, position)
+
+        return index
+
+    def _lookup_employee_position(
+        self,
+        server_name: str,
+        time_entries_df: pd.DataFrame,
+        position_index: Optional[Dict[str, str]] = None
+    ) -> str:
         """
         Look up employee position from TimeEntries by server name.
 
@@ -420,10 +715,18 @@ class OrderCategorizer:
         - "Smith, John" -> matches "John Smith"
         - "John Smith" -> matches "Smith, John"
         - Partial name matching
+
+        Whole names/tokens are resolved through the frame's position index;
+        only misses fall back to a substring scan of the Employee column.
+        Batch callers pass an index built once from time_entries_df; without
+        one it is built for this call.
         """
         if not server_name:
             return ''
 
+        if position_index is None:
+            position_index = self._build_position_index(time_entries_df)
+
         # Split name into parts
         name_parts = server_name.split(',') if ',' in server_name else server_name.split()
 
@@ -432,9 +735,13 @@ class OrderCategorizer:
             if not name_part:
                 continue
 
+            position = position_index.get(' '.join(name_part.lower().split()))
+            if position is not None:
+                return position
+
             # Search for partial name match
             employee_rows = time_entries_df[
-                time_entries_df['Employee'].str.contains(name_part, case=False, na=False)
+                time_entries_df['Employee'].str.contains(name_part, case=False, na=False, regex=False)
             ]
 
             if not employee_rows.empty:
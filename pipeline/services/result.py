@@ -188,6 +188,48 @@ class Result(Generic[T]):
             return cast(Exception, self._error)
         raise RuntimeError(f"Called unwrap_err() on Ok result: {self._value}")
 
+    def expect(self, msg: str) -> T:
+        """
+        Extract the success value or panic with a custom message.
+
+        Single-call replacement for ``is_ok()`` followed by ``unwrap()``.
+
+        Args:
+            msg: Message describing why the result was expected to be Ok
+
+        Returns:
+            The success value if Ok
+
+        Raises:
+            RuntimeError: If result is Err (message includes msg and the error)
+
+        Example:
+            dto = ProcessingResult.create(...).expect("create should succeed")
+        """
+        if self._is_ok:
+            return cast(T, self._value)
+        raise RuntimeError(f"{msg}: {self._error}")
+
+    def expect_err(self, msg: str) -> Exception:
+        """
+        Extract the error or panic with a custom message.
+
+        Args:
+            msg: Message describing why the result was expected to be Err
+
+        Returns:
+            The error if Err
+
+        Raises:
+            RuntimeError: If result is Ok (message includes msg and the value)
+
+        Example:
+            error = Pattern.create(hour=-1, ...).expect_err("hour must be rejected")
+        """
+        if not self._is_ok:
+            return cast(Exception, self._error)
+        raise RuntimeError(f"{msg}: {self._value}")
+
     def unwrap_or(self, default: T) -> T:
         """
         Extract value or return default.
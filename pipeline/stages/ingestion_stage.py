@@ -5,8 +5,9 @@ Loads and validates Toast POS CSV data, producing an IngestionResult DTO
 for downstream processing stages.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 import pandas as pd
 import time
 
@@ -241,38 +242,52 @@ class IngestionStage:
 
         return Result.ok(context)
 
-    def _find_file(self, source: DataSource, base_name: str, date: str) -> Result[str]:
+    def _load_file(
+        self,
+        source: DataSource,
+        base_name: str,
+        date: str,
+        available: Optional[Set[str]] = None
+    ) -> Tuple[Optional[str], Result[pd.DataFrame]]:
         """
-        Find a CSV file with flexible naming (with or without date suffix).
+        Load a CSV file with flexible naming (with or without date suffix).
 
         Toast exports can use different naming patterns:
         - TimeEntries.csv
         - TimeEntries_2025_10_20.csv
 
+        Each candidate is parsed at most once (the first successful load is
+        returned directly rather than re-read after an existence probe).
+
         Args:
-            source: Data source to search
+            source: Data source to load from
             base_name: Base filename (e.g., 'TimeEntries.csv')
             date: Date string (YYYY-MM-DD format)
+            available: Filenames the source lists, if known; the first
+                candidate present is loaded, so a file that exists but fails
+                to parse is reported as such rather than as missing
 
         Returns:
-            Result[str]: Found filename or error
+            Tuple of (filename, result): filename is the candidate that was
+            found (None if neither was), result the loaded DataFrame or error
         """
-        # Try exact match first
-        result = source.get_csv(base_name)
-        if result.is_ok():
-            return Result.ok(base_name)
-
-        # Try with date suffix (YYYY_MM_DD format)
+        # Try exact match first, then with date suffix (YYYY_MM_DD format)
         date_formatted = date.replace('-', '_')
         base_without_ext = base_name.replace('.csv', '')
         date_suffixed = f"{base_without_ext}_{date_formatted}.csv"
 
-        result = source.get_csv(date_suffixed)
-        if result.is_ok():
-            return Result.ok(date_suffixed)
+        for filename in (base_name, date_suffixed):
+            if available is not None:
+                if filename in available:
+                    return filename, source.get_csv(filename)
+                continue
+
+            result = source.get_csv(filename)
+            if result.is_ok():
+                return filename, result
 
         # Neither pattern found
-        return Result.fail(
+        return None, Result.fail(
             IngestionError(
                 f"Could not find file: tried '{base_name}' and '{date_suffixed}'",
                 context={'base_name': base_name, 'date': date}
@@ -283,6 +298,10 @@ class IngestionStage:
         """
         Load all required CSV files with flexible naming, plus optional files.
 
+        Files in each group are read concurrently (pandas releases the GIL
+        while parsing), so wall time approaches the slowest file rather than
+        the sum. Optional files are only read once every required file loaded.
+
         Implements graceful degradation:
         - Required files (Priority 1): Failure aborts pipeline
         - Optional files (Priority 2): Failure logged but pipeline continues
@@ -294,50 +313,43 @@ class IngestionStage:
         Returns:
             Result[Dict[str, pd.DataFrame]]: Loaded DataFrames or error
         """
-        dfs = {}
-
-        # Load required files (Priority 1) - must succeed
-        for data_type, base_filename in self.REQUIRED_FILES.items():
-            # Find the actual filename (handles date suffixes)
-            filename_result = self._find_file(source, base_filename, date)
-
-            if filename_result.is_err():
-                return Result.fail(
-                    IngestionError(
-                        f"Failed to find required file for {data_type}",
-                        context={'data_type': data_type, 'error': str(filename_result.unwrap_err())}
+        # One listing up front tells missing files apart from unreadable ones
+        listing = source.list_available()
+        available = set(listing.unwrap()) if listing.is_ok() else None
+
+        max_workers = max(len(self.REQUIRED_FILES), len(self.OPTIONAL_FILES))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def load_all(files: Dict[str, str]) -> Dict[str, Tuple[Optional[str], Result[pd.DataFrame]]]:
+                futures = {
+                    data_type: executor.submit(self._load_file, source, base_filename, date, available)
+                    for data_type, base_filename in files.items()
+                }
+                return {data_type: future.result() for data_type, future in futures.items()}
+
+            dfs = {}
+
+            # Required files (Priority 1) - must succeed; report the first failure
+            for data_type, (filename, result) in load_all(self.REQUIRED_FILES).items():
+                if result.is_err():
+                    if filename is None:
+                        message = f"Failed to find required file for {data_type}"
+                    else:
+                        message = f"Failed to load required file: {filename}"
+                    return Result.fail(
+                        IngestionError(
+                            message,
+                            context={'data_type': data_type, 'error': str(result.unwrap_err())}
+                        )
                     )
-                )
-
-            actual_filename = filename_result.unwrap()
 
-            # Load the file
-            result = source.get_csv(actual_filename)
-
-            if result.is_err():
-                return Result.fail(
-                    IngestionError(
-                        f"Failed to load required file: {actual_filename}",
-                        context={'data_type': data_type, 'error': str(result.unwrap_err())}
-                    )
-                )
-
-            dfs[data_type] = result.unwrap()
-
-        # Load optional files (Priority 2) - graceful degradation
-        for data_type, base_filename in self.OPTIONAL_FILES.items():
-            filename_result = self._find_file(source, base_filename, date)
-
-            if filename_result.is_err():
-                # Optional file not found - skip silently
-                continue
-
-            actual_filename = filename_result.unwrap()
-            result = source.get_csv(actual_filename)
-
-            if result.is_ok():
                 dfs[data_type] = result.unwrap()
-            # If loading fails, skip silently (graceful degradation)
+
+            # Optional files (Priority 2) - graceful degradation
+            for data_type, (_, result) in load_all(self.OPTIONAL_FILES).items():
+                if result.is_ok():
+                    dfs[data_type] = result.unwrap()
+                # Missing or unreadable optional file - skip silently
 
         return Result.ok(dfs)
 
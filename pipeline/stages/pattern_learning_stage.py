@@ -21,6 +21,7 @@ Architecture Note:
     Week 7 Day 1: Extended to learn timeslot patterns using TimeslotPatternManager
 """
 
+from functools import lru_cache
 from typing import Optional, List
 from datetime import datetime
 import time
@@ -37,6 +38,12 @@ from pipeline.infrastructure.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _parse_business_date(date: str) -> datetime:
+    """Parse a YYYY-MM-DD business date once; raises ValueError if malformed."""
+    return datetime.strptime(date, "%Y-%m-%d")
+
+
 class PatternLearningStage:
     """
     Pipeline stage for learning daily labor and timeslot performance patterns.
@@ -177,7 +184,7 @@ class PatternLearningStage:
         """
         # Parse date to extract day_of_week
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = _parse_business_date(date)
             day_of_week = date_obj.weekday()  # 0=Monday, 6=Sunday
         except ValueError as e:
             from pipeline.services import PatternError
@@ -219,7 +226,7 @@ class PatternLearningStage:
         """
         # Parse date to extract day_of_week name
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = _parse_business_date(date)
             day_of_week = date_obj.strftime("%A")  # "Monday", "Tuesday", etc.
         except ValueError:
             logger.warning("timeslot_pattern_learning_skipped",
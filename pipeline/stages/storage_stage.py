@@ -71,7 +71,7 @@ class StorageStage:
             return Result.fail(
                 StorageError(
                     "Missing required context key: 'ingestion_result'",
-                    context={'available_keys': list(context._state.keys())}
+                    context={'available_keys': list(context.state_view())}
                 )
             )
 
@@ -19,10 +19,15 @@ setup(
         "pandas>=2.1.4",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.10",
+        ],
         "dev": [
             "pytest>=7.4.3",
             "pytest-cov>=4.1.0",
             "pytest-mock>=3.12.0",
+            "pytest-xdist>=3.5.0",
+            "pytest-randomly>=3.15.0",
             "mypy>=1.7.1",
             "black>=23.12.0",
             "flake8>=6.1.0",
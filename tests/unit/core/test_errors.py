@@ -59,6 +59,24 @@ class TestOMNIError:
         assert "restaurant=SDR" in str(error)
         assert "date=2024-01-15" in str(error)
 
+    def test_message_fixed_at_construction(self):
+        """Test str(error) and args do not change if context is mutated after raising."""
+        context = {"restaurant": "SDR"}
+
+        with pytest.raises(OMNIError) as excinfo:
+            raise OMNIError("Operation failed", context=context)
+        context["date"] = "2024-01-15"
+
+        assert str(excinfo.value) == "Operation failed [restaurant=SDR]"
+        assert excinfo.value.args == ("Operation failed [restaurant=SDR]",)
+
+    def test_message_is_plain_attribute(self):
+        """Test message/context are stored once, not recomputed per access."""
+        error = ValidationError("Invalid value", context={"field": "hour"})
+
+        assert vars(error) == {"message": "Invalid value", "context": {"field": "hour"}}
+        assert not hasattr(ValidationError, "message")
+
     def test_error_repr(self):
         """Test error repr for debugging."""
         error = OMNIError("Test", context={"key": "value"})
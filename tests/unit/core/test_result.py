@@ -105,6 +105,32 @@ class TestUnwrap:
         assert isinstance(unwrapped_error, ValueError)
 
 
+class TestExpect:
+    """Test expect() and expect_err() methods."""
+
+    def test_expect_ok_result(self):
+        """Test expect on Ok result returns value."""
+        assert Result.ok(42).expect("should be ok") == 42
+
+    def test_expect_err_result_raises_with_message(self):
+        """Test expect on Err result raises with custom message and error."""
+        result = Result.fail(ValueError("Oops"))
+
+        with pytest.raises(RuntimeError, match="should be ok: Oops"):
+            result.expect("should be ok")
+
+    def test_expect_err_err_result(self):
+        """Test expect_err on Err result returns error."""
+        error = ValueError("Something bad")
+
+        assert Result.fail(error).expect_err("should fail") is error
+
+    def test_expect_err_ok_result_raises_with_message(self):
+        """Test expect_err on Ok result raises with custom message and value."""
+        with pytest.raises(RuntimeError, match="should fail: 42"):
+            Result.ok(42).expect_err("should fail")
+
+
 class TestUnwrapOr:
     """Test unwrap_or() and unwrap_or_else() methods."""
 
@@ -0,0 +1,38 @@
+"""
+Shared fixtures for model (DTO) unit tests.
+"""
+
+import pytest
+
+from pipeline.models.processing_result import ProcessingResult
+
+
+def pytest_collection_modifyitems(config, items):
+    """Translate coverage_skip into pytest-cov's no_cover while coverage is on."""
+    cov_active = (
+        config.pluginmanager.hasplugin("_cov")
+        and config.getoption("cov_source", default=None)
+        and not config.getoption("no_cov", default=False)
+    )
+    if not cov_active:
+        return  # pytest-cov's no_cover hook breaks under --no-cov
+    for item in items:
+        if item.get_closest_marker("coverage_skip"):
+            item.add_marker(pytest.mark.no_cover)
+
+
+@pytest.fixture(scope="module")
+def basic_dto():
+    """Basic ProcessingResult with required fields only (built once per module)."""
+    return ProcessingResult.create(
+        restaurant_code="SDR",
+        business_date="2024-01-15",
+        graded_timeslots_path="/data/graded.parquet",
+        shift_assignments_path="/data/shifts.parquet"
+    ).unwrap()
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path_factory):
+    """Fresh checkpoint directory under the session's pytest temp root."""
+    return tmp_path_factory.mktemp("ckpt")
@@ -0,0 +1,85 @@
+"""
+Unit tests for the shared checkpoint file helpers
+
+Tests:
+- Atomic replace of existing files
+- fsync before rename
+- Temp file cleanup on failure
+- Unique temp names for concurrent writers
+"""
+
+import os
+import threading
+
+import pytest
+
+from pipeline.models._checkpoint_io import write_atomic
+
+
+class TestWriteAtomic:
+    """Test write_atomic durability and cleanup."""
+
+    def test_replaces_existing_file(self, tmp_path):
+        """Test the destination ends up with exactly the new bytes."""
+        path = tmp_path / "checkpoint.json"
+        path.write_text("previous")
+
+        write_atomic(path, b'{"ok": true}')
+
+        assert path.read_bytes() == b'{"ok": true}'
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_fsyncs_before_replace(self, tmp_path, monkeypatch):
+        """Test the temp file is flushed to disk before it is renamed."""
+        calls = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd):
+            calls.append("fsync")
+            real_fsync(fd)
+
+        def replace(src, dst):
+            calls.append("replace")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        monkeypatch.setattr(os, "replace", replace)
+
+        write_atomic(tmp_path / "checkpoint.json", b"{}")
+
+        assert calls.index("fsync") < calls.index("replace")
+
+    def test_failure_keeps_old_file_and_removes_temp(self, tmp_path, monkeypatch):
+        """Test a failed rename leaves the previous file and no temp file."""
+        path = tmp_path / "checkpoint.json"
+        path.write_text("previous")
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", failing_replace)
+
+        with pytest.raises(OSError, match="disk full"):
+            write_atomic(path, b"{}")
+
+        assert path.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_concurrent_writers_use_distinct_temp_files(self, tmp_path):
+        """Test threads in one process never clobber each other's temp file."""
+        path = tmp_path / "checkpoint.json"
+        payloads = [str(i).encode() * 10_000 for i in range(8)]
+        barrier = threading.Barrier(len(payloads))
+
+        def writer(data):
+            barrier.wait()
+            write_atomic(path, data)
+
+        threads = [threading.Thread(target=writer, args=(data,)) for data in payloads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert path.read_bytes() in payloads
+        assert list(tmp_path.iterdir()) == [path]
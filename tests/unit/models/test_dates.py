@@ -0,0 +1,34 @@
+"""
+Unit tests for the shared date validation helper
+
+Tests:
+- Valid calendar dates
+- Wrong shape and impossible dates
+- Non-string input
+"""
+
+import pytest
+
+from pipeline.models._dates import is_valid_date
+
+
+class TestIsValidDate:
+    """Test is_valid_date accepts only real YYYY-MM-DD dates."""
+
+    def test_valid_date(self):
+        """Test a well-formed calendar date passes."""
+        assert is_valid_date("2024-01-15")
+        assert is_valid_date("2024-02-29")  # leap day
+
+    @pytest.mark.parametrize(
+        "date_str",
+        ["2024/01/15", "15-01-2024", "2024-1-15", "2024-01-15T00:00:00", "", "2023-02-29", "2024-13-01"],
+    )
+    def test_invalid_date(self, date_str):
+        """Test malformed or impossible dates fail."""
+        assert not is_valid_date(date_str)
+
+    @pytest.mark.parametrize("value", [None, 20240115, ["2024-01-15"]])
+    def test_non_string_rejected(self, value):
+        """Test non-strings (including unhashable ones) return False."""
+        assert not is_valid_date(value)
@@ -418,6 +418,7 @@ class TestCheckpointFileIO:
             dto = result.unwrap()
             assert dto.restaurant_code == "T12"
             assert dto.business_date == "2024-01-15"
+            assert dto.ingestion_timestamp == "2024-01-15T10:00:00"
 
     def test_load_checkpoint_file_not_found(self):
         """Test loading non-existent checkpoint fails."""
@@ -476,6 +477,25 @@ class TestCheckpointFileIO:
             assert restored.record_counts["toast_records"] == 500
             assert restored.metadata["operator"] == "system"
 
+    def test_roundtrip_file_io_stdlib_json(self, tmp_path, monkeypatch):
+        """Test save/load still works through the stdlib json fallback."""
+        import pipeline.models.ingestion_result as module
+
+        monkeypatch.setattr(module, "orjson", None)
+        original = IngestionResult.create(
+            restaurant_code="SDR",
+            business_date="2024-01-15",
+            quality_level=1,
+            toast_data_path="/data/toast.parquet",
+            record_counts={"toast_records": 100}
+        ).unwrap()
+        checkpoint_path = tmp_path / "checkpoint.json"
+
+        assert original.save_checkpoint(str(checkpoint_path)).is_ok()
+        restored = IngestionResult.load_checkpoint(str(checkpoint_path)).unwrap()
+
+        assert restored == original
+
 
 class TestIngestionResultHelpers:
     """Test helper methods."""
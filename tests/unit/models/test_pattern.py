@@ -12,86 +12,128 @@ Tests:
 - Pattern updates with exponential moving average
 """
 
+import re
+
 import pytest
+from dataclasses import replace
 from datetime import datetime
 
-from pipeline.models.pattern import Pattern
+import pipeline.models.pattern as pattern_module
+from pipeline.models.pattern import Pattern, _ema
 from pipeline.services import ValidationError
 
+pytestmark = pytest.mark.unit
+
+BASE_KWARGS = dict(
+    restaurant_code="SDR",
+    service_type="Lobby",
+    hour=12,
+    day_of_week=1,
+    expected_volume=85.5,
+    expected_staffing=3.2,
+    confidence=0.75,
+    observations=120,
+)
+
+# Starting point for the exponential-moving-average update tests
+UPDATE_KWARGS = {
+    **BASE_KWARGS,
+    "expected_volume": 80.0,
+    "expected_staffing": 3.0,
+    "confidence": 0.70,
+    "observations": 100,
+}
+
+_REPR_RE = re.compile(
+    r"^Pattern\(restaurant=SDR, service=Lobby, hour=12, dow=1, "
+    r"vol=85\.5, staff=3\.2, conf=0\.75, obs=120\)$"
+)
+
+FROZEN_NOW = "2024-01-01T00:00:00"
+_real_now_iso = pattern_module._now_iso
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _freeze_clock():
+    """Pin Pattern timestamps to a constant for every test in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pattern_module, "_now_iso", lambda: FROZEN_NOW)
+        yield
+
+
+@pytest.fixture(scope="module")
+def baseline_pattern():
+    """
+    Validated SDR/Lobby pattern shared across the module.
+
+    Tests derive variants with dataclasses.replace(), which skips validation;
+    tests that exercise the constructor itself must keep using Pattern.create.
+    """
+    return Pattern.create(**BASE_KWARGS).unwrap()
+
+
+@pytest.fixture(scope="module")
+def src_pattern():
+    """Pattern shared by the serialization round-trip tests."""
+    return Pattern.create(
+        restaurant_code="TK9",
+        service_type="ToGo",
+        hour=7,
+        day_of_week=3,
+        expected_volume=42.5,
+        expected_staffing=2.0,
+        confidence=0.68,
+        observations=75,
+        metadata={"shift": "morning"}
+    ).unwrap()
+
+
+@pytest.fixture(scope="module")
+def src_dict(src_pattern):
+    """Serialized form of src_pattern (built once per module)."""
+    return src_pattern.to_dict()
+
 
 class TestPatternCreation:
     """Test Pattern creation and validation."""
 
-    def test_create_basic_pattern(self):
-        """Test creating basic traffic pattern."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        )
-
-        assert result.is_ok()
-        pattern = result.unwrap()
-        assert pattern.restaurant_code == "SDR"
-        assert pattern.service_type == "Lobby"
-        assert pattern.hour == 12
-        assert pattern.day_of_week == 1
-        assert pattern.expected_volume == 85.5
-        assert pattern.expected_staffing == 3.2
-        assert pattern.confidence == 0.75
-        assert pattern.observations == 120
-
-    def test_create_drive_thru_pattern(self):
-        """Test creating Drive-Thru pattern."""
-        result = Pattern.create(
-            restaurant_code="T12",
-            service_type="Drive-Thru",
-            hour=18,
-            day_of_week=5,
-            expected_volume=150.0,
-            expected_staffing=5.5,
-            confidence=0.85,
-            observations=200
-        )
-
-        assert result.is_ok()
-        pattern = result.unwrap()
-        assert pattern.service_type == "Drive-Thru"
-        assert pattern.expected_volume == 150.0
-
-    def test_create_togo_pattern(self):
-        """Test creating ToGo pattern."""
+    @pytest.mark.parametrize(
+        "code,svc,hour,dow,vol,staff,conf,obs",
+        [
+            ("SDR", "Lobby", 12, 1, 85.5, 3.2, 0.75, 120),
+            ("T12", "Drive-Thru", 18, 5, 150.0, 5.5, 0.85, 200),
+            ("TK9", "ToGo", 7, 0, 25.0, 1.5, 0.60, 50),
+        ],
+        ids=["lobby", "drive_thru", "togo"],
+    )
+    def test_create_service_types(self, code, svc, hour, dow, vol, staff, conf, obs):
+        """Test creating a pattern for each supported service type."""
         result = Pattern.create(
-            restaurant_code="TK9",
-            service_type="ToGo",
-            hour=7,
-            day_of_week=0,
-            expected_volume=25.0,
-            expected_staffing=1.5,
-            confidence=0.60,
-            observations=50
+            restaurant_code=code,
+            service_type=svc,
+            hour=hour,
+            day_of_week=dow,
+            expected_volume=vol,
+            expected_staffing=staff,
+            confidence=conf,
+            observations=obs
         )
 
         assert result.is_ok()
         pattern = result.unwrap()
-        assert pattern.service_type == "ToGo"
+        assert pattern.restaurant_code == code
+        assert pattern.service_type == svc
+        assert pattern.hour == hour
+        assert pattern.day_of_week == dow
+        assert pattern.expected_volume == vol
+        assert pattern.expected_staffing == staff
+        assert pattern.confidence == conf
+        assert pattern.observations == obs
 
     def test_create_with_metadata(self):
         """Test creating pattern with metadata."""
         result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120,
+            **BASE_KWARGS,
             metadata={"season": "summer", "notes": "Peak lunch hour"}
         )
 
@@ -100,43 +142,22 @@ class TestPatternCreation:
         assert pattern.metadata["season"] == "summer"
         assert pattern.metadata["notes"] == "Peak lunch hour"
 
-    def test_timestamps_auto_generated(self):
+    def test_timestamps_auto_generated(self, monkeypatch):
         """Test that timestamps are automatically generated."""
-        pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        ).unwrap()
+        # Use the real clock here so this stays a genuine timestamp check
+        monkeypatch.setattr(pattern_module, "_now_iso", _real_now_iso)
+        pattern = Pattern.create(**BASE_KWARGS).unwrap()
 
         assert pattern.last_updated is not None
         assert pattern.created_at is not None
         assert "T" in pattern.last_updated  # ISO 8601 format
         assert "T" in pattern.created_at
 
-    def test_immutability(self):
+    @pytest.mark.parametrize("field,value", [("expected_volume", 100.0), ("confidence", 0.9)])
+    def test_immutability(self, baseline_pattern, field, value):
         """Test Pattern is immutable (frozen dataclass)."""
-        pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        ).unwrap()
-
-        # Should not be able to modify frozen fields
         with pytest.raises(Exception):  # FrozenInstanceError
-            pattern.expected_volume = 100.0  # type: ignore
-
-        with pytest.raises(Exception):
-            pattern.confidence = 0.9  # type: ignore
+            setattr(baseline_pattern, field, value)
 
 
 class TestPatternValidation:
@@ -144,16 +165,7 @@ class TestPatternValidation:
 
     def test_validate_missing_restaurant_code(self):
         """Test validation fails for missing restaurant_code."""
-        result = Pattern.create(
-            restaurant_code="",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "restaurant_code": ""})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -162,16 +174,7 @@ class TestPatternValidation:
 
     def test_validate_invalid_service_type(self):
         """Test validation fails for invalid service_type."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="InvalidType",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "service_type": "InvalidType"})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -180,16 +183,7 @@ class TestPatternValidation:
 
     def test_validate_hour_negative(self):
         """Test validation fails for negative hour."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=-1,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "hour": -1})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -198,16 +192,7 @@ class TestPatternValidation:
 
     def test_validate_hour_too_large(self):
         """Test validation fails for hour > 23."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=24,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "hour": 24})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -216,16 +201,7 @@ class TestPatternValidation:
 
     def test_validate_day_of_week_negative(self):
         """Test validation fails for negative day_of_week."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=-1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "day_of_week": -1})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -234,16 +210,7 @@ class TestPatternValidation:
 
     def test_validate_day_of_week_too_large(self):
         """Test validation fails for day_of_week > 6."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=7,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "day_of_week": 7})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -252,16 +219,7 @@ class TestPatternValidation:
 
     def test_validate_negative_volume(self):
         """Test validation fails for negative expected_volume."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=-10.0,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "expected_volume": -10.0})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -270,16 +228,7 @@ class TestPatternValidation:
 
     def test_validate_negative_staffing(self):
         """Test validation fails for negative expected_staffing."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=-1.0,
-            confidence=0.75,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "expected_staffing": -1.0})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -288,16 +237,7 @@ class TestPatternValidation:
 
     def test_validate_confidence_too_low(self):
         """Test validation fails for confidence < 0.0."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=-0.1,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "confidence": -0.1})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -306,16 +246,7 @@ class TestPatternValidation:
 
     def test_validate_confidence_too_high(self):
         """Test validation fails for confidence > 1.0."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=1.5,
-            observations=120
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "confidence": 1.5})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -324,16 +255,7 @@ class TestPatternValidation:
 
     def test_validate_negative_observations(self):
         """Test validation fails for negative observations."""
-        result = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=-5
-        )
+        result = Pattern.create(**{**BASE_KWARGS, "observations": -5})
 
         assert result.is_err()
         error = result.unwrap_err()
@@ -344,31 +266,17 @@ class TestPatternValidation:
 class TestPatternSerialization:
     """Test Pattern serialization and deserialization."""
 
-    def test_to_dict(self):
+    def test_to_dict(self, src_dict):
         """Test serializing Pattern to dictionary."""
-        pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120,
-            metadata={"season": "summer"}
-        ).unwrap()
-
-        data = pattern.to_dict()
-
-        assert data["restaurant_code"] == "SDR"
-        assert data["service_type"] == "Lobby"
-        assert data["hour"] == 12
-        assert data["day_of_week"] == 1
-        assert data["expected_volume"] == 85.5
-        assert data["expected_staffing"] == 3.2
-        assert data["confidence"] == 0.75
-        assert data["observations"] == 120
-        assert data["metadata"]["season"] == "summer"
+        assert src_dict["restaurant_code"] == "TK9"
+        assert src_dict["service_type"] == "ToGo"
+        assert src_dict["hour"] == 7
+        assert src_dict["day_of_week"] == 3
+        assert src_dict["expected_volume"] == 42.5
+        assert src_dict["expected_staffing"] == 2.0
+        assert src_dict["confidence"] == 0.68
+        assert src_dict["observations"] == 75
+        assert src_dict["metadata"]["shift"] == "morning"
 
     def test_from_dict_success(self):
         """Test deserializing Pattern from dictionary."""
@@ -395,18 +303,9 @@ class TestPatternSerialization:
         assert pattern.expected_volume == 150.0
         assert pattern.metadata["notes"] == "Peak dinner"
 
-    def test_from_dict_missing_field(self):
+    def test_from_dict_missing_field(self, src_dict):
         """Test deserialization fails with missing required field."""
-        data = {
-            "restaurant_code": "SDR",
-            "service_type": "Lobby",
-            # Missing hour
-            "day_of_week": 1,
-            "expected_volume": 85.5,
-            "expected_staffing": 3.2,
-            "confidence": 0.75,
-            "observations": 120
-        }
+        data = {k: v for k, v in src_dict.items() if k != "hour"}
 
         result = Pattern.from_dict(data)
 
@@ -415,183 +314,87 @@ class TestPatternSerialization:
         assert isinstance(error, ValidationError)
         assert "Missing required field" in error.message
 
-    def test_roundtrip_serialization(self):
+    def test_roundtrip_serialization(self, src_pattern, src_dict):
         """Test roundtrip: to_dict -> from_dict."""
-        original = Pattern.create(
-            restaurant_code="TK9",
-            service_type="ToGo",
-            hour=7,
-            day_of_week=3,
-            expected_volume=42.5,
-            expected_staffing=2.0,
-            confidence=0.68,
-            observations=75,
-            metadata={"shift": "morning"}
-        ).unwrap()
-
-        data = original.to_dict()
-        restored = Pattern.from_dict(data).unwrap()
-
-        assert restored.restaurant_code == original.restaurant_code
-        assert restored.service_type == original.service_type
-        assert restored.hour == original.hour
-        assert restored.day_of_week == original.day_of_week
-        assert restored.expected_volume == original.expected_volume
-        assert restored.expected_staffing == original.expected_staffing
-        assert restored.confidence == original.confidence
-        assert restored.observations == original.observations
+        restored = Pattern.from_dict(src_dict).unwrap()
+
+        assert restored.restaurant_code == src_pattern.restaurant_code
+        assert restored.service_type == src_pattern.service_type
+        assert restored.hour == src_pattern.hour
+        assert restored.day_of_week == src_pattern.day_of_week
+        assert restored.expected_volume == src_pattern.expected_volume
+        assert restored.expected_staffing == src_pattern.expected_staffing
+        assert restored.confidence == src_pattern.confidence
+        assert restored.observations == src_pattern.observations
         assert restored.metadata["shift"] == "morning"
 
 
 class TestPatternHelpers:
     """Test Pattern helper methods."""
 
-    def test_get_key(self):
+    def test_get_key(self, baseline_pattern):
         """Test get_key() generates unique pattern key."""
-        pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        ).unwrap()
-
-        key = pattern.get_key()
+        key = baseline_pattern.get_key()
         assert key == "SDR:Lobby:12:1"
 
-    def test_get_key_uniqueness(self):
+    def test_get_key_uniqueness(self, baseline_pattern):
         """Test different patterns have different keys."""
-        pattern1 = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        ).unwrap()
-
-        pattern2 = Pattern.create(
-            restaurant_code="SDR",
+        pattern2 = replace(
+            baseline_pattern,
             service_type="Drive-Thru",  # Different service type
-            hour=12,
-            day_of_week=1,
             expected_volume=100.0,
             expected_staffing=4.0,
             confidence=0.80,
             observations=150
-        ).unwrap()
-
-        assert pattern1.get_key() != pattern2.get_key()
-
-    def test_is_reliable_true(self):
-        """Test is_reliable() returns True for reliable pattern."""
-        pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,  # > 0.6 default
-            observations=120  # > 10 default
-        ).unwrap()
-
-        assert pattern.is_reliable() is True
-
-    def test_is_reliable_false_low_confidence(self):
-        """Test is_reliable() returns False for low confidence."""
-        pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.5,  # < 0.6 default
-            observations=120
-        ).unwrap()
-
-        assert pattern.is_reliable() is False
-
-    def test_is_reliable_false_low_observations(self):
-        """Test is_reliable() returns False for low observations."""
-        pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=5  # < 10 default
-        ).unwrap()
-
-        assert pattern.is_reliable() is False
+        )
 
-    def test_is_reliable_custom_thresholds(self):
-        """Test is_reliable() with custom thresholds."""
+        assert baseline_pattern.get_key() != pattern2.get_key()
+
+    @pytest.mark.parametrize(
+        "conf,obs,kw,expected",
+        [
+            (0.75, 120, {}, True),  # Above default thresholds (0.6 / 10)
+            (0.5, 120, {}, False),  # Low confidence
+            (0.75, 5, {}, False),  # Low observations
+            (0.70, 25, {"min_confidence": 0.8, "min_observations": 30}, False),  # Strict
+            (0.70, 25, {"min_confidence": 0.6, "min_observations": 20}, True),  # Lenient
+        ],
+        ids=["reliable", "low_confidence", "low_observations", "strict", "lenient"],
+    )
+    def test_is_reliable(self, conf, obs, kw, expected):
+        """Test is_reliable() against default and custom thresholds."""
         pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.70,
-            observations=25
+            **{**BASE_KWARGS, "confidence": conf, "observations": obs}
         ).unwrap()
 
-        # Strict thresholds
-        assert pattern.is_reliable(min_confidence=0.8, min_observations=30) is False
+        assert pattern.is_reliable(**kw) is expected
 
-        # Lenient thresholds
-        assert pattern.is_reliable(min_confidence=0.6, min_observations=20) is True
-
-    def test_repr(self):
+    def test_repr(self, baseline_pattern):
         """Test __repr__ method."""
-        pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=85.5,
-            expected_staffing=3.2,
-            confidence=0.75,
-            observations=120
-        ).unwrap()
-
-        repr_str = repr(pattern)
-        assert "Pattern(" in repr_str
-        assert "restaurant=SDR" in repr_str
-        assert "service=Lobby" in repr_str
-        assert "hour=12" in repr_str
-        assert "dow=1" in repr_str
-        assert "vol=85.5" in repr_str
-        assert "staff=3.2" in repr_str
-        assert "conf=0.75" in repr_str
-        assert "obs=120" in repr_str
+        assert _REPR_RE.search(repr(baseline_pattern))
 
 
 class TestPatternUpdates:
     """Test Pattern update logic with exponential moving average."""
 
+    @pytest.mark.parametrize(
+        "old,new,lr,expected",
+        [
+            (80.0, 100.0, 0.3, 86.0),
+            (80.0, 100.0, 0.1, 82.0),
+            (80.0, 100.0, 0.5, 90.0),
+            (3.0, 4.0, 0.3, 3.3),
+            (80.0, 100.0, 0.0, 80.0),  # No learning keeps the old value
+            (80.0, 100.0, 1.0, 100.0),  # Full learning adopts the new value
+        ],
+    )
+    def test_ema_kernel(self, old, new, lr, expected):
+        """Test the EMA kernel against hand-computed values."""
+        assert abs(_ema(old, new, lr) - expected) < 1e-9
+
     def test_with_updated_prediction(self):
         """Test updating pattern with new observation."""
-        original = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=80.0,
-            expected_staffing=3.0,
-            confidence=0.70,
-            observations=100
-        ).unwrap()
+        original = Pattern.create(**UPDATE_KWARGS).unwrap()
 
         # New observation: higher volume and staffing
         updated = original.with_updated_prediction(
@@ -602,9 +405,9 @@ class TestPatternUpdates:
 
         # Check exponential moving average applied
         # expected = (1 - 0.3) * 80.0 + 0.3 * 100.0 = 56.0 + 30.0 = 86.0
-        assert updated.expected_volume == pytest.approx(86.0, rel=0.01)
+        assert abs(updated.expected_volume - 86.0) < 1e-9
         # expected = (1 - 0.3) * 3.0 + 0.3 * 4.0 = 2.1 + 1.2 = 3.3
-        assert updated.expected_staffing == pytest.approx(3.3, rel=0.01)
+        assert abs(updated.expected_staffing - 3.3) < 1e-9
 
         # Observations incremented
         assert updated.observations == 101
@@ -619,16 +422,7 @@ class TestPatternUpdates:
 
     def test_with_updated_prediction_low_learning_rate(self):
         """Test pattern update with low learning rate (slow adaptation)."""
-        original = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=80.0,
-            expected_staffing=3.0,
-            confidence=0.70,
-            observations=100
-        ).unwrap()
+        original = Pattern.create(**UPDATE_KWARGS).unwrap()
 
         updated = original.with_updated_prediction(
             new_volume=100.0,
@@ -638,20 +432,11 @@ class TestPatternUpdates:
 
         # Less change with lower learning rate
         # expected = (1 - 0.1) * 80.0 + 0.1 * 100.0 = 72.0 + 10.0 = 82.0
-        assert updated.expected_volume == pytest.approx(82.0, rel=0.01)
+        assert abs(updated.expected_volume - 82.0) < 1e-9
 
     def test_with_updated_prediction_high_learning_rate(self):
         """Test pattern update with high learning rate (fast adaptation)."""
-        original = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=80.0,
-            expected_staffing=3.0,
-            confidence=0.70,
-            observations=100
-        ).unwrap()
+        original = Pattern.create(**UPDATE_KWARGS).unwrap()
 
         updated = original.with_updated_prediction(
             new_volume=100.0,
@@ -661,20 +446,17 @@ class TestPatternUpdates:
 
         # More change with higher learning rate
         # expected = (1 - 0.5) * 80.0 + 0.5 * 100.0 = 40.0 + 50.0 = 90.0
-        assert updated.expected_volume == pytest.approx(90.0, rel=0.01)
+        assert abs(updated.expected_volume - 90.0) < 1e-9
 
-    def test_with_updated_prediction_preserves_identity(self):
+    def test_with_updated_prediction_preserves_identity(self, baseline_pattern):
         """Test that pattern updates preserve restaurant/service/hour/day."""
-        original = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
+        original = replace(
+            baseline_pattern,
             expected_volume=80.0,
             expected_staffing=3.0,
             confidence=0.70,
             observations=100
-        ).unwrap()
+        )
 
         updated = original.with_updated_prediction(
             new_volume=100.0,
@@ -697,14 +479,7 @@ class TestPatternUpdates:
     def test_confidence_growth(self):
         """Test that confidence grows asymptotically with observations."""
         pattern = Pattern.create(
-            restaurant_code="SDR",
-            service_type="Lobby",
-            hour=12,
-            day_of_week=1,
-            expected_volume=80.0,
-            expected_staffing=3.0,
-            confidence=0.50,
-            observations=1  # Very few observations
+            **{**UPDATE_KWARGS, "confidence": 0.50, "observations": 1}  # Very few observations
         ).unwrap()
 
         # Update multiple times
@@ -9,261 +9,241 @@ Tests:
 - Error handling
 """
 
-import pytest
+import copy
 import json
-import tempfile
-from pathlib import Path
+import pickle
+
+import pytest
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
 
 from pipeline.models.processing_result import ProcessingResult
 from pipeline.services import ValidationError, CheckpointError
 
 
-class TestProcessingResultCreation:
-    """Test ProcessingResult creation and validation."""
+BASE_KWARGS = {
+    "restaurant_code": "SDR",
+    "business_date": "2024-01-15",
+    "graded_timeslots_path": "/data/graded.parquet",
+    "shift_assignments_path": "/data/shifts.parquet",
+}
 
-    def test_create_basic_success(self):
-        """Test creating basic ProcessingResult with required fields."""
-        result = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/SDR_2024-01-15_graded.parquet",
-            shift_assignments_path="/data/SDR_2024-01-15_shifts.parquet"
-        )
+SHIFT_SUMMARY = {"morning": {"manager": "John"}}
+PATTERN_UPDATES = {"Lobby": {"updated": True}}
 
-        assert result.is_ok()
-        dto = result.unwrap()
-        assert dto.restaurant_code == "SDR"
-        assert dto.business_date == "2024-01-15"
-        assert dto.graded_timeslots_path == "/data/SDR_2024-01-15_graded.parquet"
-        assert dto.shift_assignments_path == "/data/SDR_2024-01-15_shifts.parquet"
-        assert dto.pattern_updates_path is None
-        assert dto.aggregated_metrics_path is None
-
-    def test_create_with_all_fields(self):
-        """Test creating ProcessingResult with all optional fields."""
-        result = ProcessingResult.create(
-            restaurant_code="T12",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
+
+@dataclass(frozen=True)
+class CreateCase:
+    """One ProcessingResult.create() scenario (kwargs override BASE_KWARGS)."""
+    kwargs: Dict[str, Any]
+    field_checks: Dict[str, Any] = field(default_factory=dict)
+    err_substr: Optional[str] = None
+
+
+CREATE_CASES = [
+    pytest.param(
+        CreateCase(
+            kwargs={
+                "graded_timeslots_path": "/data/SDR_2024-01-15_graded.parquet",
+                "shift_assignments_path": "/data/SDR_2024-01-15_shifts.parquet",
+            },
+            field_checks={
+                "restaurant_code": "SDR",
+                "business_date": "2024-01-15",
+                "graded_timeslots_path": "/data/SDR_2024-01-15_graded.parquet",
+                "shift_assignments_path": "/data/SDR_2024-01-15_shifts.parquet",
+                "pattern_updates_path": None,
+                "aggregated_metrics_path": None,
+            },
+        ),
+        id="basic",
+    ),
+    pytest.param(
+        CreateCase(
+            kwargs={
+                "restaurant_code": "T12",
+                "pattern_updates_path": "/data/patterns.parquet",
+                "aggregated_metrics_path": "/data/metrics.parquet",
+                "timeslot_count": 150,
+            },
+            field_checks={
+                "pattern_updates_path": "/data/patterns.parquet",
+                "aggregated_metrics_path": "/data/metrics.parquet",
+                "timeslot_count": 150,
+            },
+        ),
+        id="all_fields",
+    ),
+    pytest.param(
+        CreateCase(
+            kwargs={
+                "shift_summary": {
+                    "morning": {"manager": "John Doe", "employees": 12, "hours": "06:00-14:00"},
+                    "evening": {"manager": "Jane Smith", "employees": 15, "hours": "14:00-22:00"},
+                },
+            },
+            field_checks={
+                "shift_summary": {
+                    "morning": {"manager": "John Doe", "employees": 12, "hours": "06:00-14:00"},
+                    "evening": {"manager": "Jane Smith", "employees": 15, "hours": "14:00-22:00"},
+                },
+            },
+        ),
+        id="shift_summary",
+    ),
+    pytest.param(
+        CreateCase(
+            kwargs={
+                "restaurant_code": "TK9",
+                "pattern_updates": {
+                    "Lobby": {"updated": True, "observations": 50},
+                    "Drive-Thru": {"updated": True, "observations": 120},
+                    "ToGo": {"updated": False, "observations": 10},
+                },
+            },
+            field_checks={
+                "pattern_updates": {
+                    "Lobby": {"updated": True, "observations": 50},
+                    "Drive-Thru": {"updated": True, "observations": 120},
+                    "ToGo": {"updated": False, "observations": 10},
+                },
+            },
+        ),
+        id="pattern_updates",
+    ),
+    pytest.param(
+        CreateCase(
+            kwargs={
+                "metadata": {
+                    "processing_version": "4.0",
+                    "operator": "system",
+                    "notes": "Holiday processing",
+                },
+            },
+            field_checks={
+                "metadata": {
+                    "processing_version": "4.0",
+                    "operator": "system",
+                    "notes": "Holiday processing",
+                },
+            },
+        ),
+        id="metadata",
+    ),
+]
+
+VALIDATION_CASES = [
+    pytest.param(
+        CreateCase(kwargs={"restaurant_code": ""}, err_substr="restaurant_code"),
+        id="missing_code",
+    ),
+    pytest.param(
+        CreateCase(
+            kwargs={"business_date": "01/15/2024"},  # Wrong format
+            err_substr="YYYY-MM-DD",
+        ),
+        id="invalid_date_format",
+    ),
+    pytest.param(
+        CreateCase(
+            kwargs={"graded_timeslots_path": ""},
+            err_substr="graded_timeslots_path",
+        ),
+        id="missing_graded_timeslots_path",
+    ),
+    pytest.param(
+        CreateCase(
+            kwargs={"shift_assignments_path": ""},
+            err_substr="shift_assignments_path",
+        ),
+        id="missing_shift_assignments_path",
+    ),
+    pytest.param(
+        CreateCase(kwargs={"timeslot_count": -1}, err_substr="timeslot_count"),
+        id="negative_timeslot_count",
+    ),
+    pytest.param(
+        CreateCase(kwargs={"business_date": "2024-1-15"}, err_substr="YYYY-MM-DD"),
+        id="unpadded_date",
+    ),
+    pytest.param(
+        CreateCase(kwargs={"business_date": "2024-13-45"}, err_substr="YYYY-MM-DD"),
+        id="impossible_date",
+    ),
+]
+
+# DTO factories of increasing complexity for the checkpoint roundtrip tests
+ROUNDTRIP_DTOS = [
+    pytest.param(
+        lambda: ProcessingResult.create(**BASE_KWARGS, timeslot_count=100).unwrap(),
+        id="basic",
+    ),
+    pytest.param(
+        lambda: ProcessingResult.create(
+            **{**BASE_KWARGS, "restaurant_code": "TK9"},
             pattern_updates_path="/data/patterns.parquet",
             aggregated_metrics_path="/data/metrics.parquet",
-            timeslot_count=150
-        )
+            timeslot_count=250,
+            shift_summary=SHIFT_SUMMARY,
+            pattern_updates=PATTERN_UPDATES,
+            metadata={"processor": "advanced"}
+        ).unwrap(),
+        id="full",
+    ),
+]
 
-        assert result.is_ok()
-        dto = result.unwrap()
-        assert dto.pattern_updates_path == "/data/patterns.parquet"
-        assert dto.aggregated_metrics_path == "/data/metrics.parquet"
-        assert dto.timeslot_count == 150
-
-    def test_create_with_shift_summary(self):
-        """Test creating ProcessingResult with shift summary."""
-        shift_summary = {
-            "morning": {
-                "manager": "John Doe",
-                "employees": 12,
-                "hours": "06:00-14:00"
-            },
-            "evening": {
-                "manager": "Jane Smith",
-                "employees": 15,
-                "hours": "14:00-22:00"
-            }
-        }
 
-        result = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            shift_summary=shift_summary
-        )
+@pytest.fixture(scope="module", params=ROUNDTRIP_DTOS)
+def roundtrip_dto(request):
+    """Roundtrip DTO, built once per module for each complexity level."""
+    return request.param()
 
-        assert result.is_ok()
-        dto = result.unwrap()
-        assert dto.shift_summary["morning"]["manager"] == "John Doe"
-        assert dto.shift_summary["evening"]["employees"] == 15
-
-    def test_create_with_pattern_updates(self):
-        """Test creating ProcessingResult with pattern updates."""
-        pattern_updates = {
-            "Lobby": {"updated": True, "observations": 50},
-            "Drive-Thru": {"updated": True, "observations": 120},
-            "ToGo": {"updated": False, "observations": 10}
-        }
 
-        result = ProcessingResult.create(
-            restaurant_code="TK9",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            pattern_updates=pattern_updates
-        )
+class TestProcessingResultCreation:
+    """Test ProcessingResult creation and validation."""
 
-        assert result.is_ok()
-        dto = result.unwrap()
-        assert dto.pattern_updates["Lobby"]["updated"] is True
-        assert dto.pattern_updates["Drive-Thru"]["observations"] == 120
-
-    def test_create_with_metadata(self):
-        """Test creating ProcessingResult with metadata."""
-        result = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            metadata={
-                "processing_version": "4.0",
-                "operator": "system",
-                "notes": "Holiday processing"
-            }
-        )
+    @pytest.mark.parametrize("case", CREATE_CASES)
+    def test_create_success(self, case):
+        """Test creating ProcessingResult with required and optional fields."""
+        result = ProcessingResult.create(**{**BASE_KWARGS, **case.kwargs})
 
-        assert result.is_ok()
-        dto = result.unwrap()
-        assert dto.metadata["processing_version"] == "4.0"
-        assert dto.metadata["operator"] == "system"
+        fields = asdict(result.expect("create should succeed"))
+        assert {name: fields[name] for name in case.field_checks} == case.field_checks
 
-    def test_immutability(self):
+    def test_immutability(self, basic_dto):
         """Test DTO is immutable (frozen dataclass)."""
-        result = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet"
-        )
-
-        dto = result.unwrap()
-
         # Should not be able to modify frozen fields
         with pytest.raises(Exception):  # FrozenInstanceError
-            dto.restaurant_code = "T12"  # type: ignore
+            basic_dto.restaurant_code = "T12"  # type: ignore
 
         with pytest.raises(Exception):
-            dto.timeslot_count = 100  # type: ignore
+            basic_dto.timeslot_count = 100  # type: ignore
 
 
 class TestProcessingResultValidation:
     """Test ProcessingResult validation logic."""
 
-    def test_validate_missing_restaurant_code(self):
-        """Test validation fails for missing restaurant_code."""
-        result = ProcessingResult.create(
-            restaurant_code="",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet"
-        )
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert isinstance(error, ValidationError)
-        assert "restaurant_code" in error.message
-
-    def test_validate_invalid_date_format(self):
-        """Test validation fails for invalid date format."""
-        result = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="01/15/2024",  # Wrong format
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet"
-        )
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert isinstance(error, ValidationError)
-        assert "YYYY-MM-DD" in error.message
-
-    def test_validate_missing_graded_timeslots_path(self):
-        """Test validation fails for missing graded_timeslots_path."""
-        result = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="",
-            shift_assignments_path="/data/shifts.parquet"
-        )
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert isinstance(error, ValidationError)
-        assert "graded_timeslots_path" in error.message
-
-    def test_validate_missing_shift_assignments_path(self):
-        """Test validation fails for missing shift_assignments_path."""
-        result = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path=""
-        )
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert isinstance(error, ValidationError)
-        assert "shift_assignments_path" in error.message
-
-    def test_validate_negative_timeslot_count(self):
-        """Test validation fails for negative timeslot_count."""
-        result = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            timeslot_count=-1
-        )
-
-        assert result.is_err()
-        error = result.unwrap_err()
+    @pytest.mark.parametrize("case", VALIDATION_CASES)
+    def test_validate(self, case):
+        """Test validation fails for each invalid field."""
+        result = ProcessingResult.create(**{**BASE_KWARGS, **case.kwargs})
+
+        error = result.expect_err("validation should fail")
         assert isinstance(error, ValidationError)
-        assert "timeslot_count" in error.message
+        assert case.err_substr in error.message
 
 
 class TestCheckpointSerialization:
     """Test checkpoint serialization and deserialization."""
 
-    def test_to_checkpoint_basic(self):
-        """Test serializing basic ProcessingResult to checkpoint."""
-        dto = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            timeslot_count=100
-        ).unwrap()
+    def test_to_checkpoint_returns_independent_copies(self, basic_dto):
+        """Test cached checkpoint is not exposed to caller mutation."""
+        first = basic_dto.to_checkpoint()
+        first["restaurant_code"] = "MUTATED"
 
-        checkpoint = dto.to_checkpoint()
-
-        assert checkpoint["restaurant_code"] == "SDR"
-        assert checkpoint["business_date"] == "2024-01-15"
-        assert checkpoint["graded_timeslots_path"] == "/data/graded.parquet"
-        assert checkpoint["shift_assignments_path"] == "/data/shifts.parquet"
-        assert checkpoint["timeslot_count"] == 100
-        assert checkpoint["pattern_updates_path"] is None
-
-    def test_to_checkpoint_full(self):
-        """Test serializing full ProcessingResult to checkpoint."""
-        shift_summary = {"morning": {"manager": "John"}}
-        pattern_updates = {"Lobby": {"updated": True}}
-
-        dto = ProcessingResult.create(
-            restaurant_code="T12",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            pattern_updates_path="/data/patterns.parquet",
-            aggregated_metrics_path="/data/metrics.parquet",
-            timeslot_count=150,
-            shift_summary=shift_summary,
-            pattern_updates=pattern_updates
-        ).unwrap()
-
-        checkpoint = dto.to_checkpoint()
-
-        assert checkpoint["pattern_updates_path"] == "/data/patterns.parquet"
-        assert checkpoint["aggregated_metrics_path"] == "/data/metrics.parquet"
-        assert checkpoint["shift_summary"]["morning"]["manager"] == "John"
-        assert checkpoint["pattern_updates"]["Lobby"]["updated"] is True
+        second = basic_dto.to_checkpoint()
+        assert second["restaurant_code"] == "SDR"
+        assert second is not first
 
     def test_from_checkpoint_success(self):
         """Test deserializing checkpoint to ProcessingResult."""
@@ -283,11 +263,7 @@ class TestCheckpointSerialization:
 
         result = ProcessingResult.from_checkpoint(checkpoint)
 
-        assert result.is_ok()
-        dto = result.unwrap()
-        assert dto.restaurant_code == "SDR"
-        assert dto.timeslot_count == 100
-        assert dto.metadata["source"] == "test"
+        assert asdict(result.expect("checkpoint should restore")) == checkpoint
 
     def test_from_checkpoint_missing_field(self):
         """Test deserialization fails with missing required field."""
@@ -300,192 +276,171 @@ class TestCheckpointSerialization:
 
         result = ProcessingResult.from_checkpoint(checkpoint)
 
-        assert result.is_err()
-        error = result.unwrap_err()
+        error = result.expect_err("should fail")
         assert isinstance(error, ValidationError)
         assert "Missing required checkpoint field" in error.message
 
-    def test_roundtrip_checkpoint(self):
+    def test_roundtrip_checkpoint(self, roundtrip_dto):
         """Test checkpoint roundtrip (to_checkpoint -> from_checkpoint)."""
-        original = ProcessingResult.create(
-            restaurant_code="TK9",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            pattern_updates_path="/data/patterns.parquet",
-            timeslot_count=200,
-            shift_summary={"morning": {"manager": "Alice"}},
-            pattern_updates={"Lobby": {"observations": 50}},
-            metadata={"version": "4.0"}
-        ).unwrap()
+        original = roundtrip_dto
 
         checkpoint = original.to_checkpoint()
         restored = ProcessingResult.from_checkpoint(checkpoint).unwrap()
 
-        assert restored.restaurant_code == original.restaurant_code
-        assert restored.business_date == original.business_date
-        assert restored.graded_timeslots_path == original.graded_timeslots_path
-        assert restored.pattern_updates_path == original.pattern_updates_path
-        assert restored.timeslot_count == 200
-        assert restored.shift_summary["morning"]["manager"] == "Alice"
-        assert restored.metadata["version"] == "4.0"
+        assert checkpoint == asdict(original)
+        assert asdict(restored) == asdict(original)
+
+    def test_from_checkpoint_returns_independent_dtos(self, basic_dto):
+        """Test each restore builds a fresh DTO that shares no dicts with others."""
+        checkpoint = {**basic_dto.to_checkpoint(), "metadata": {"k": 1}}
+
+        first = ProcessingResult.from_checkpoint(checkpoint).unwrap()
+        first.metadata["poison"] = True
+        second = ProcessingResult.from_checkpoint(
+            {**checkpoint, "metadata": {"k": 1}}
+        ).unwrap()
+
+        assert second is not first
+        assert second.metadata == {"k": 1}
 
 
 class TestCheckpointFileIO:
     """Test checkpoint file I/O operations."""
 
-    def test_save_checkpoint_success(self):
+    def test_save_checkpoint_success(self, basic_dto, checkpoint_dir):
         """Test saving checkpoint to file."""
-        dto = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet"
-        ).unwrap()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            checkpoint_path = Path(tmpdir) / "checkpoint.json"
-            result = dto.save_checkpoint(str(checkpoint_path))
+        checkpoint_path = checkpoint_dir / "checkpoint.json"
+        result = basic_dto.save_checkpoint(str(checkpoint_path))
 
-            assert result.is_ok()
-            assert checkpoint_path.exists()
+        assert result.is_ok()
+        assert checkpoint_path.exists()
 
-            # Verify file contents
-            with open(checkpoint_path) as f:
-                data = json.load(f)
-                assert data["restaurant_code"] == "SDR"
+        # Verify file contents
+        with open(checkpoint_path) as f:
+            data = json.load(f)
+            assert data["restaurant_code"] == "SDR"
 
-    def test_save_checkpoint_creates_directory(self):
+    def test_save_checkpoint_creates_directory(self, basic_dto, checkpoint_dir):
         """Test save_checkpoint creates parent directories."""
-        dto = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet"
-        ).unwrap()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            checkpoint_path = Path(tmpdir) / "state" / "processing" / "checkpoint.json"
-            result = dto.save_checkpoint(str(checkpoint_path))
+        checkpoint_path = checkpoint_dir / "state" / "processing" / "checkpoint.json"
+        result = basic_dto.save_checkpoint(str(checkpoint_path))
 
-            assert result.is_ok()
-            assert checkpoint_path.exists()
+        assert result.is_ok()
+        assert checkpoint_path.exists()
 
-    def test_load_checkpoint_success(self):
+    def test_load_checkpoint_success(self, tmp_path):
         """Test loading checkpoint from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            checkpoint_path = Path(tmpdir) / "checkpoint.json"
+        checkpoint_path = tmp_path / "checkpoint.json"
 
-            checkpoint_data = {
-                "restaurant_code": "T12",
-                "business_date": "2024-01-15",
-                "graded_timeslots_path": "/data/graded.parquet",
-                "shift_assignments_path": "/data/shifts.parquet",
-                "pattern_updates_path": None,
-                "aggregated_metrics_path": None,
-                "processing_timestamp": "2024-01-15T10:00:00",
-                "timeslot_count": 150,
-                "shift_summary": {},
-                "pattern_updates": {},
-                "metadata": {}
-            }
+        checkpoint_data = {
+            "restaurant_code": "T12",
+            "business_date": "2024-01-15",
+            "graded_timeslots_path": "/data/graded.parquet",
+            "shift_assignments_path": "/data/shifts.parquet",
+            "pattern_updates_path": None,
+            "aggregated_metrics_path": None,
+            "processing_timestamp": "2024-01-15T10:00:00",
+            "timeslot_count": 150,
+            "shift_summary": {},
+            "pattern_updates": {},
+            "metadata": {}
+        }
 
-            with open(checkpoint_path, "w") as f:
-                json.dump(checkpoint_data, f)
+        with open(checkpoint_path, "w") as f:
+            json.dump(checkpoint_data, f)
 
-            result = ProcessingResult.load_checkpoint(str(checkpoint_path))
+        result = ProcessingResult.load_checkpoint(str(checkpoint_path))
 
-            assert result.is_ok()
-            dto = result.unwrap()
-            assert dto.restaurant_code == "T12"
-            assert dto.timeslot_count == 150
+        assert asdict(result.expect("checkpoint should load")) == checkpoint_data
 
     def test_load_checkpoint_file_not_found(self):
         """Test loading non-existent checkpoint fails."""
         result = ProcessingResult.load_checkpoint("/nonexistent/checkpoint.json")
 
-        assert result.is_err()
-        error = result.unwrap_err()
+        error = result.expect_err("should fail")
         assert isinstance(error, CheckpointError)
         assert "not found" in error.message
 
-    def test_load_checkpoint_invalid_json(self):
+    def test_load_checkpoint_invalid_json(self, tmp_path):
         """Test loading invalid JSON checkpoint fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            checkpoint_path = Path(tmpdir) / "checkpoint.json"
+        checkpoint_path = tmp_path / "checkpoint.json"
 
-            with open(checkpoint_path, "w") as f:
-                f.write("{ invalid json }")
+        with open(checkpoint_path, "w") as f:
+            f.write("{ invalid json }")
 
-            result = ProcessingResult.load_checkpoint(str(checkpoint_path))
+        result = ProcessingResult.load_checkpoint(str(checkpoint_path))
 
-            assert result.is_err()
-            error = result.unwrap_err()
-            assert isinstance(error, CheckpointError)
-            assert "Invalid checkpoint JSON" in error.message
+        error = result.expect_err("should fail")
+        assert isinstance(error, CheckpointError)
+        assert "Invalid checkpoint JSON" in error.message
 
-    def test_roundtrip_file_io(self):
+    def test_roundtrip_file_io(self, roundtrip_dto, tmp_path):
         """Test full roundtrip: create -> save -> load."""
-        original = ProcessingResult.create(
-            restaurant_code="TK9",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            pattern_updates_path="/data/patterns.parquet",
-            aggregated_metrics_path="/data/metrics.parquet",
-            timeslot_count=250,
-            shift_summary={"evening": {"manager": "Bob"}},
-            pattern_updates={"Drive-Thru": {"updated": True}},
-            metadata={"processor": "advanced"}
-        ).unwrap()
+        original = roundtrip_dto
+        checkpoint_path = tmp_path / "checkpoint.json"
+
+        # Save
+        original.save_checkpoint(str(checkpoint_path)).expect("save should succeed")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            checkpoint_path = Path(tmpdir) / "checkpoint.json"
+        # Load
+        load_result = ProcessingResult.load_checkpoint(str(checkpoint_path))
+        restored = load_result.expect("load should succeed")
 
-            # Save
-            save_result = original.save_checkpoint(str(checkpoint_path))
-            assert save_result.is_ok()
+        assert asdict(restored) == asdict(original)
 
-            # Load
-            load_result = ProcessingResult.load_checkpoint(str(checkpoint_path))
-            assert load_result.is_ok()
+    def test_roundtrip_file_io_stdlib_json(self, basic_dto, tmp_path, monkeypatch):
+        """Test save/load still works through the stdlib json fallback."""
+        import pipeline.models.processing_result as module
 
-            restored = load_result.unwrap()
-            assert restored.restaurant_code == original.restaurant_code
-            assert restored.timeslot_count == 250
-            assert restored.aggregated_metrics_path == original.aggregated_metrics_path
-            assert restored.shift_summary["evening"]["manager"] == "Bob"
-            assert restored.pattern_updates["Drive-Thru"]["updated"] is True
-            assert restored.metadata["processor"] == "advanced"
+        monkeypatch.setattr(module, "orjson", None)
+        checkpoint_path = tmp_path / "checkpoint.json"
 
+        assert basic_dto.save_checkpoint(str(checkpoint_path)).is_ok()
+        restored = ProcessingResult.load_checkpoint(str(checkpoint_path)).unwrap()
 
+        assert asdict(restored) == asdict(basic_dto)
+
+
+@pytest.mark.coverage_skip  # Assertion-only checks on paths covered elsewhere
 class TestProcessingResultHelpers:
     """Test helper methods."""
 
-    def test_repr(self):
+    def test_repr(self, basic_dto):
         """Test __repr__ method."""
-        dto = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet",
-            timeslot_count=120
-        ).unwrap()
-
-        repr_str = repr(dto)
+        repr_str = repr(basic_dto)
         assert "ProcessingResult" in repr_str
         assert "SDR" in repr_str
         assert "2024-01-15" in repr_str
-        assert "timeslots=120" in repr_str
+        assert "timeslots=0" in repr_str
+
+    def test_empty_defaults_are_plain_dicts(self, basic_dto):
+        """Test empty optional fields are real dicts that copy, pickle and serialize."""
+        for name in ("shift_summary", "pattern_updates", "metadata"):
+            assert type(getattr(basic_dto, name)) is dict
+
+        assert asdict(copy.deepcopy(basic_dto)) == asdict(basic_dto)
+        assert pickle.loads(pickle.dumps(basic_dto)) == basic_dto
+        json.dumps(basic_dto.to_checkpoint())
 
-    def test_processing_timestamp_auto_generated(self):
+    def test_processing_timestamp_auto_generated(self, basic_dto):
         """Test processing_timestamp is automatically generated."""
-        dto = ProcessingResult.create(
-            restaurant_code="SDR",
-            business_date="2024-01-15",
-            graded_timeslots_path="/data/graded.parquet",
-            shift_assignments_path="/data/shifts.parquet"
-        ).unwrap()
+        assert basic_dto.processing_timestamp is not None
+        assert "T" in basic_dto.processing_timestamp  # ISO 8601 format
+
+    def test_date_validation_is_memoized(self):
+        """Test repeated business dates reuse the cached validation result."""
+        from pipeline.models._dates import _check_date
+
+        _check_date.cache_clear()
+        for _ in range(3):
+            ProcessingResult.create(**BASE_KWARGS)
+
+        info = _check_date.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_date_validation_rejects_unhashable(self):
+        """Test unhashable business_date fails validation instead of raising."""
+        result = ProcessingResult.create(**{**BASE_KWARGS, "business_date": ["2024-01-15"]})
 
-        assert dto.processing_timestamp is not None
-        assert "T" in dto.processing_timestamp  # ISO 8601 format
+        assert "YYYY-MM-DD" in result.expect_err("should fail").message
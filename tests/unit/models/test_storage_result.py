@@ -10,8 +10,13 @@ Tests:
 """
 
 import pytest
+import copy
 import json
+import os
+import pickle
+import sys
 import tempfile
+from dataclasses import fields, replace
 from pathlib import Path
 
 from pipeline.models.storage_result import StorageResult
@@ -132,6 +137,19 @@ class TestStorageResultCreation:
         with pytest.raises(Exception):
             dto.success = False  # type: ignore
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_slotted_layout(self):
+        """Test DTO has no per-instance __dict__ and still pickles."""
+        dto = StorageResult.create(
+            restaurant_code="SDR",
+            business_date="2024-01-15",
+            tables_written=["daily_performance"],
+            row_counts={"daily_performance": 1}
+        ).unwrap()
+
+        assert not hasattr(dto, "__dict__")
+        assert pickle.loads(pickle.dumps(dto)) == dto
+
 
 class TestStorageResultValidation:
     """Test StorageResult validation logic."""
@@ -220,6 +238,36 @@ class TestStorageResultValidation:
         assert isinstance(error, ValidationError)
         assert "matching tables" in error.message
 
+    @pytest.mark.parametrize("bad_date", ["2024-1-15", "2024-02-30", ["2024-01-15"]])
+    def test_validate_rejects_malformed_dates(self, bad_date):
+        """Test unpadded, impossible and non-string dates fail validation."""
+        result = StorageResult.create(
+            restaurant_code="SDR",
+            business_date=bad_date,
+            tables_written=["daily_performance"],
+            row_counts={"daily_performance": 1}
+        )
+
+        assert result.is_err()
+        assert "YYYY-MM-DD" in result.unwrap_err().message
+
+    def test_date_validation_is_memoized(self):
+        """Test repeated business dates reuse the cached validation result."""
+        from pipeline.models._dates import _check_date
+
+        _check_date.cache_clear()
+        for _ in range(3):
+            StorageResult.create(
+                restaurant_code="SDR",
+                business_date="2024-01-15",
+                tables_written=["daily_performance"],
+                row_counts={"daily_performance": 1}
+            )
+
+        info = _check_date.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
 
 class TestCheckpointSerialization:
     """Test checkpoint serialization and deserialization."""
@@ -299,6 +347,88 @@ class TestCheckpointSerialization:
         error = result.unwrap_err()
         assert isinstance(error, ValidationError)
         assert "Missing required checkpoint field" in error.message
+        assert "tables_written" in error.message
+
+    def test_from_checkpoint_without_validation(self):
+        """Test validate=False skips field checks but still enforces required keys."""
+        trusted = {
+            "restaurant_code": "SDR",
+            "business_date": "not-a-date",
+            "tables_written": ["daily_performance"],
+            "row_counts": {"daily_performance": 1},
+        }
+
+        assert StorageResult.from_checkpoint(trusted).is_err()
+        dto = StorageResult.from_checkpoint(trusted, validate=False).unwrap()
+        assert dto.business_date == "not-a-date"
+        assert dto.errors == []
+        assert dto.get_total_rows() == 1
+
+        del trusted["row_counts"]
+        error = StorageResult.from_checkpoint(trusted, validate=False).unwrap_err()
+        assert "Missing required checkpoint field" in error.message
+
+    def test_load_checkpoint_without_validation(self, tmp_path):
+        """Test load_checkpoint(validate=False) restores an equal DTO."""
+        dto = StorageResult.create(
+            restaurant_code="SDR",
+            business_date="2024-01-15",
+            tables_written=["daily_performance"],
+            row_counts={"daily_performance": 1}
+        ).unwrap()
+        checkpoint_path = tmp_path / "checkpoint.json"
+        dto.save_checkpoint(str(checkpoint_path))
+
+        restored = StorageResult.load_checkpoint(str(checkpoint_path), validate=False)
+
+        assert restored.unwrap() == dto
+
+    def test_from_checkpoint_interns_names(self):
+        """Test names decoded from JSON are interned and shared across DTOs."""
+        payload = json.dumps({
+            "restaurant_code": "SDR",
+            "business_date": "2024-01-15",
+            "tables_written": ["daily_performance"],
+            "row_counts": {"daily_performance": 1},
+        })
+
+        first = StorageResult.from_checkpoint(json.loads(payload)).unwrap()
+        second = StorageResult.from_checkpoint(json.loads(payload)).unwrap()
+
+        assert first.restaurant_code is second.restaurant_code
+        assert first.tables_written[0] is second.tables_written[0]
+        assert next(iter(first.row_counts)) is first.tables_written[0]
+
+    def test_from_checkpoint_non_str_names_left_untouched(self):
+        """Test non-str table names skip interning instead of raising."""
+        checkpoint = {
+            "restaurant_code": "SDR",
+            "business_date": "2024-01-15",
+            "tables_written": ["daily_performance", 7],
+            "row_counts": {7: 1},
+        }
+
+        dto = StorageResult.from_checkpoint(checkpoint, validate=False).unwrap()
+
+        assert dto.tables_written == ["daily_performance", 7]
+        assert dto.row_counts == {7: 1}
+
+    def test_from_checkpoint_preserves_storage_timestamp(self):
+        """Test restored DTO keeps the checkpointed storage_timestamp."""
+        checkpoint = {
+            "restaurant_code": "SDR",
+            "business_date": "2024-01-15",
+            "tables_written": ["daily_performance"],
+            "row_counts": {"daily_performance": 1},
+            "storage_timestamp": "2024-01-15T23:59:59",
+        }
+
+        dto = StorageResult.from_checkpoint(checkpoint).unwrap()
+
+        assert dto.storage_timestamp == "2024-01-15T23:59:59"
+        assert dto.success is True
+        assert dto.errors == []
+        assert dto.metadata == {}
 
     def test_roundtrip_checkpoint(self):
         """Test checkpoint roundtrip (to_checkpoint -> from_checkpoint)."""
@@ -369,6 +499,28 @@ class TestCheckpointFileIO:
             assert result.is_ok()
             assert checkpoint_path.exists()
 
+    def test_save_checkpoint_is_atomic(self, tmp_path, monkeypatch):
+        """Test a failed save leaves the previous checkpoint and no temp file."""
+        dto = StorageResult.create(
+            restaurant_code="SDR",
+            business_date="2024-01-15",
+            tables_written=["daily_performance"],
+            row_counts={"daily_performance": 1}
+        ).unwrap()
+        checkpoint_path = tmp_path / "checkpoint.json"
+        checkpoint_path.write_text("previous")
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", failing_replace)
+        result = dto.save_checkpoint(str(checkpoint_path))
+
+        assert result.is_err()
+        assert isinstance(result.unwrap_err(), CheckpointError)
+        assert checkpoint_path.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [checkpoint_path]
+
     def test_load_checkpoint_success(self):
         """Test loading checkpoint from file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -461,6 +613,29 @@ class TestCheckpointFileIO:
             assert restored.get_total_rows() == 314
             assert restored.metadata["storage_engine"] == "supabase-postgrest"
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib_json"])
+    def test_roundtrip_file_io_backends(self, use_orjson, tmp_path, monkeypatch):
+        """Test save/load roundtrip through both the orjson and stdlib json paths."""
+        import pipeline.models.storage_result as module
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(module, "orjson", None)
+
+        original = StorageResult.create(
+            restaurant_code="SDR",
+            business_date="2024-01-15",
+            tables_written=["daily_performance"],
+            row_counts={"daily_performance": 1},
+            metadata={"storage_engine": "supabase-postgrest"}
+        ).unwrap()
+        checkpoint_path = tmp_path / "checkpoint.json"
+
+        assert original.save_checkpoint(str(checkpoint_path)).is_ok()
+        assert json.loads(checkpoint_path.read_text()) == original.to_checkpoint()
+        assert StorageResult.load_checkpoint(str(checkpoint_path)).unwrap() == original
+
 
 class TestStorageResultHelpers:
     """Test helper methods."""
@@ -493,6 +668,21 @@ class TestStorageResultHelpers:
         total = dto.get_total_rows()
         assert total == 1
 
+    def test_total_rows_tracks_row_counts(self):
+        """Test the total follows row_counts and is not a stored field."""
+        dto = StorageResult.create(
+            restaurant_code="SDR",
+            business_date="2024-01-15",
+            tables_written=["daily_performance"],
+            row_counts={"daily_performance": 1}
+        ).unwrap()
+
+        dto.row_counts["daily_performance"] = 42
+
+        assert dto.get_total_rows() == 42
+        assert replace(dto, row_counts={"daily_performance": 7}).get_total_rows() == 7
+        assert "_total_rows" not in {f.name for f in fields(dto)}
+
     def test_repr_success(self):
         """Test __repr__ method for successful storage."""
         dto = StorageResult.create(
@@ -524,6 +714,37 @@ class TestStorageResultHelpers:
         repr_str = repr(dto)
         assert "FAILED" in repr_str
 
+    def test_empty_defaults_are_plain_containers(self):
+        """Test empty errors/metadata are a real list/dict that copy and serialize."""
+        dto = StorageResult.create(
+            restaurant_code="SDR",
+            business_date="2024-01-15",
+            tables_written=["daily_performance"],
+            row_counts={"daily_performance": 1}
+        ).unwrap()
+
+        assert type(dto.errors) is list
+        assert type(dto.metadata) is dict
+        assert copy.deepcopy(dto) == dto
+        json.dumps(dto.to_checkpoint())
+
+    def test_repr_reflects_current_contents(self):
+        """Test repr follows in-place changes and adds no dataclass fields."""
+        dto = StorageResult.create(
+            restaurant_code="SDR",
+            business_date="2024-01-15",
+            tables_written=["daily_performance"],
+            row_counts={"daily_performance": 1}
+        ).unwrap()
+        repr(dto)
+
+        dto.tables_written.append("shift_assignments")
+        dto.row_counts["shift_assignments"] = 5
+
+        assert "tables=2" in repr(dto)
+        assert "rows=6" in repr(dto)
+        assert "_repr_cache" not in {f.name for f in fields(dto)}
+
     def test_storage_timestamp_auto_generated(self):
         """Test storage_timestamp is automatically generated."""
         dto = StorageResult.create(
@@ -535,3 +756,4 @@ class TestStorageResultHelpers:
 
         assert dto.storage_timestamp is not None
         assert "T" in dto.storage_timestamp  # ISO 8601 format
+
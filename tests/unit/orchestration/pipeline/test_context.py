@@ -11,6 +11,11 @@ Tests:
 - Summary generation
 """
 
+import copy
+import dataclasses
+import pickle
+import sys
+
 import pytest
 
 from pipeline.orchestration.pipeline import PipelineContext
@@ -20,9 +25,15 @@ from pipeline.orchestration.pipeline import PipelineContext
 # FIXTURES
 # ============================================================================
 
-@pytest.fixture
+@dataclasses.dataclass
+class TaggedContext(PipelineContext):
+    """Subclass with an extra field (module level so it can be pickled)."""
+    tag: str = "none"
+
+
+@pytest.fixture(scope="module")
 def sample_config():
-    """Sample configuration dictionary."""
+    """Sample configuration dictionary (shared; contexts never mutate config)."""
     return {
         "restaurant": {"code": "SDR", "name": "Sandra's"},
         "pattern_learning": {"enabled": True}
@@ -81,6 +92,34 @@ class TestContextInitialization:
         assert context.get_completed_stages() == []
         assert context.get_total_duration() == 0.0
 
+    def test_reads_do_not_allocate_storage(self, context):
+        """Test read-only access leaves the lazily allocated dicts unset."""
+        context.get("missing")
+        context.has("missing")
+        context.get_metadata("missing")
+        context.is_stage_complete("ingestion")
+        context.summary()
+        context.to_checkpoint()
+
+        assert context._state is None
+        assert context._stages is None
+        assert context._metadata is None
+
+    def test_returned_collections_are_independent(self, context):
+        """Test getters on a fresh context return new mutable containers."""
+        state = context.get_all_state()
+        state["leak"] = True
+
+        assert context.get_all_state() == {}
+        assert context.has("leak") is False
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_slotted_rejects_ad_hoc_attributes(self, context):
+        """Test context is slotted (state goes through set/get, not attributes)."""
+        assert not hasattr(context, "__dict__")
+        with pytest.raises(AttributeError):
+            context.ingestion_result = object()  # type: ignore
+
 
 # ============================================================================
 # STATE MANAGEMENT TESTS
@@ -121,6 +160,15 @@ class TestStateManagement:
         assert state["key2"] == "value2"
         assert state["key3"] == "value3"
 
+    def test_state_view_is_live_and_read_only(self, context):
+        """Test state_view() reflects later writes without allowing mutation."""
+        view = context.state_view()
+        context.set("key1", "value1")
+
+        assert dict(view) == {"key1": "value1"}
+        with pytest.raises(TypeError):
+            view["key2"] = "value2"  # type: ignore[index]
+
     def test_overwrite_existing_value(self, context):
         """Test overwriting existing state value."""
         context.set("key", "original")
@@ -192,6 +240,15 @@ class TestStageTracking:
 
         assert completed == ["stage3", "stage1", "stage2"]
 
+    def test_remarking_stage_keeps_original_position(self, context):
+        """Test re-marking an earlier stage does not move it to the end."""
+        context.mark_stage_complete("ingestion")
+        context.mark_stage_complete("processing")
+        context.mark_stage_complete("ingestion")
+
+        assert context.get_completed_stages() == ["ingestion", "processing"]
+        assert context.to_checkpoint()["completed_stages"] == ["ingestion", "processing"]
+
 
 # ============================================================================
 # TIMING TRACKING TESTS
@@ -222,6 +279,19 @@ class TestTimingTracking:
         """Test total duration for pipeline with no stages."""
         assert context.get_total_duration() == 0.0
 
+    def test_untimed_stage_then_timed(self, context):
+        """Test an untimed stage reports no timing until a duration is recorded."""
+        context.mark_stage_complete("ingestion")
+        assert context.get_stage_timing("ingestion") is None
+        assert context.to_checkpoint()["stage_timings"] == {}
+
+        context.mark_stage_complete("processing", duration_seconds=1.0)
+        context.mark_stage_complete("ingestion", duration_seconds=2.5)
+
+        assert context.get_stage_timing("ingestion") == 2.5
+        assert context.get_completed_stages() == ["ingestion", "processing"]
+        assert context.get_total_duration() == 3.5
+
 
 # ============================================================================
 # METADATA TESTS
@@ -259,6 +329,51 @@ class TestMetadata:
 # CHECKPOINT TESTS
 # ============================================================================
 
+CHECKPOINT_BASE = {
+    "restaurant_code": "SDR",
+    "date": "2025-01-15",
+    "state": {},
+    "completed_stages": [],
+    "stage_timings": {},
+    "metadata": {},
+}
+
+# (checkpoint overrides, observation on restored context, expected observation)
+FROM_CHECKPOINT_CASES = [
+    pytest.param(
+        {
+            "restaurant_code": "T12",
+            "date": "2025-01-20",
+            "environment": "prod",
+            "dry_run": True,
+            "pipeline_id": "test-456",
+        },
+        lambda ctx: (ctx.restaurant_code, ctx.date, ctx.environment, ctx.dry_run, ctx.pipeline_id),
+        ("T12", "2025-01-20", "prod", True, "test-456"),
+        id="basic",
+    ),
+    pytest.param(
+        {"state": {"key1": "value1", "key2": "value2"}},
+        lambda ctx: (ctx.get("key1"), ctx.get("key2")),
+        ("value1", "value2"),
+        id="with_state",
+    ),
+    pytest.param(
+        {
+            "completed_stages": ["ingestion", "processing"],
+            "stage_timings": {"ingestion": 2.0, "processing": 3.0},
+        },
+        lambda ctx: (
+            ctx.get_completed_stages(),
+            ctx.get_stage_timing("ingestion"),
+            ctx.get_stage_timing("processing"),
+        ),
+        (["ingestion", "processing"], 2.0, 3.0),
+        id="with_completed_stages",
+    ),
+]
+
+
 class TestCheckpoint:
     """Test checkpoint serialization and deserialization."""
 
@@ -302,60 +417,12 @@ class TestCheckpoint:
         assert checkpoint["metadata"]["user"] == "admin"
         assert checkpoint["metadata"]["notes"] == "test run"
 
-    def test_from_checkpoint_basic(self, sample_config):
-        """Test restoring context from checkpoint."""
-        checkpoint = {
-            "restaurant_code": "T12",
-            "date": "2025-01-20",
-            "environment": "prod",
-            "dry_run": True,
-            "pipeline_id": "test-456",
-            "state": {},
-            "completed_stages": [],
-            "stage_timings": {},
-            "metadata": {}
-        }
+    @pytest.mark.parametrize("overrides, observe, expected", FROM_CHECKPOINT_CASES)
+    def test_from_checkpoint(self, sample_config, overrides, observe, expected):
+        """Test restoring context fields, state and stages from checkpoint."""
+        context = PipelineContext.from_checkpoint({**CHECKPOINT_BASE, **overrides}, sample_config)
 
-        context = PipelineContext.from_checkpoint(checkpoint, sample_config)
-
-        assert context.restaurant_code == "T12"
-        assert context.date == "2025-01-20"
-        assert context.environment == "prod"
-        assert context.dry_run is True
-        assert context.pipeline_id == "test-456"
-
-    def test_from_checkpoint_with_state(self, sample_config):
-        """Test restoring context with state."""
-        checkpoint = {
-            "restaurant_code": "SDR",
-            "date": "2025-01-15",
-            "state": {"key1": "value1", "key2": "value2"},
-            "completed_stages": [],
-            "stage_timings": {},
-            "metadata": {}
-        }
-
-        context = PipelineContext.from_checkpoint(checkpoint, sample_config)
-
-        assert context.get("key1") == "value1"
-        assert context.get("key2") == "value2"
-
-    def test_from_checkpoint_with_completed_stages(self, sample_config):
-        """Test restoring context with completed stages."""
-        checkpoint = {
-            "restaurant_code": "SDR",
-            "date": "2025-01-15",
-            "state": {},
-            "completed_stages": ["ingestion", "processing"],
-            "stage_timings": {"ingestion": 2.0, "processing": 3.0},
-            "metadata": {}
-        }
-
-        context = PipelineContext.from_checkpoint(checkpoint, sample_config)
-
-        assert context.get_completed_stages() == ["ingestion", "processing"]
-        assert context.get_stage_timing("ingestion") == 2.0
-        assert context.get_stage_timing("processing") == 3.0
+        assert observe(context) == expected
 
     def test_checkpoint_round_trip(self, context):
         """Test checkpoint serialization and deserialization round trip."""
@@ -379,6 +446,70 @@ class TestCheckpoint:
         assert restored.get_metadata("user") == "admin"
 
 
+# ============================================================================
+# COPY TESTS
+# ============================================================================
+
+class TestCopy:
+    """Test copy.copy() and pickle support."""
+
+    def test_copy_has_independent_state(self, context):
+        """Test writes to a copy do not leak back into the original."""
+        context.set("key1", "value1")
+        context.mark_stage_complete("ingestion", duration_seconds=1.0)
+        context.set_metadata("user", "admin")
+
+        clone = copy.copy(context)
+        clone.set("key2", "value2")
+        clone.mark_stage_complete("processing")
+        clone.set_metadata("user", "other")
+
+        assert clone.get_all_state() == {"key1": "value1", "key2": "value2"}
+        assert clone.get_stage_timing("ingestion") == 1.0
+        assert context.get_all_state() == {"key1": "value1"}
+        assert context.get_completed_stages() == ["ingestion"]
+        assert context.get_metadata("user") == "admin"
+        assert clone.config is context.config
+
+    def test_copy_preserves_subclass(self, sample_config):
+        """Test copying a subclass keeps its type and extra fields."""
+        context = TaggedContext(
+            restaurant_code="SDR", date="2025-01-15", config=sample_config, tag="replay"
+        )
+        context.set("key1", "value1")
+
+        clone = copy.copy(context)
+
+        assert type(clone) is TaggedContext
+        assert clone.tag == "replay"
+        assert clone.get_all_state() == {"key1": "value1"}
+
+    def test_pickle_round_trip_preserves_every_field(self, context):
+        """Test tuple-based pickle state covers all dataclass fields."""
+        context.set("key1", "value1")
+        context.mark_stage_complete("ingestion", duration_seconds=1.0)
+        context.set_metadata("user", "admin")
+
+        restored = pickle.loads(pickle.dumps(context))
+
+        assert len(context.__getstate__()) == len(dataclasses.fields(PipelineContext))
+        assert restored == context
+        assert copy.deepcopy(context) == context
+
+    def test_pickle_round_trip_preserves_subclass(self, sample_config):
+        """Test pickling a subclass keeps its type and extra fields."""
+        context = TaggedContext(
+            restaurant_code="SDR", date="2025-01-15", config=sample_config, tag="replay"
+        )
+        context.set("key1", "value1")
+
+        restored = pickle.loads(pickle.dumps(context))
+
+        assert type(restored) is TaggedContext
+        assert restored.tag == "replay"
+        assert restored == context
+
+
 # ============================================================================
 # SUMMARY TESTS
 # ============================================================================
@@ -1,8 +1,10 @@
 """Tests for IngestionStage"""
 
+import copy
+
 import pytest
+import numpy as np
 import pandas as pd
-import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -15,6 +17,90 @@ from pipeline.services.errors import IngestionError, ValidationError
 from pipeline.models.ingestion_result import IngestionResult
 
 
+# Small override frames, built once at import; tests only write them with to_csv
+_SPECIAL_LABOR_DF = pd.DataFrame({
+    'Employee': ['José García', 'François Müller'],
+    'Job Title': ['Server', 'Cook'],
+    'In Date': ['01/15/25 9:00 AM', '01/15/25 10:00 AM'],
+    'Out Date': ['01/15/25 5:00 PM', '01/15/25 6:00 PM'],
+    'Total Hours': [8.0, 8.0],
+    'Payable Hours': [8.0, 8.0]
+})
+
+_INVALID_LABOR_DF = pd.DataFrame({
+    'Employee': ['Alice'],
+    'Job Title': ['Server']
+    # Missing: In Date, Out Date, Total Hours, Payable Hours
+})
+
+_EMPTY_LABOR_DF = pd.DataFrame(
+    columns=['Employee', 'Job Title', 'In Date', 'Out Date', 'Total Hours', 'Payable Hours']
+)
+
+_SALES_MISSING_NET_DF = pd.DataFrame({
+    'Gross sales': [1000.0]
+    # Missing: Net sales
+})
+
+_SALES_NON_NUMERIC_DF = pd.DataFrame({
+    'Gross sales': [1000.0],
+    'Sales discounts': [50.0],
+    'Sales refunds': [25.0],
+    'Net sales': ['invalid']  # Non-numeric value
+})
+
+
+@pytest.fixture(scope="session")
+def csv_template(tmp_path_factory):
+    """Write the canonical valid CSV files once per session"""
+    template_dir = tmp_path_factory.mktemp("ingestion_csvs")
+
+    labor_df = pd.DataFrame({
+        'Employee': ['Alice', 'Bob'],
+        'Job Title': ['Server', 'Cook'],
+        'In Date': ['01/15/25 9:00 AM', '01/15/25 10:00 AM'],
+        'Out Date': ['01/15/25 5:00 PM', '01/15/25 6:00 PM'],
+        'Total Hours': [8.0, 8.0],
+        'Payable Hours': [8.0, 8.0]
+    })
+    labor_df.to_csv(template_dir / 'TimeEntries.csv', index=False)
+
+    sales_df = pd.DataFrame({
+        'Gross sales': [1000.0],
+        'Sales discounts': [50.0],
+        'Sales refunds': [25.0],
+        'Net sales': [925.0]
+    })
+    sales_df.to_csv(template_dir / 'Net sales summary.csv', index=False)
+
+    orders_df = pd.DataFrame({
+        'Order #': ['001', '002'],
+        'Opened': ['01/15/25 12:00 PM', '01/15/25 1:00 PM'],
+        'Server': ['Alice', 'Bob'],
+        'Amount': [45.0, 67.5]
+    })
+    orders_df.to_csv(template_dir / 'OrderDetails.csv', index=False)
+
+    return template_dir
+
+
+@pytest.fixture(scope="session")
+def large_labor_csv(tmp_path_factory):
+    """1000-row TimeEntries.csv, generated once from constant columns"""
+    rows = 1000
+    large_labor = pd.DataFrame({
+        'Employee': [f'Employee_{i}' for i in range(rows)],
+        'Job Title': np.full(rows, 'Server'),
+        'In Date': np.full(rows, '01/15/25 9:00 AM'),
+        'Out Date': np.full(rows, '01/15/25 5:00 PM'),
+        'Total Hours': np.full(rows, 8.0),
+        'Payable Hours': np.full(rows, 8.0)
+    })
+    path = tmp_path_factory.mktemp("large_labor") / 'TimeEntries.csv'
+    large_labor.to_csv(path, index=False)
+    return path
+
+
 class TestIngestionStage:
     """Test suite for IngestionStage"""
 
@@ -29,55 +115,36 @@ class TestIngestionStage:
         return IngestionStage(validator)
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory with test CSV files"""
-        temp_path = tempfile.mkdtemp()
-        temp_dir = Path(temp_path)
-
-        # Create valid test CSV files
-        labor_df = pd.DataFrame({
-            'Employee': ['Alice', 'Bob'],
-            'Job Title': ['Server', 'Cook'],
-            'In Date': ['01/15/25 9:00 AM', '01/15/25 10:00 AM'],
-            'Out Date': ['01/15/25 5:00 PM', '01/15/25 6:00 PM'],
-            'Total Hours': [8.0, 8.0],
-            'Payable Hours': [8.0, 8.0]
-        })
-        labor_df.to_csv(temp_dir / 'TimeEntries.csv', index=False)
-
-        sales_df = pd.DataFrame({
-            'Gross sales': [1000.0],
-            'Sales discounts': [50.0],
-            'Sales refunds': [25.0],
-            'Net sales': [925.0]
-        })
-        sales_df.to_csv(temp_dir / 'Net sales summary.csv', index=False)
-
-        orders_df = pd.DataFrame({
-            'Order #': ['001', '002'],
-            'Opened': ['01/15/25 12:00 PM', '01/15/25 1:00 PM'],
-            'Server': ['Alice', 'Bob'],
-            'Amount': [45.0, 67.5]
-        })
-        orders_df.to_csv(temp_dir / 'OrderDetails.csv', index=False)
-
-        yield temp_dir
-
-        # Cleanup
-        shutil.rmtree(temp_path)
+    def temp_dir(self, csv_template, tmp_path):
+        """Per-test copy of the canonical CSV files (safe to delete/overwrite)"""
+        for template_file in csv_template.iterdir():
+            shutil.copyfile(template_file, tmp_path / template_file.name)
+        return tmp_path
 
     @pytest.fixture
-    def valid_context(self, temp_dir):
-        """Create PipelineContext with valid inputs"""
-        context = PipelineContext(
+    def make_context(self, temp_dir):
+        """Factory for PipelineContexts with valid inputs (kwargs override state)"""
+        base = PipelineContext(
             restaurant_code='SDR',
             date='2025-01-15',
             config={}  # Empty config for testing
         )
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
-        return context
+        base.set('date', '2025-01-15')
+        base.set('restaurant', 'SDR')
+        base.set('data_path', str(temp_dir))
+
+        def _make(**overrides):
+            context = copy.copy(base)
+            for key, value in overrides.items():
+                context.set(key, value)
+            return context
+
+        return _make
+
+    @pytest.fixture
+    def valid_context(self, make_context):
+        """Create PipelineContext with valid inputs"""
+        return make_context()
 
     # Initialization tests
 
@@ -155,6 +222,17 @@ class TestIngestionStage:
         assert 'validation_level' in metadata
         assert metadata['validation_level'] == 'L2'
 
+    def test_execute_reads_each_csv_once(self, stage, valid_context):
+        """Test each present CSV is parsed exactly once (no probe-then-reload)"""
+        with patch.object(CSVDataSource, 'get_csv', autospec=True,
+                          side_effect=CSVDataSource.get_csv) as get_csv:
+            result = stage.execute(valid_context)
+
+        assert result.is_ok()
+        loaded = [c.args[1] for c in get_csv.call_args_list]
+        for filename in stage.REQUIRED_FILES.values():
+            assert loaded.count(filename) == 1
+
     # Missing context input tests
 
     def test_execute_missing_date(self, stage, temp_dir):
@@ -199,15 +277,12 @@ class TestIngestionStage:
 
     # Missing file tests
 
-    def test_execute_missing_labor_file(self, stage, temp_dir):
+    def test_execute_missing_labor_file(self, stage, temp_dir, make_context):
         """Test error when TimeEntries.csv is missing"""
         # Remove labor file
         (temp_dir / 'TimeEntries.csv').unlink()
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -216,14 +291,11 @@ class TestIngestionStage:
         assert isinstance(error, IngestionError)
         assert 'timeentries' in str(error).lower()
 
-    def test_execute_missing_sales_file(self, stage, temp_dir):
+    def test_execute_missing_sales_file(self, stage, temp_dir, make_context):
         """Test error when Net sales summary.csv is missing"""
         (temp_dir / 'Net sales summary.csv').unlink()
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -231,36 +303,47 @@ class TestIngestionStage:
         error_str = str(result.unwrap_err()).lower()
         assert 'sales' in error_str  # Check for 'sales' data type
 
-    def test_execute_missing_orders_file(self, stage, temp_dir):
+    def test_execute_missing_orders_file(self, stage, temp_dir, make_context):
         """Test error when OrderDetails.csv is missing"""
         (temp_dir / 'OrderDetails.csv').unlink()
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
         assert result.is_err()
         assert 'orderdetails' in str(result.unwrap_err()).lower()
 
+    def test_execute_unparseable_required_file(self, stage, temp_dir, make_context):
+        """Test a present but unparseable required file is reported as a load failure"""
+        (temp_dir / 'OrderDetails.csv').write_text('Order #,Table\n"unclosed,2\n')
+
+        result = stage.execute(make_context())
+
+        assert result.is_err()
+        assert 'Failed to load required file: OrderDetails.csv' in str(result.unwrap_err())
+
+    def test_execute_skips_optional_files_after_required_failure(self, stage, temp_dir, make_context):
+        """Test optional files are not read once a required file has failed"""
+        (temp_dir / 'TimeEntries.csv').unlink()
+
+        with patch.object(CSVDataSource, 'get_csv', autospec=True,
+                          side_effect=CSVDataSource.get_csv) as get_csv:
+            result = stage.execute(make_context())
+
+        assert result.is_err()
+        assert 'Failed to find required file for labor' in str(result.unwrap_err())
+        loaded = {c.args[1] for c in get_csv.call_args_list}
+        assert loaded.isdisjoint(stage.OPTIONAL_FILES.values())
+
     # L1 Validation failure tests
 
-    def test_execute_l1_validation_failure_missing_column(self, stage, temp_dir):
+    def test_execute_l1_validation_failure_missing_column(self, stage, temp_dir, make_context):
         """Test L1 validation failure when required column is missing"""
         # Create invalid labor file (missing required columns)
-        invalid_labor = pd.DataFrame({
-            'Employee': ['Alice'],
-            'Job Title': ['Server']
-            # Missing: In Date, Out Date, Total Hours, Payable Hours
-        })
-        invalid_labor.to_csv(temp_dir / 'TimeEntries.csv', index=False)
+        _INVALID_LABOR_DF.to_csv(temp_dir / 'TimeEntries.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -268,16 +351,12 @@ class TestIngestionStage:
         error = result.unwrap_err()
         assert isinstance(error, ValidationError)
 
-    def test_execute_l1_validation_failure_empty_dataframe(self, stage, temp_dir):
+    def test_execute_l1_validation_failure_empty_dataframe(self, stage, temp_dir, make_context):
         """Test L1 validation failure when DataFrame is empty"""
         # Create empty labor file
-        empty_labor = pd.DataFrame(columns=['Employee', 'Job Title', 'In Date', 'Out Date', 'Total Hours', 'Payable Hours'])
-        empty_labor.to_csv(temp_dir / 'TimeEntries.csv', index=False)
+        _EMPTY_LABOR_DF.to_csv(temp_dir / 'TimeEntries.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -288,38 +367,22 @@ class TestIngestionStage:
 
     # Sales extraction tests
 
-    def test_execute_sales_extraction_error_missing_column(self, stage, temp_dir):
+    def test_execute_sales_extraction_error_missing_column(self, stage, temp_dir, make_context):
         """Test error when Net sales column is missing"""
-        invalid_sales = pd.DataFrame({
-            'Gross sales': [1000.0]
-            # Missing: Net sales
-        })
-        invalid_sales.to_csv(temp_dir / 'Net sales summary.csv', index=False)
+        _SALES_MISSING_NET_DF.to_csv(temp_dir / 'Net sales summary.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
         # This should fail L1 validation first
         assert result.is_err()
 
-    def test_execute_sales_extraction_non_numeric(self, stage, temp_dir):
+    def test_execute_sales_extraction_non_numeric(self, stage, temp_dir, make_context):
         """Test error when sales value is not numeric"""
-        invalid_sales = pd.DataFrame({
-            'Gross sales': [1000.0],
-            'Sales discounts': [50.0],
-            'Sales refunds': [25.0],
-            'Net sales': ['invalid']  # Non-numeric value
-        })
-        invalid_sales.to_csv(temp_dir / 'Net sales summary.csv', index=False)
+        _SALES_NON_NUMERIC_DF.to_csv(temp_dir / 'Net sales summary.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -342,12 +405,9 @@ class TestIngestionStage:
 
     # Integration with PipelineContext
 
-    def test_execute_context_unchanged_on_error(self, stage, temp_dir):
+    def test_execute_context_unchanged_on_error(self, stage, temp_dir, make_context):
         """Test that context is not modified when execution fails"""
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
         context.set('existing_key', 'existing_value')
 
         # Remove a required file to cause failure
@@ -380,23 +440,13 @@ class TestIngestionStage:
 
     # Edge cases
 
-    def test_execute_with_large_csv_files(self, stage, temp_dir):
+    def test_execute_with_large_csv_files(
+        self, stage, temp_dir, large_labor_csv, make_context
+    ):
         """Test execution with large CSV files"""
-        # Create large DataFrames
-        large_labor = pd.DataFrame({
-            'Employee': [f'Employee_{i}' for i in range(1000)],
-            'Job Title': ['Server'] * 1000,
-            'In Date': ['01/15/25 9:00 AM'] * 1000,
-            'Out Date': ['01/15/25 5:00 PM'] * 1000,
-            'Total Hours': [8.0] * 1000,
-            'Payable Hours': [8.0] * 1000
-        })
-        large_labor.to_csv(temp_dir / 'TimeEntries.csv', index=False)
+        shutil.copyfile(large_labor_csv, temp_dir / 'TimeEntries.csv')
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -405,22 +455,11 @@ class TestIngestionStage:
         dfs = context.get('raw_dataframes')
         assert len(dfs['labor']) == 1000
 
-    def test_execute_with_special_characters_in_data(self, stage, temp_dir):
+    def test_execute_with_special_characters_in_data(self, stage, temp_dir, make_context):
         """Test execution with special characters in CSV data"""
-        special_labor = pd.DataFrame({
-            'Employee': ['José García', 'François Müller'],
-            'Job Title': ['Server', 'Cook'],
-            'In Date': ['01/15/25 9:00 AM', '01/15/25 10:00 AM'],
-            'Out Date': ['01/15/25 5:00 PM', '01/15/25 6:00 PM'],
-            'Total Hours': [8.0, 8.0],
-            'Payable Hours': [8.0, 8.0]
-        })
-        special_labor.to_csv(temp_dir / 'TimeEntries.csv', index=False)
+        _SPECIAL_LABOR_DF.to_csv(temp_dir / 'TimeEntries.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -436,16 +475,13 @@ class TestIngestionStage:
 
     # Protocol compliance test
 
-    def test_pipeline_stage_protocol_compliance(self, stage):
+    def test_pipeline_stage_protocol_compliance(self, stage, make_context):
         """Test that IngestionStage has execute method with correct signature"""
         assert hasattr(stage, 'execute')
         assert callable(stage.execute)
 
         # Test that execute returns Result[PipelineContext]
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', '/invalid/path')
+        context = make_context(data_path='/invalid/path')
 
         result = stage.execute(context)
         assert hasattr(result, 'is_ok')
@@ -458,7 +494,7 @@ class TestIngestionStage:
         assert 'payroll' in stage.OPTIONAL_FILES
         assert stage.OPTIONAL_FILES['payroll'] == 'PayrollExport.csv'
 
-    def test_execute_with_payroll_export(self, stage, temp_dir):
+    def test_execute_with_payroll_export(self, stage, temp_dir, make_context):
         """Test successful execution with PayrollExport file present"""
         # Add PayrollExport file
         payroll_df = pd.DataFrame({
@@ -473,10 +509,7 @@ class TestIngestionStage:
         })
         payroll_df.to_csv(temp_dir / 'PayrollExport.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -493,13 +526,10 @@ class TestIngestionStage:
         total_payroll = context.get('total_payroll_cost')
         assert total_payroll == 220.0  # 100 + 120
 
-    def test_execute_without_payroll_export(self, stage, temp_dir):
+    def test_execute_without_payroll_export(self, stage, make_context):
         """Test successful execution when PayrollExport is missing (optional)"""
         # Don't add PayrollExport file
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -514,7 +544,7 @@ class TestIngestionStage:
         # Total payroll cost should not be in context
         assert not context.has('total_payroll_cost')
 
-    def test_execute_with_payroll_export_date_suffix(self, stage, temp_dir):
+    def test_execute_with_payroll_export_date_suffix(self, stage, temp_dir, make_context):
         """Test PayrollExport loading with date suffix in filename"""
         # Add PayrollExport with date suffix
         payroll_df = pd.DataFrame({
@@ -529,10 +559,7 @@ class TestIngestionStage:
         })
         payroll_df.to_csv(temp_dir / 'PayrollExport_2025_01_15.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -545,7 +572,7 @@ class TestIngestionStage:
         assert len(dfs['payroll']) == 1
         assert context.get('total_payroll_cost') == 100.0
 
-    def test_payroll_summary_with_nan_values(self, stage, temp_dir):
+    def test_payroll_summary_with_nan_values(self, stage, temp_dir, make_context):
         """Test payroll summary calculation with NaN values"""
         # Add PayrollExport with some NaN values
         payroll_df = pd.DataFrame({
@@ -560,10 +587,7 @@ class TestIngestionStage:
         })
         payroll_df.to_csv(temp_dir / 'PayrollExport.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -574,7 +598,7 @@ class TestIngestionStage:
         total_payroll = context.get('total_payroll_cost')
         assert total_payroll == 220.0  # 100 + 120 + 0
 
-    def test_payroll_summary_with_empty_dataframe(self, stage, temp_dir):
+    def test_payroll_summary_with_empty_dataframe(self, stage, temp_dir, make_context):
         """Test payroll summary when DataFrame is empty"""
         # Add empty PayrollExport file
         payroll_df = pd.DataFrame(columns=[
@@ -583,10 +607,7 @@ class TestIngestionStage:
         ])
         payroll_df.to_csv(temp_dir / 'PayrollExport.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -597,7 +618,7 @@ class TestIngestionStage:
         # Empty payroll should not set total_payroll_cost
         assert not context.has('total_payroll_cost')
 
-    def test_payroll_summary_missing_total_pay_column(self, stage, temp_dir):
+    def test_payroll_summary_missing_total_pay_column(self, stage, temp_dir, make_context):
         """Test payroll summary when Total Pay column is missing"""
         # Add PayrollExport without Total Pay column
         payroll_df = pd.DataFrame({
@@ -610,10 +631,7 @@ class TestIngestionStage:
         })
         payroll_df.to_csv(temp_dir / 'PayrollExport.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -626,7 +644,7 @@ class TestIngestionStage:
         assert 'payroll' in dfs
         assert not context.has('total_payroll_cost')
 
-    def test_payroll_metadata_tracked(self, stage, temp_dir):
+    def test_payroll_metadata_tracked(self, stage, temp_dir, make_context):
         """Test that PayrollExport presence is tracked in metadata"""
         # Add PayrollExport file
         payroll_df = pd.DataFrame({
@@ -641,10 +659,7 @@ class TestIngestionStage:
         })
         payroll_df.to_csv(temp_dir / 'PayrollExport.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
         context = result.unwrap()
@@ -656,7 +671,7 @@ class TestIngestionStage:
         assert 'optional_files_present' in metadata
         assert 'payroll' in metadata['optional_files_present']
 
-    def test_payroll_with_zero_values(self, stage, temp_dir):
+    def test_payroll_with_zero_values(self, stage, temp_dir, make_context):
         """Test payroll summary with zero pay values"""
         # Add PayrollExport with zero pay
         payroll_df = pd.DataFrame({
@@ -671,10 +686,7 @@ class TestIngestionStage:
         })
         payroll_df.to_csv(temp_dir / 'PayrollExport.csv', index=False)
 
-        context = PipelineContext(restaurant_code='SDR', date='2025-01-15', config={})
-        context.set('date', '2025-01-15')
-        context.set('restaurant', 'SDR')
-        context.set('data_path', str(temp_dir))
+        context = make_context()
 
         result = stage.execute(context)
 
@@ -15,22 +15,48 @@ Note: Refactored in Week 4 Day 7 to use DailyLaborPatternManager instead of Patt
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
 
-from pipeline.stages.pattern_learning_stage import PatternLearningStage
+from pipeline.stages.pattern_learning_stage import PatternLearningStage, _parse_business_date
 from pipeline.services.labor_calculator import LaborMetrics
 from pipeline.orchestration.pipeline import PipelineContext
 from pipeline.services.result import Result
 from pipeline.models.daily_labor_pattern import DailyLaborPattern
-from pipeline.services.patterns.daily_labor_manager import DailyLaborPatternManager
 
 
-def create_mock_pattern(confidence=0.75, observations=5):
-    """Create a mock pattern with numeric attributes for logging."""
-    mock_pattern = Mock()
-    mock_pattern.confidence = confidence
-    mock_pattern.observations = observations
-    return mock_pattern
+# Real (frozen) pattern built once at import; cheaper than a Mock per test and
+# safe to share because nothing can mutate it.
+_LEARNED_PATTERN = DailyLaborPattern(
+    restaurant_code="SDR",
+    day_of_week=2,
+    expected_labor_percentage=25.0,
+    expected_total_hours=100.0,
+    confidence=0.75,
+    observations=5,
+    last_updated="2025-01-15T00:00:00",
+    created_at="2025-01-15T00:00:00",
+)
+
+# Result is frozen too, so every success case can share one instance
+_OK_RESULT = Result.ok(_LEARNED_PATTERN)
+
+
+@dataclass
+class StubPatternManager:
+    """
+    Stand-in for DailyLaborPatternManager.
+
+    The stage only calls learn_pattern(**kwargs); this returns a fixed
+    Result and records each call's kwargs, without Mock's per-attribute
+    child-mock machinery.
+    """
+    returns: Result = _OK_RESULT
+    calls: List[Dict[str, Any]] = field(default_factory=list)
+
+    def learn_pattern(self, **kwargs) -> Result:
+        self.calls.append(kwargs)
+        return self.returns
 
 
 # ============================================================================
@@ -61,15 +87,15 @@ def sample_labor_metrics():
 
 
 @pytest.fixture
-def mock_pattern_manager():
-    """Mock DailyLaborPatternManager for testing."""
-    return Mock(spec=DailyLaborPatternManager)
+def pattern_manager():
+    """Stub DailyLaborPatternManager for testing."""
+    return StubPatternManager()
 
 
 @pytest.fixture
-def pattern_learning_stage(mock_pattern_manager):
-    """PatternLearningStage with mocked PatternManager."""
-    return PatternLearningStage(mock_pattern_manager)
+def pattern_learning_stage(pattern_manager):
+    """PatternLearningStage with stubbed PatternManager."""
+    return PatternLearningStage(pattern_manager)
 
 
 @pytest.fixture
@@ -91,11 +117,10 @@ def context_with_metrics(sample_config, sample_labor_metrics):
 class TestSuccessfulPatternLearning:
     """Test successful pattern learning scenarios."""
 
-    def test_learn_pattern_successfully(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_learn_pattern_successfully(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test successful pattern learning."""
-        # Setup mock to return successful pattern
-        mock_pattern = create_mock_pattern()  # Use helper for proper numeric attributes
-        mock_pattern_manager.learn_pattern.return_value = Result.ok(mock_pattern)
+        # Setup stub to return successful pattern
+        pattern_manager.returns = _OK_RESULT
 
         # Execute stage
         result = pattern_learning_stage.execute(context_with_metrics)
@@ -105,25 +130,25 @@ class TestSuccessfulPatternLearning:
         updated_context = result.unwrap()
         assert updated_context.has('learned_patterns')
         assert len(updated_context.get('learned_patterns')) == 1
-        assert updated_context.get('learned_patterns')[0] == mock_pattern
+        assert updated_context.get('learned_patterns')[0] == _LEARNED_PATTERN
 
-    def test_pattern_manager_called_correctly(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_pattern_manager_called_correctly(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test DailyLaborPatternManager is called with correct arguments."""
-        mock_pattern_manager.learn_pattern.return_value = Result.ok(create_mock_pattern())
+        pattern_manager.returns = _OK_RESULT
 
         pattern_learning_stage.execute(context_with_metrics)
 
         # Verify DailyLaborPatternManager.learn_pattern was called
-        mock_pattern_manager.learn_pattern.assert_called_once()
-        call_args = mock_pattern_manager.learn_pattern.call_args
-        assert call_args.kwargs['restaurant_code'] == 'SDR'
-        assert call_args.kwargs['day_of_week'] == 2  # 2025-01-15 is Wednesday (day 2)
-        assert call_args.kwargs['observed_labor_percentage'] == 25.0  # labor_percentage
-        assert call_args.kwargs['observed_total_hours'] == 100.0  # total_hours
-
-    def test_stores_empty_warnings_on_success(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+        assert len(pattern_manager.calls) == 1
+        call_kwargs = pattern_manager.calls[0]
+        assert call_kwargs['restaurant_code'] == 'SDR'
+        assert call_kwargs['day_of_week'] == 2  # 2025-01-15 is Wednesday (day 2)
+        assert call_kwargs['observed_labor_percentage'] == 25.0  # labor_percentage
+        assert call_kwargs['observed_total_hours'] == 100.0  # total_hours
+
+    def test_stores_empty_warnings_on_success(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test stores empty warnings list on successful learning."""
-        mock_pattern_manager.learn_pattern.return_value = Result.ok(create_mock_pattern())
+        pattern_manager.returns = _OK_RESULT
 
         result = pattern_learning_stage.execute(context_with_metrics)
 
@@ -132,6 +157,18 @@ class TestSuccessfulPatternLearning:
         assert updated_context.has('pattern_warnings')
         assert len(updated_context.get('pattern_warnings')) == 0
 
+    def test_business_date_parsed_once(self, pattern_learning_stage, context_with_metrics, pattern_manager):
+        """Test daily and timeslot learning share one parse of context.date."""
+        _parse_business_date.cache_clear()
+        context_with_metrics.set('graded_timeslots', [])
+        pattern_manager.returns = _OK_RESULT
+
+        pattern_learning_stage.execute(context_with_metrics)
+
+        info = _parse_business_date.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
 
 # ============================================================================
 # RESILIENT ERROR HANDLING TESTS
@@ -140,10 +177,10 @@ class TestSuccessfulPatternLearning:
 class TestResilientErrorHandling:
     """Test resilient error handling (failures don't block pipeline)."""
 
-    def test_pattern_learning_failure_returns_success(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_pattern_learning_failure_returns_success(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test pattern learning failure still returns success (resilient)."""
-        # Setup mock to return error
-        mock_pattern_manager.learn_pattern.return_value = Result.fail(ValueError("Pattern learning failed"))
+        # Setup stub to return error
+        pattern_manager.returns = Result.fail(ValueError("Pattern learning failed"))
 
         # Execute stage
         result = pattern_learning_stage.execute(context_with_metrics)
@@ -151,9 +188,9 @@ class TestResilientErrorHandling:
         # Should still return success (resilient)
         assert result.is_ok()
 
-    def test_pattern_learning_failure_logs_warning(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_pattern_learning_failure_logs_warning(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test pattern learning failure logs warning in context."""
-        mock_pattern_manager.learn_pattern.return_value = Result.fail(ValueError("Test error"))
+        pattern_manager.returns = Result.fail(ValueError("Test error"))
 
         result = pattern_learning_stage.execute(context_with_metrics)
 
@@ -164,9 +201,9 @@ class TestResilientErrorHandling:
         assert 'Failed to learn daily labor pattern' in warnings[0]
         assert 'Test error' in warnings[0]
 
-    def test_pattern_learning_failure_stores_empty_patterns(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_pattern_learning_failure_stores_empty_patterns(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test pattern learning failure stores empty patterns list."""
-        mock_pattern_manager.learn_pattern.return_value = Result.fail(ValueError("Test error"))
+        pattern_manager.returns = Result.fail(ValueError("Test error"))
 
         result = pattern_learning_stage.execute(context_with_metrics)
 
@@ -182,7 +219,7 @@ class TestResilientErrorHandling:
 class TestMissingInputHandling:
     """Test handling of missing inputs from context."""
 
-    def test_missing_labor_metrics(self, pattern_learning_stage, sample_config, mock_pattern_manager):
+    def test_missing_labor_metrics(self, pattern_learning_stage, sample_config, pattern_manager):
         """Test handling when labor_metrics missing from context."""
         context = PipelineContext(
             restaurant_code="SDR",
@@ -204,9 +241,9 @@ class TestMissingInputHandling:
         assert 'labor_metrics not found' in warnings[0]
 
         # Should not call pattern manager
-        mock_pattern_manager.learn_pattern.assert_not_called()
+        assert pattern_manager.calls == []
 
-    def test_missing_labor_metrics_stores_empty_patterns(self, pattern_learning_stage, sample_config, mock_pattern_manager):
+    def test_missing_labor_metrics_stores_empty_patterns(self, pattern_learning_stage, sample_config, pattern_manager):
         """Test missing labor_metrics stores empty patterns list."""
         context = PipelineContext(
             restaurant_code="SDR",
@@ -228,7 +265,7 @@ class TestMissingInputHandling:
 class TestInvalidInputTypeHandling:
     """Test handling of invalid input types."""
 
-    def test_invalid_labor_metrics_type(self, pattern_learning_stage, sample_config, mock_pattern_manager):
+    def test_invalid_labor_metrics_type(self, pattern_learning_stage, sample_config, pattern_manager):
         """Test handling when labor_metrics has wrong type."""
         context = PipelineContext(
             restaurant_code="SDR",
@@ -250,7 +287,7 @@ class TestInvalidInputTypeHandling:
         assert 'wrong type' in warnings[0]
 
         # Should not call pattern manager
-        mock_pattern_manager.learn_pattern.assert_not_called()
+        assert pattern_manager.calls == []
 
 
 # ============================================================================
@@ -260,19 +297,19 @@ class TestInvalidInputTypeHandling:
 class TestContextIntegration:
     """Test integration with PipelineContext."""
 
-    def test_preserves_existing_context_data(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_preserves_existing_context_data(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test stage preserves existing context data."""
         context_with_metrics.set('existing_key', 'existing_value')
-        mock_pattern_manager.learn_pattern.return_value = Result.ok(create_mock_pattern())
+        pattern_manager.returns = _OK_RESULT
 
         result = pattern_learning_stage.execute(context_with_metrics)
 
         updated_context = result.unwrap()
         assert updated_context.get('existing_key') == 'existing_value'
 
-    def test_returns_same_context_object(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_returns_same_context_object(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test stage returns the same context object (mutated)."""
-        mock_pattern_manager.learn_pattern.return_value = Result.ok(create_mock_pattern())
+        pattern_manager.returns = _OK_RESULT
 
         result = pattern_learning_stage.execute(context_with_metrics)
 
@@ -292,8 +329,7 @@ class TestRepr:
         repr_str = repr(pattern_learning_stage)
 
         assert 'PatternLearningStage' in repr_str
-        # Mock's spec creates a PatternManager instance, so check for that
-        assert 'PatternManager' in repr_str or 'Mock' in repr_str
+        assert 'StubPatternManager' in repr_str
 
 
 # ============================================================================
@@ -308,16 +344,16 @@ class TestPipelineStageProtocol:
         assert hasattr(pattern_learning_stage, 'execute')
         assert callable(pattern_learning_stage.execute)
 
-    def test_execute_accepts_context(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_execute_accepts_context(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test execute accepts PipelineContext."""
-        mock_pattern_manager.learn_pattern.return_value = Result.ok(create_mock_pattern())
+        pattern_manager.returns = _OK_RESULT
 
         result = pattern_learning_stage.execute(context_with_metrics)
         assert isinstance(result, Result)
 
-    def test_execute_returns_result_context(self, pattern_learning_stage, context_with_metrics, mock_pattern_manager):
+    def test_execute_returns_result_context(self, pattern_learning_stage, context_with_metrics, pattern_manager):
         """Test execute returns Result[PipelineContext]."""
-        mock_pattern_manager.learn_pattern.return_value = Result.ok(create_mock_pattern())
+        pattern_manager.returns = _OK_RESULT
 
         result = pattern_learning_stage.execute(context_with_metrics)
 
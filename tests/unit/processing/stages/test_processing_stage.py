@@ -13,6 +13,8 @@ Tests:
 Coverage Goal: 100%
 """
 
+import copy
+
 import pytest
 
 from pipeline.stages.processing_stage import ProcessingStage
@@ -22,13 +24,28 @@ from pipeline.models.labor_dto import LaborDTO
 from pipeline.services.result import Result
 
 
+# LaborDTO is a frozen dataclass, so the default sample is built once at import
+_SAMPLE_LABOR_DTO = LaborDTO(
+    restaurant_code="SDR",
+    business_date="2025-01-15",
+    total_hours_worked=100.0,
+    total_labor_cost=1250.0,
+    employee_count=10,
+    total_regular_hours=90.0,
+    total_overtime_hours=10.0,
+    total_regular_cost=1125.0,
+    total_overtime_cost=125.0,
+    average_hourly_rate=12.50
+)
+
+
 # ============================================================================
 # FIXTURES
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_config():
-    """Sample configuration dictionary."""
+    """Sample configuration dictionary (shared; tests must not mutate it)."""
     return {
         "restaurant": {"code": "SDR", "name": "Sandra's"},
         "labor": {
@@ -38,46 +55,50 @@ def sample_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def calculator():
-    """LaborCalculator for testing."""
+    """LaborCalculator for testing (stateless after __init__, so shared)."""
     return LaborCalculator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def processing_stage(calculator):
-    """ProcessingStage with calculator."""
+    """ProcessingStage with calculator (holds no per-run state)."""
     return ProcessingStage(calculator)
 
 
 @pytest.fixture
 def sample_labor_dto():
-    """Sample labor DTO."""
-    return LaborDTO(
-        restaurant_code="SDR",
-        business_date="2025-01-15",
-        total_hours_worked=100.0,
-        total_labor_cost=1250.0,
-        employee_count=10,
-        total_regular_hours=90.0,
-        total_overtime_hours=10.0,
-        total_regular_cost=1125.0,
-        total_overtime_cost=125.0,
-        average_hourly_rate=12.50
-    )
+    """Sample labor DTO (frozen, so one shared instance)."""
+    return _SAMPLE_LABOR_DTO
 
 
-@pytest.fixture
-def context_with_data(sample_config, sample_labor_dto):
-    """Pipeline context with labor_dto and sales."""
-    context = PipelineContext(
+@pytest.fixture(scope="module")
+def context_template(sample_config):
+    """Empty SDR context built once; tests get copies via make_context."""
+    return PipelineContext(
         restaurant_code="SDR",
         date="2025-01-15",
         config=sample_config
     )
-    context.set('labor_dto', sample_labor_dto)
-    context.set('sales', 5000.0)
-    return context
+
+
+@pytest.fixture
+def make_context(context_template):
+    """Factory for independent PipelineContexts (kwargs become state)."""
+    def _make(**state):
+        context = copy.copy(context_template)
+        for key, value in state.items():
+            context.set(key, value)
+        return context
+
+    return _make
+
+
+@pytest.fixture
+def context_with_data(make_context, sample_labor_dto):
+    """Pipeline context with labor_dto and sales."""
+    return make_context(labor_dto=sample_labor_dto, sales=5000.0)
 
 
 # ============================================================================
@@ -127,28 +148,23 @@ class TestBasicExecution:
         # Should be the same object reference
         assert updated_context is context_with_data
 
-    def test_execute_with_different_sales_values(self, processing_stage, sample_config, sample_labor_dto):
+    @pytest.mark.parametrize("sales, expected_percentage, expected_status", [
+        (10000.0, 12.5, 'EXCELLENT'),
+        (5000.0, 25.0, 'GOOD'),
+        (3000.0, 41.67, 'SEVERE'),
+    ])
+    def test_execute_with_different_sales_values(
+        self, processing_stage, make_context, sample_labor_dto,
+        sales, expected_percentage, expected_status
+    ):
         """Test execution with various sales values."""
-        test_cases = [
-            (10000.0, 12.5, 'EXCELLENT'),
-            (5000.0, 25.0, 'GOOD'),
-            (3000.0, 41.67, 'SEVERE'),
-        ]
-
-        for sales, expected_percentage, expected_status in test_cases:
-            context = PipelineContext(
-                restaurant_code="SDR",
-                date="2025-01-15",
-                config=sample_config
-            )
-            context.set('labor_dto', sample_labor_dto)
-            context.set('sales', sales)
+        context = make_context(labor_dto=sample_labor_dto, sales=sales)
 
-            result = processing_stage.execute(context)
-            assert result.is_ok()
-            metrics = result.unwrap().get('labor_metrics')
-            assert abs(metrics.labor_percentage - expected_percentage) < 0.1
-            assert metrics.status == expected_status
+        result = processing_stage.execute(context)
+        assert result.is_ok()
+        metrics = result.unwrap().get('labor_metrics')
+        assert abs(metrics.labor_percentage - expected_percentage) < 0.1
+        assert metrics.status == expected_status
 
 
 # ============================================================================
@@ -158,77 +174,33 @@ class TestBasicExecution:
 class TestInputValidation:
     """Test input validation and error handling."""
 
-    def test_missing_labor_dto_error(self, processing_stage, sample_config):
-        """Test error when labor_dto missing from context."""
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('sales', 5000.0)  # Sales present, but no labor_dto
-
-        result = processing_stage.execute(context)
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert 'labor_dto not found' in str(error)
-
-    def test_missing_sales_error(self, processing_stage, sample_config, sample_labor_dto):
-        """Test error when sales missing from context."""
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('labor_dto', sample_labor_dto)  # Labor DTO present, but no sales
-
-        result = processing_stage.execute(context)
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert 'sales not found' in str(error)
-
-    def test_invalid_labor_dto_type_error(self, processing_stage, sample_config):
-        """Test error when labor_dto is wrong type."""
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('labor_dto', {'invalid': 'dict'})  # Wrong type!
-        context.set('sales', 5000.0)
-
-        result = processing_stage.execute(context)
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert 'must be LaborDTO' in str(error)
-
-    def test_invalid_sales_type_error(self, processing_stage, sample_config, sample_labor_dto):
-        """Test error when sales is wrong type."""
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('labor_dto', sample_labor_dto)
-        context.set('sales', 'invalid')  # Wrong type!
+    @pytest.mark.parametrize("state, expected_message", [
+        pytest.param({'sales': 5000.0}, 'labor_dto not found', id="missing_labor_dto"),
+        pytest.param({'labor_dto': _SAMPLE_LABOR_DTO}, 'sales not found', id="missing_sales"),
+        pytest.param(
+            {'labor_dto': {'invalid': 'dict'}, 'sales': 5000.0},
+            'must be LaborDTO',
+            id="invalid_labor_dto_type",
+        ),
+        pytest.param(
+            {'labor_dto': _SAMPLE_LABOR_DTO, 'sales': 'invalid'},
+            'must be numeric',
+            id="invalid_sales_type",
+        ),
+    ])
+    def test_invalid_inputs_error(self, processing_stage, make_context, state, expected_message):
+        """Test error when labor_dto/sales are missing or the wrong type."""
+        context = make_context(**state)
 
         result = processing_stage.execute(context)
 
         assert result.is_err()
         error = result.unwrap_err()
-        assert 'must be numeric' in str(error)
+        assert expected_message in str(error)
 
-    def test_sales_as_integer_works(self, processing_stage, sample_config, sample_labor_dto):
+    def test_sales_as_integer_works(self, processing_stage, make_context, sample_labor_dto):
         """Test sales can be integer (not just float)."""
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('labor_dto', sample_labor_dto)
-        context.set('sales', 5000)  # Integer, not float
+        context = make_context(labor_dto=sample_labor_dto, sales=5000)  # Integer, not float
 
         result = processing_stage.execute(context)
 
@@ -244,15 +216,9 @@ class TestInputValidation:
 class TestErrorPropagation:
     """Test error propagation from LaborCalculator."""
 
-    def test_propagate_zero_sales_error(self, processing_stage, sample_config, sample_labor_dto):
+    def test_propagate_zero_sales_error(self, processing_stage, make_context, sample_labor_dto):
         """Test propagation of zero sales error from calculator."""
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('labor_dto', sample_labor_dto)
-        context.set('sales', 0.0)  # Zero sales
+        context = make_context(labor_dto=sample_labor_dto, sales=0.0)  # Zero sales
 
         result = processing_stage.execute(context)
 
@@ -260,15 +226,9 @@ class TestErrorPropagation:
         error = result.unwrap_err()
         assert 'positive' in str(error).lower()
 
-    def test_propagate_negative_sales_error(self, processing_stage, sample_config, sample_labor_dto):
+    def test_propagate_negative_sales_error(self, processing_stage, make_context, sample_labor_dto):
         """Test propagation of negative sales error from calculator."""
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('labor_dto', sample_labor_dto)
-        context.set('sales', -1000.0)  # Negative sales
+        context = make_context(labor_dto=sample_labor_dto, sales=-1000.0)  # Negative sales
 
         result = processing_stage.execute(context)
 
@@ -276,7 +236,7 @@ class TestErrorPropagation:
         error = result.unwrap_err()
         assert 'positive' in str(error).lower()
 
-    def test_propagate_negative_labor_cost_error(self, processing_stage, sample_config):
+    def test_propagate_negative_labor_cost_error(self, processing_stage, make_context):
         """Test propagation of negative labor cost error."""
         labor_dto = LaborDTO(
             restaurant_code="SDR",
@@ -291,13 +251,7 @@ class TestErrorPropagation:
             average_hourly_rate=12.5
         )
 
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('labor_dto', labor_dto)
-        context.set('sales', 5000.0)
+        context = make_context(labor_dto=labor_dto, sales=5000.0)
 
         result = processing_stage.execute(context)
 
@@ -359,7 +313,7 @@ class TestContextIntegration:
 class TestCustomCalculator:
     """Test stage with custom calculator configuration."""
 
-    def test_custom_calculator_thresholds(self, sample_config, sample_labor_dto):
+    def test_custom_calculator_thresholds(self, make_context, sample_labor_dto):
         """Test stage with custom calculator thresholds."""
         custom_config = {
             'labor_excellent_threshold': 18.0,
@@ -368,13 +322,7 @@ class TestCustomCalculator:
         calculator = LaborCalculator(config=custom_config)
         stage = ProcessingStage(calculator)
 
-        context = PipelineContext(
-            restaurant_code="SDR",
-            date="2025-01-15",
-            config=sample_config
-        )
-        context.set('labor_dto', sample_labor_dto)
-        context.set('sales', 5000.0)  # 25% labor
+        context = make_context(labor_dto=sample_labor_dto, sales=5000.0)  # 25% labor
 
         result = stage.execute(context)
 
@@ -411,19 +359,13 @@ class TestPipelineStageProtocol:
         assert hasattr(processing_stage, 'execute')
         assert callable(processing_stage.execute)
 
-    def test_execute_accepts_context(self, processing_stage, context_with_data):
-        """Test execute accepts PipelineContext."""
-        # Should not raise
-        result = processing_stage.execute(context_with_data)
-        assert isinstance(result, Result)
-
     def test_execute_returns_result_context(self, processing_stage, context_with_data):
-        """Test execute returns Result[PipelineContext]."""
+        """Test execute accepts PipelineContext and returns Result[PipelineContext]."""
+        # Should not raise
         result = processing_stage.execute(context_with_data)
 
         assert isinstance(result, Result)
-        if result.is_ok():
-            assert isinstance(result.unwrap(), PipelineContext)
+        assert isinstance(result.unwrap(), PipelineContext)
 
     def test_can_use_in_pipeline_list(self, processing_stage):
         """Test stage can be used in pipeline stages list."""
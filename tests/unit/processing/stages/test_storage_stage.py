@@ -1,6 +1,9 @@
 """Tests for StorageStage"""
 
+import copy
+
 import pytest
+from typing import Any, Dict, NamedTuple
 from unittest.mock import Mock
 from pipeline.stages.storage_stage import StorageStage
 from pipeline.infrastructure.database.in_memory_client import InMemoryDatabaseClient
@@ -12,13 +15,99 @@ from pipeline.services.errors import StorageError
 from pipeline.services.result import Result
 
 
+# Result is a frozen dataclass, so common mock return values are shared
+_OK_TXN = Result.ok('txn_123')
+_OK_ONE_ROW = Result.ok(1)
+_OK_NONE = Result.ok(None)
+
+
+class StoredPattern(NamedTuple):
+    """Minimal learned pattern: StorageStage only calls to_dict()"""
+    pattern_id: str
+    restaurant_code: str
+    pattern_type: str
+    confidence: float
+    last_updated: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def _execute_ok(stage: StorageStage, context: PipelineContext) -> StorageResult:
+    """Run the stage, require success, and return the stored StorageResult"""
+    return stage.execute(context).expect("storage should succeed").get('storage_result')
+
+
+def _execute_err(stage: StorageStage, context: PipelineContext) -> Exception:
+    """Run the stage, require failure, and return the error"""
+    return stage.execute(context).expect_err("storage should fail")
+
+
+@pytest.fixture(scope="module")
+def ingestion_result():
+    """Create valid IngestionResult (frozen DTO, shared by the module)"""
+    result = IngestionResult.create(
+        restaurant_code='SDR',
+        business_date='2025-01-15',
+        quality_level=1,
+        toast_data_path='/tmp/sales.parquet',
+        employee_data_path='/tmp/labor.parquet'
+    )
+    return result.unwrap()
+
+
+@pytest.fixture(scope="module")
+def processing_result():
+    """Create valid ProcessingResult (frozen DTO, shared by the module)"""
+    result = ProcessingResult.create(
+        restaurant_code='SDR',
+        business_date='2025-01-15',
+        graded_timeslots_path='/tmp/graded_timeslots.parquet',
+        shift_assignments_path='/tmp/shift_assignments.parquet',
+        timeslot_count=2,
+        shift_summary={'morning': 1, 'evening': 1}
+    )
+    return result.unwrap()
+
+
+@pytest.fixture(scope="module")
+def second_ingestion_result():
+    """IngestionResult for a different restaurant/date (T12, 2025-01-16)"""
+    result = IngestionResult.create(
+        restaurant_code='T12',
+        business_date='2025-01-16',
+        quality_level=1,
+        toast_data_path='/tmp/sales2.parquet'
+    )
+    return result.unwrap()
+
+
+@pytest.fixture(scope="module")
+def context_template(ingestion_result):
+    """PipelineContext with valid ingestion result, built once per module"""
+    context = PipelineContext(
+        restaurant_code='SDR',
+        date='2025-01-15',
+        config={}
+    )
+    context.set('ingestion_result', ingestion_result)
+    return context
+
+
+@pytest.fixture(scope="module")
+def shared_database_client():
+    """One InMemoryDatabaseClient for the module (reset per test)"""
+    return InMemoryDatabaseClient()
+
+
 class TestStorageStage:
     """Test suite for StorageStage"""
 
     @pytest.fixture
-    def database_client(self):
-        """Create InMemoryDatabaseClient instance"""
-        return InMemoryDatabaseClient()
+    def database_client(self, shared_database_client):
+        """Empty InMemoryDatabaseClient (shared instance, cleared before each test)"""
+        shared_database_client.clear_all()
+        return shared_database_client
 
     @pytest.fixture
     def stage(self, database_client):
@@ -26,40 +115,9 @@ class TestStorageStage:
         return StorageStage(database_client)
 
     @pytest.fixture
-    def ingestion_result(self):
-        """Create valid IngestionResult"""
-        result = IngestionResult.create(
-            restaurant_code='SDR',
-            business_date='2025-01-15',
-            quality_level=1,
-            toast_data_path='/tmp/sales.parquet',
-            employee_data_path='/tmp/labor.parquet'
-        )
-        return result.unwrap()
-
-    @pytest.fixture
-    def processing_result(self):
-        """Create valid ProcessingResult"""
-        result = ProcessingResult.create(
-            restaurant_code='SDR',
-            business_date='2025-01-15',
-            graded_timeslots_path='/tmp/graded_timeslots.parquet',
-            shift_assignments_path='/tmp/shift_assignments.parquet',
-            timeslot_count=2,
-            shift_summary={'morning': 1, 'evening': 1}
-        )
-        return result.unwrap()
-
-    @pytest.fixture
-    def valid_context(self, ingestion_result):
-        """Create PipelineContext with valid ingestion result"""
-        context = PipelineContext(
-            restaurant_code='SDR',
-            date='2025-01-15',
-            config={}
-        )
-        context.set('ingestion_result', ingestion_result)
-        return context
+    def valid_context(self, context_template):
+        """Independent copy of the template (tests may set extra keys)"""
+        return copy.copy(context_template)
 
     # Initialization tests
 
@@ -78,14 +136,12 @@ class TestStorageStage:
 
     def test_execute_success_ingestion_only(self, stage, database_client, valid_context):
         """Test successful execution with ingestion data only"""
-        result = stage.execute(valid_context)
+        # Shared DTOs must not carry database state between tests
+        assert database_client.get_row_count('daily_performance') == 0
 
-        assert result.is_ok()
-        context = result.unwrap()
+        storage_result = _execute_ok(stage, valid_context)
 
         # Check storage result is in context
-        assert context.has('storage_result')
-        storage_result = context.get('storage_result')
         assert isinstance(storage_result, StorageResult)
         assert storage_result.success is True
 
@@ -101,12 +157,7 @@ class TestStorageStage:
         """Test successful execution with processing data"""
         valid_context.set('processing_result', processing_result)
 
-        result = stage.execute(valid_context)
-
-        assert result.is_ok()
-        context = result.unwrap()
-
-        storage_result = context.get('storage_result')
+        storage_result = _execute_ok(stage, valid_context)
         assert storage_result.success is True
 
         # Check all tables written
@@ -123,51 +174,21 @@ class TestStorageStage:
 
     def test_execute_with_learned_patterns(self, stage, database_client, valid_context):
         """Test execution with learned patterns"""
-        # Create mock patterns with to_dict() method for database storage
-        mock_pattern_1 = Mock()
-        mock_pattern_1.pattern_id = 'pattern_1'
-        mock_pattern_1.restaurant_code = 'SDR'
-        mock_pattern_1.pattern_type = 'rush_hour'
-        mock_pattern_1.confidence = 0.95
-        mock_pattern_1.last_updated = '2025-01-15T12:00:00'
-        mock_pattern_1.to_dict.return_value = {
-            'pattern_id': 'pattern_1',
-            'restaurant_code': 'SDR',
-            'pattern_type': 'rush_hour',
-            'confidence': 0.95,
-            'last_updated': '2025-01-15T12:00:00'
-        }
-
-        mock_pattern_2 = Mock()
-        mock_pattern_2.pattern_id = 'pattern_2'
-        mock_pattern_2.restaurant_code = 'SDR'
-        mock_pattern_2.pattern_type = 'slow_period'
-        mock_pattern_2.confidence = 0.88
-        mock_pattern_2.last_updated = '2025-01-15T14:00:00'
-        mock_pattern_2.to_dict.return_value = {
-            'pattern_id': 'pattern_2',
-            'restaurant_code': 'SDR',
-            'pattern_type': 'slow_period',
-            'confidence': 0.88,
-            'last_updated': '2025-01-15T14:00:00'
-        }
-
-        valid_context.set('learned_patterns', [mock_pattern_1, mock_pattern_2])
-
-        result = stage.execute(valid_context)
+        patterns = [
+            StoredPattern('pattern_1', 'SDR', 'rush_hour', 0.95, '2025-01-15T12:00:00'),
+            StoredPattern('pattern_2', 'SDR', 'slow_period', 0.88, '2025-01-15T14:00:00'),
+        ]
+        valid_context.set('learned_patterns', patterns)
 
-        assert result.is_ok()
-        context = result.unwrap()
-
-        storage_result = context.get('storage_result')
+        storage_result = _execute_ok(stage, valid_context)
         assert 'learned_patterns' in storage_result.tables_written
         assert storage_result.row_counts['learned_patterns'] == 2
 
         # Verify database state
         assert database_client.get_row_count('learned_patterns') == 2
-        patterns = database_client.get_table_data('learned_patterns')
-        assert patterns[0]['pattern_id'] == 'pattern_1'
-        assert patterns[1]['pattern_id'] == 'pattern_2'
+        rows = database_client.get_table_data('learned_patterns')
+        assert rows[0]['pattern_id'] == 'pattern_1'
+        assert rows[1]['pattern_id'] == 'pattern_2'
 
     def test_execute_all_data_types(
         self, stage, database_client, valid_context, processing_result
@@ -175,26 +196,11 @@ class TestStorageStage:
         """Test execution with all data types (ingestion + processing + patterns)"""
         valid_context.set('processing_result', processing_result)
 
-        mock_pattern = Mock()
-        mock_pattern.pattern_id = 'pattern_1'
-        mock_pattern.restaurant_code = 'SDR'
-        mock_pattern.pattern_type = 'test'
-        mock_pattern.confidence = 0.9
-        mock_pattern.last_updated = '2025-01-15T12:00:00'
-        mock_pattern.to_dict.return_value = {
-            'pattern_id': 'pattern_1',
-            'restaurant_code': 'SDR',
-            'pattern_type': 'test',
-            'confidence': 0.9,
-            'last_updated': '2025-01-15T12:00:00'
-        }
-
-        valid_context.set('learned_patterns', [mock_pattern])
-
-        result = stage.execute(valid_context)
+        valid_context.set('learned_patterns', [
+            StoredPattern('pattern_1', 'SDR', 'test', 0.9, '2025-01-15T12:00:00')
+        ])
 
-        assert result.is_ok()
-        storage_result = result.unwrap().get('storage_result')
+        storage_result = _execute_ok(stage, valid_context)
 
         # Check all tables written
         assert len(storage_result.tables_written) == 3
@@ -207,46 +213,30 @@ class TestStorageStage:
 
     # Missing context tests
 
-    def test_execute_missing_ingestion_result(self, stage):
-        """Test error when ingestion_result is missing"""
+    @pytest.mark.parametrize("state, expected_context", [
+        pytest.param({}, {'available_keys': []}, id="missing"),
+        pytest.param({'ingestion_result': 'not_a_dto'}, {'actual_type': 'str'}, id="wrong_type"),
+    ])
+    def test_execute_bad_ingestion_result(self, stage, state, expected_context):
+        """Test error when ingestion_result is missing or has the wrong type"""
         context = PipelineContext(
             restaurant_code='SDR',
             date='2025-01-15',
             config={}
         )
-        # Don't set ingestion_result
-
-        result = stage.execute(context)
+        for key, value in state.items():
+            context.set(key, value)
 
-        assert result.is_err()
-        error = result.unwrap_err()
+        error = _execute_err(stage, context)
         assert isinstance(error, StorageError)
-        assert 'ingestion_result' in str(error).lower()
-
-    def test_execute_invalid_ingestion_result_type(self, stage):
-        """Test error when ingestion_result has wrong type"""
-        context = PipelineContext(
-            restaurant_code='SDR',
-            date='2025-01-15',
-            config={}
-        )
-        context.set('ingestion_result', 'not_a_dto')
-
-        result = stage.execute(context)
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert isinstance(error, StorageError)
-        assert 'invalid type' in str(error).lower()
+        assert "'ingestion_result'" in error.message
+        assert error.context == expected_context
 
     # Transaction tests
 
     def test_transaction_commit_on_success(self, stage, database_client, valid_context):
         """Test that transaction is committed on success"""
-        result = stage.execute(valid_context)
-
-        assert result.is_ok()
-        storage_result = result.unwrap().get('storage_result')
+        storage_result = _execute_ok(stage, valid_context)
 
         # Transaction should be completed (not in active transactions)
         assert storage_result.transaction_id not in database_client.active_transactions
@@ -254,97 +244,55 @@ class TestStorageStage:
         # Data should be persisted
         assert database_client.get_row_count('daily_performance') == 1
 
-    def test_transaction_rollback_on_error(self, stage, valid_context):
-        """Test that transaction is rolled back on error"""
-        # Create mock client that fails on insert
-        mock_client = Mock()
-        mock_client.begin_transaction.return_value = Result.ok('txn_123')
-        mock_client.insert.return_value = Result.fail(
-            StorageError("Insert failed")
-        )
-        mock_client.rollback_transaction.return_value = Result.ok(None)
-
-        stage.database_client = mock_client
-
-        result = stage.execute(valid_context)
-
-        assert result.is_err()
-        # Rollback should have been called
-        mock_client.rollback_transaction.assert_called_once_with('txn_123')
-
-    def test_begin_transaction_failure(self, stage, valid_context):
-        """Test error when begin_transaction fails"""
-        mock_client = Mock()
-        mock_client.begin_transaction.return_value = Result.fail(
-            StorageError("Failed to begin transaction")
-        )
-
-        stage.database_client = mock_client
-
-        result = stage.execute(valid_context)
-
-        assert result.is_err()
-        error = result.unwrap_err()
-        assert isinstance(error, StorageError)
-
-    def test_commit_transaction_failure(self, stage, valid_context):
-        """Test error when commit_transaction fails"""
-        mock_client = Mock()
-        mock_client.begin_transaction.return_value = Result.ok('txn_123')
-        mock_client.insert.return_value = Result.ok(1)
-        mock_client.commit_transaction.return_value = Result.fail(
-            StorageError("Commit failed")
-        )
-        mock_client.rollback_transaction.return_value = Result.ok(None)
-
-        stage.database_client = mock_client
-
-        result = stage.execute(valid_context)
-
-        assert result.is_err()
-        # Rollback should be attempted after commit failure
-        mock_client.rollback_transaction.assert_called_once_with('txn_123')
-
     # Database error tests
 
-    def test_insert_failure_ingestion_data(self, stage, valid_context):
-        """Test error when inserting ingestion data fails"""
-        mock_client = Mock()
-        mock_client.begin_transaction.return_value = Result.ok('txn_123')
-        mock_client.insert.return_value = Result.fail(
-            StorageError("Insert failed")
-        )
-        mock_client.rollback_transaction.return_value = Result.ok(None)
-
-        stage.database_client = mock_client
-
-        result = stage.execute(valid_context)
-
-        assert result.is_err()
-        mock_client.rollback_transaction.assert_called_once()
-
-    def test_insert_failure_processing_data(
-        self, stage, valid_context, processing_result
+    @pytest.mark.parametrize(
+        "with_processing, begin_result, insert_results, commit_result, expect_rollback",
+        [
+            pytest.param(
+                False, Result.fail(StorageError("Failed to begin transaction")),
+                [], None, False,
+                id="begin_fail",
+            ),
+            pytest.param(
+                False, _OK_TXN,
+                [Result.fail(StorageError("Insert failed"))], None, True,
+                id="ingestion_insert_fail",
+            ),
+            pytest.param(
+                True, _OK_TXN,
+                [_OK_ONE_ROW, Result.fail(StorageError("Insert failed"))], None, True,
+                id="processing_insert_fail",
+            ),
+            pytest.param(
+                False, _OK_TXN,
+                [_OK_ONE_ROW], Result.fail(StorageError("Commit failed")), True,
+                id="commit_fail",
+            ),
+        ],
+    )
+    def test_database_failure_rolls_back(
+        self, stage, valid_context, processing_result,
+        with_processing, begin_result, insert_results, commit_result, expect_rollback
     ):
-        """Test error when inserting processing data fails"""
-        valid_context.set('processing_result', processing_result)
+        """Test each database failure fails the stage and rolls back an open transaction"""
+        if with_processing:
+            valid_context.set('processing_result', processing_result)
 
-        mock_client = Mock()
-        mock_client.begin_transaction.return_value = Result.ok('txn_123')
-        # First insert (ingestion) succeeds
-        mock_client.insert.return_value = Result.ok(1)
-        # Second insert (processing) fails
-        mock_client.insert_many.return_value = Result.fail(
-            StorageError("Insert many failed")
-        )
-        mock_client.rollback_transaction.return_value = Result.ok(None)
+        mock_client = Mock(spec_set=InMemoryDatabaseClient, **{
+            'begin_transaction.return_value': begin_result,
+            'insert.side_effect': insert_results,
+            'commit_transaction.return_value': commit_result,
+            'rollback_transaction.return_value': _OK_NONE,
+        })
 
         stage.database_client = mock_client
 
-        result = stage.execute(valid_context)
-
-        assert result.is_err()
-        mock_client.rollback_transaction.assert_called_once()
+        assert isinstance(_execute_err(stage, valid_context), StorageError)
+        if expect_rollback:
+            mock_client.rollback_transaction.assert_called_once_with('txn_123')
+        else:
+            mock_client.rollback_transaction.assert_not_called()
 
     # Edge cases
 
@@ -352,10 +300,7 @@ class TestStorageStage:
         """Test execution with empty learned_patterns list"""
         valid_context.set('learned_patterns', [])
 
-        result = stage.execute(valid_context)
-
-        assert result.is_ok()
-        storage_result = result.unwrap().get('storage_result')
+        storage_result = _execute_ok(stage, valid_context)
 
         # Learned patterns should not be in tables_written
         assert 'learned_patterns' not in storage_result.tables_written
@@ -373,10 +318,7 @@ class TestStorageStage:
 
         valid_context.set('processing_result', minimal_processing_result)
 
-        result = stage.execute(valid_context)
-
-        assert result.is_ok()
-        storage_result = result.unwrap().get('storage_result')
+        storage_result = _execute_ok(stage, valid_context)
 
         # Both ingestion and processing summary should be written
         assert len(storage_result.tables_written) == 2
@@ -384,7 +326,7 @@ class TestStorageStage:
         assert 'processing_summary' in storage_result.tables_written
 
     def test_multiple_executions_same_stage(
-        self, stage, database_client, ingestion_result
+        self, stage, database_client, ingestion_result, second_ingestion_result
     ):
         """Test multiple executions with same stage instance"""
         # First execution
@@ -395,36 +337,24 @@ class TestStorageStage:
         )
         context1.set('ingestion_result', ingestion_result)
 
-        result1 = stage.execute(context1)
-        assert result1.is_ok()
+        _execute_ok(stage, context1)
 
         # Second execution (different context)
-        ingestion_result2 = IngestionResult.create(
-            restaurant_code='T12',
-            business_date='2025-01-16',
-            quality_level=1,
-            toast_data_path='/tmp/sales2.parquet'
-        ).unwrap()
-
         context2 = PipelineContext(
             restaurant_code='T12',
             date='2025-01-16',
             config={}
         )
-        context2.set('ingestion_result', ingestion_result2)
+        context2.set('ingestion_result', second_ingestion_result)
 
-        result2 = stage.execute(context2)
-        assert result2.is_ok()
+        _execute_ok(stage, context2)
 
         # Both should be in database
         assert database_client.get_row_count('daily_performance') == 2
 
     def test_storage_result_metadata(self, stage, valid_context):
         """Test StorageResult contains correct metadata"""
-        result = stage.execute(valid_context)
-
-        assert result.is_ok()
-        storage_result = result.unwrap().get('storage_result')
+        storage_result = _execute_ok(stage, valid_context)
 
         # Check DTO fields
         assert storage_result.restaurant_code == 'SDR'
@@ -459,9 +389,8 @@ class TestStorageStage:
         context.set('existing_key', 'existing_value')
         # Missing ingestion_result will cause error
 
-        result = stage.execute(context)
+        _execute_err(stage, context)
 
-        assert result.is_err()
         # storage_result should not be added
         assert not context.has('storage_result')
         # Existing data preserved
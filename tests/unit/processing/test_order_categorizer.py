@@ -12,57 +12,76 @@ from pathlib import Path
 from pipeline.services.order_categorizer import OrderCategorizer
 
 
-class TestOrderCategorizer:
-    """Test OrderCategorizer filter cascade logic."""
-
-    @pytest.fixture
-    def categorizer(self):
-        """Create OrderCategorizer with default config."""
-        return OrderCategorizer()
-
-    @pytest.fixture
-    def sample_kitchen_df(self):
-        """Create sample Kitchen Details DataFrame."""
-        return pd.DataFrame([
-            {'Check #': '1001', 'Table': 15, 'Fulfillment Time': 12.5, 'Server': 'Smith, John'},
-            {'Check #': '1002', 'Table': None, 'Fulfillment Time': 5.2, 'Server': 'Doe, Jane'},
-            {'Check #': '1003', 'Table': 8, 'Fulfillment Time': 18.0, 'Server': 'Brown, Alice'},
-            {'Check #': '1004', 'Table': None, 'Fulfillment Time': 3.5, 'Server': 'White, Bob'},
-            {'Check #': '1005', 'Table': 0, 'Fulfillment Time': 11.0, 'Server': 'Green, Carol'}
-        ])
+# Column layouts for the sample frames, which are built from row tuples
+# rather than one dict per row
+_KITCHEN_COLUMNS = ('Check #', 'Table', 'Fulfillment Time', 'Server')
+_EOD_COLUMNS = ('Check #', 'Table', 'Cash Drawer')
+_ORDER_DETAILS_COLUMNS = ('Order #', 'Table', 'Duration (Opened to Paid)', 'Server')
+_TIME_ENTRIES_COLUMNS = ('Employee', 'Job Title')
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+# Module-scoped: the categorizer holds no per-call state and no test (or
+# categorizer method) mutates the sample DataFrames.
+
+@pytest.fixture(scope="module")
+def categorizer():
+    """Create OrderCategorizer with default config."""
+    return OrderCategorizer()
+
+
+@pytest.fixture(scope="module")
+def sample_kitchen_df():
+    """Create sample Kitchen Details DataFrame."""
+    return pd.DataFrame.from_records([
+        ('1001', 15, 12.5, 'Smith, John'),
+        ('1002', None, 5.2, 'Doe, Jane'),
+        ('1003', 8, 18.0, 'Brown, Alice'),
+        ('1004', None, 3.5, 'White, Bob'),
+        ('1005', 0, 11.0, 'Green, Carol')
+    ], columns=_KITCHEN_COLUMNS)
+
+
+@pytest.fixture(scope="module")
+def sample_eod_df():
+    """Create sample EOD DataFrame."""
+    return pd.DataFrame.from_records([
+        ('1001', 15, 'Register 1'),
+        ('1002', None, 'Drive Box 1'),
+        ('1003', 8, 'Register 2'),
+        ('1004', None, 'Register 3'),
+        ('1005', None, 'ToGo Counter')
+    ], columns=_EOD_COLUMNS)
+
+
+@pytest.fixture(scope="module")
+def sample_order_details_df():
+    """Create sample OrderDetails DataFrame."""
+    return pd.DataFrame.from_records([
+        ('1001', 15, '25:30', 'Smith, John'),
+        ('1002', None, '6:15', 'Doe, Jane'),
+        ('1003', 8, '32:00', 'Brown, Alice'),
+        ('1004', None, '4:30', 'White, Bob'),
+        ('1005', None, '15:00', 'Green, Carol')
+    ], columns=_ORDER_DETAILS_COLUMNS)
+
+
+@pytest.fixture(scope="module")
+def sample_time_entries_df():
+    """Create sample TimeEntries DataFrame."""
+    return pd.DataFrame.from_records([
+        ('John Smith', 'Server'),
+        ('Jane Doe', 'Drive-Thru Operator'),
+        ('Alice Brown', 'Server'),
+        ('Bob White', 'Cashier'),
+        ('Carol Green', 'Cook')
+    ], columns=_TIME_ENTRIES_COLUMNS)
 
-    @pytest.fixture
-    def sample_eod_df(self):
-        """Create sample EOD DataFrame."""
-        return pd.DataFrame([
-            {'Check #': '1001', 'Table': 15, 'Cash Drawer': 'Register 1'},
-            {'Check #': '1002', 'Table': None, 'Cash Drawer': 'Drive Box 1'},
-            {'Check #': '1003', 'Table': 8, 'Cash Drawer': 'Register 2'},
-            {'Check #': '1004', 'Table': None, 'Cash Drawer': 'Register 3'},
-            {'Check #': '1005', 'Table': None, 'Cash Drawer': 'ToGo Counter'}
-        ])
-
-    @pytest.fixture
-    def sample_order_details_df(self):
-        """Create sample OrderDetails DataFrame."""
-        return pd.DataFrame([
-            {'Order #': '1001', 'Table': 15, 'Duration (Opened to Paid)': '25:30', 'Server': 'Smith, John'},
-            {'Order #': '1002', 'Table': None, 'Duration (Opened to Paid)': '6:15', 'Server': 'Doe, Jane'},
-            {'Order #': '1003', 'Table': 8, 'Duration (Opened to Paid)': '32:00', 'Server': 'Brown, Alice'},
-            {'Order #': '1004', 'Table': None, 'Duration (Opened to Paid)': '4:30', 'Server': 'White, Bob'},
-            {'Order #': '1005', 'Table': None, 'Duration (Opened to Paid)': '15:00', 'Server': 'Green, Carol'}
-        ])
 
-    @pytest.fixture
-    def sample_time_entries_df(self):
-        """Create sample TimeEntries DataFrame."""
-        return pd.DataFrame([
-            {'Employee': 'John Smith', 'Job Title': 'Server'},
-            {'Employee': 'Jane Doe', 'Job Title': 'Drive-Thru Operator'},
-            {'Employee': 'Alice Brown', 'Job Title': 'Server'},
-            {'Employee': 'Bob White', 'Job Title': 'Cashier'},
-            {'Employee': 'Carol Green', 'Job Title': 'Cook'}
-        ])
+class TestOrderCategorizer:
+    """Test OrderCategorizer filter cascade logic."""
 
     # ========================================================================
     # FILTER 1: LOBBY DETECTION TESTS
@@ -253,12 +272,31 @@ class TestOrderCategorizer:
         assert categorizer._parse_duration_string("12.5") == pytest.approx(12.5, rel=0.01)
         assert categorizer._parse_duration_string("7") == pytest.approx(7.0, rel=0.01)
 
+    def test_parse_duration_numeric(self, categorizer):
+        """Test: Numbers pass straight through, NaN returns 0"""
+        assert categorizer._parse_duration_string(7) == 7.0
+        assert categorizer._parse_duration_string(12.5) == 12.5
+        assert categorizer._parse_duration_string(float('nan')) == 0.0
+
     def test_parse_duration_none(self, categorizer):
         """Test: Parse None/NaN returns 0"""
         assert categorizer._parse_duration_string(None) == 0.0
         assert categorizer._parse_duration_string(pd.NA) == 0.0
         assert categorizer._parse_duration_string("") == 0.0
 
+    def test_parse_duration_series_matches_scalar(self, categorizer):
+        """Test: Column parse agrees with per-value parse across mixed formats"""
+        durations = pd.Series(
+            ["5:30", "1:23:30", "3 minutes and 45 seconds", "30 seconds", "12.5", 7, None, pd.NA, "", "abc"],
+            dtype=object
+        )
+
+        parsed = categorizer._parse_duration_series(durations)
+
+        assert parsed.tolist() == pytest.approx(
+            [categorizer._parse_duration_string(value) for value in durations]
+        )
+
     # ========================================================================
     # BATCH CATEGORIZATION TESTS
     # ========================================================================
@@ -282,6 +320,17 @@ class TestOrderCategorizer:
         assert categorizations['1003'] == "Lobby"       # Table + long duration
         assert categorizations['1005'] == "ToGo"        # Default
 
+    def test_categorize_all_orders_shares_labels(self, categorizer, sample_kitchen_df, sample_eod_df, sample_order_details_df):
+        """Test: Mapping values reuse one str object per category"""
+        categorizations = categorizer.categorize_all_orders(
+            sample_kitchen_df,
+            sample_eod_df,
+            sample_order_details_df
+        ).unwrap()
+
+        assert type(categorizations['1001']) is str
+        assert categorizations['1001'] is categorizations['1003']
+
     def test_categorize_only_fulfilled_orders(self, categorizer):
         """Test: Only categorize orders with kitchen entries"""
         kitchen_df = pd.DataFrame([
@@ -309,6 +358,62 @@ class TestOrderCategorizer:
         assert '5002' in categorizations
         assert '5003' not in categorizations  # No kitchen entry = not fulfilled
 
+    def test_categorize_duplicate_rows_use_first(self, categorizer):
+        """Test: Duplicate check rows resolve to the first row, as single-order lookup does"""
+        kitchen_df = pd.DataFrame([
+            {'Check #': '6001', 'Table': None, 'Fulfillment Time': 12.0, 'Server': 'Test'},
+            {'Check #': '6001', 'Table': None, 'Fulfillment Time': 3.0, 'Server': 'Test'}
+        ])
+        eod_df = pd.DataFrame([
+            {'Check #': '6001', 'Table': None, 'Cash Drawer': 'Register 1'},
+            {'Check #': '6001', 'Table': None, 'Cash Drawer': 'Drive Box 1'}
+        ])
+        order_df = pd.DataFrame([
+            {'Order #': '6001', 'Table': None, 'Duration (Opened to Paid)': '15:00'},
+            {'Order #': '6001', 'Table': None, 'Duration (Opened to Paid)': '2:00'}
+        ])
+
+        batch = categorizer.categorize_all_orders(kitchen_df, eod_df, order_df).unwrap()
+        single = categorizer.categorize_order('6001', kitchen_df, eod_df, order_df).unwrap()
+
+        assert batch == {'6001': 'ToGo'}
+        assert single == 'ToGo'
+
+    def test_categorize_malformed_row_defaults_to_togo(self, categorizer, caplog):
+        """Test: A row with an unreadable value is logged and defaults to ToGo; other checks still categorize"""
+        kitchen_df = pd.DataFrame([
+            {'Check #': '7001', 'Table': [5, 5], 'Fulfillment Time': 12.0, 'Server': 'Test'},  # malformed
+            {'Check #': '7002', 'Table': 4, 'Fulfillment Time': 12.0, 'Server': 'Test'},
+            {'Check #': '7003', 'Table': None, 'Fulfillment Time': 3.0, 'Server': 'Test'}
+        ])
+        eod_df = pd.DataFrame([
+            {'Check #': '7001', 'Table': 5, 'Cash Drawer': 'Register 1'},
+            {'Check #': '7002', 'Table': 4, 'Cash Drawer': 'Register 1'},
+            {'Check #': '7003', 'Table': None, 'Cash Drawer': 'Register 2'}
+        ])
+        order_df = pd.DataFrame([
+            {'Order #': '7001', 'Table': 5, 'Duration (Opened to Paid)': '15:00'},
+            {'Order #': '7002', 'Table': 4, 'Duration (Opened to Paid)': '15:00'},
+            {'Order #': '7003', 'Table': None, 'Duration (Opened to Paid)': '4:00'}
+        ])
+
+        result = categorizer.categorize_all_orders(kitchen_df, eod_df, order_df)
+
+        assert result.is_ok()
+        assert result.unwrap() == {'7001': 'ToGo', '7002': 'Lobby', '7003': 'Drive-Thru'}
+        assert 'order_categorization_failed' in caplog.text
+        # The single-order API reports the same row as an error
+        assert categorizer.categorize_order('7001', kitchen_df, eod_df, order_df).is_err()
+
+    def test_categorize_order_matches_batch(self, categorizer, sample_kitchen_df, sample_eod_df, sample_order_details_df, sample_time_entries_df):
+        """Test: The scalar single-order path agrees with the batch path on every check"""
+        frames = (sample_kitchen_df, sample_eod_df, sample_order_details_df, sample_time_entries_df)
+
+        batch = categorizer.categorize_all_orders(*frames).unwrap()
+
+        for check_number, category in batch.items():
+            assert categorizer.categorize_order(check_number, *frames).unwrap() == category
+
     def test_categorize_distribution_logging(self, categorizer, sample_kitchen_df, sample_eod_df, sample_order_details_df, caplog):
         """Test: Verify distribution logging works"""
         result = categorizer.categorize_all_orders(
@@ -338,6 +443,16 @@ class TestOrderCategorizer:
         assert categorizer.lobby_table_threshold == 3
         assert categorizer.drive_thru_time_kitchen_max == 5
 
+    def test_string_thresholds_coerced(self):
+        """Test: Thresholds from string config values are stored as numbers"""
+        categorizer = OrderCategorizer(config={
+            'lobby_table_threshold': '3',
+            'drive_thru_time_kitchen_max': '5.5'
+        })
+
+        assert categorizer.lobby_table_threshold == 3
+        assert categorizer.drive_thru_time_kitchen_max == 5.5
+
     # ========================================================================
     # HELPER METHOD TESTS
     # ========================================================================
@@ -353,6 +468,24 @@ class TestOrderCategorizer:
         assert categorizer._safe_float("") is None
         assert categorizer._safe_float("invalid") is None
 
+    def test_safe_float_series_matches_scalar(self, categorizer):
+        """Test: _safe_float_series agrees with _safe_float, NaN for None"""
+        values = pd.Series([15, 15.5, "23", " 23.7 ", None, pd.NA, "", "invalid"], dtype=object)
+
+        parsed = categorizer._safe_float_series(values)
+
+        assert parsed.dtype == float
+        expected = [categorizer._safe_float(value) for value in values]
+        assert parsed.tolist()[:4] == expected[:4]
+        assert parsed.isna().tolist()[4:] == [value is None for value in expected[4:]]
+
+    def test_safe_float_series_complex_cell(self, categorizer):
+        """Test: A complex cell reads as NaN without corrupting the rest of the column"""
+        parsed = categorizer._safe_float_series(pd.Series(['3', 1 + 2j, 4], dtype=object))
+
+        assert parsed.tolist()[::2] == [3.0, 4.0]
+        assert pd.isna(parsed[1])
+
     def test_employee_position_lookup(self, categorizer, sample_time_entries_df):
         """Test: _lookup_employee_position handles name variations"""
         # "Last, First" format
@@ -370,3 +503,33 @@ class TestOrderCategorizer:
         # No match
         position = categorizer._lookup_employee_position("Unknown Person", sample_time_entries_df)
         assert position == ""
+
+    def test_employee_position_prefers_whole_name_match(self, categorizer):
+        """Test: A whole-token match wins over an earlier substring-only match"""
+        time_entries_df = pd.DataFrame([
+            {'Employee': 'Amy Johnson', 'Job Title': 'Cook'},
+            {'Employee': 'John Smith', 'Job Title': 'Server'}
+        ])
+
+        assert categorizer._build_position_index(time_entries_df)['john'] == 'server'
+        assert categorizer._lookup_employee_position("John", time_entries_df) == "server"
+        # Substring-only names still fall back to the scan
+        assert categorizer._lookup_employee_position("Johns", time_entries_df) == "cook"
+
+    def test_position_index_built_once_per_batch(self, categorizer, sample_kitchen_df, sample_eod_df, sample_order_details_df, sample_time_entries_df, monkeypatch):
+        """Test: A batch builds one position index and keeps none on the categorizer"""
+        calls = []
+        build = OrderCategorizer._build_position_index
+
+        def counting_build(time_entries_df):
+            calls.append(time_entries_df)
+            return build(time_entries_df)
+
+        monkeypatch.setattr(OrderCategorizer, '_build_position_index', staticmethod(counting_build))
+
+        categorizer.categorize_all_orders(
+            sample_kitchen_df, sample_eod_df, sample_order_details_df, sample_time_entries_df
+        ).unwrap()
+
+        assert len(calls) == 1
+        assert not hasattr(categorizer, '_position_index')